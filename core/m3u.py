@@ -1,24 +1,85 @@
 from __future__ import annotations
 
-import re
+import mmap
 from pathlib import Path
-from typing import List
+from typing import IO, Iterable, Iterator, List
 
 from .models import Channel
 
 # Parsing/écriture minimalistes pour les playlists M3U (EXTINF + URL).
 
-EXTINF_NAME_RE = re.compile(r",\s*(.*)$")
-ATTR_RE = re.compile(r'(\w[\w\-]*)="([^"]*)"')
 EXTVLCOPT_PREFIX = "#EXTVLCOPT:"
 
 
+def _attr_value(extinf: str, key: str) -> str:
+    """
+    Valeur de l'attribut `key="..."` (dernière occurrence, comme un dict des attributs), trouvée par
+    str.rfind/find: seuls les deux attributs utiles sont lus, sans tokeniser tvg-logo, tvg-name...
+    """
+    needle = key + '="'
+    pos = extinf.rfind(needle)
+    while pos >= 0:
+        prev = extinf[pos - 1] if pos else " "
+        # "x-tvg-id" n'est pas "tvg-id": le nom doit commencer l'attribut.
+        if not (prev.isalnum() or prev in "_-"):
+            start = pos + len(needle)
+            end = extinf.find('"', start)
+            if end >= 0:
+                return extinf[start:end]
+        pos = extinf.rfind(needle, 0, pos)
+    return ""
+
+
 def parse_extinf(extinf: str) -> dict:
     """Extrait nom + attributs connus (groupe, tvg-id) depuis une ligne #EXTINF."""
-    attrs = dict(ATTR_RE.findall(extinf))
-    m = EXTINF_NAME_RE.search(extinf)
-    name = (m.group(1).strip() if m else "").strip()
-    return {"name": name, "group": attrs.get("group-title", ""), "tvg_id": attrs.get("tvg-id", "")}
+    comma = extinf.find(",")
+    name = extinf[comma + 1:].strip() if comma >= 0 else ""
+    return {"name": name, "group": _attr_value(extinf, "group-title"), "tvg_id": _attr_value(extinf, "tvg-id")}
+
+
+def parse_m3u_iter(lines: Iterable[str]) -> Iterator[Channel]:
+    """
+    Variante incrémentale de parse_m3u: consomme les lignes au fil de l'eau (ex: flux HTTP)
+    et produit chaque Channel dès que son URL est lue.
+    Supporte les options VLC via des lignes `#EXTVLCOPT:...` entre `#EXTINF` et l'URL.
+    """
+    extinf = None
+    vlc_opts: list[str] = []
+    for raw in lines:
+        line = raw.strip()
+        if not line:
+            continue
+        if extinf is None:
+            if line.startswith("#EXTINF"):
+                extinf = line
+                vlc_opts = []
+            continue
+
+        # La ligne URL n'est pas forcément juste après EXTINF (peut y avoir EXTVLCOPT, etc.).
+        if line.startswith("#"):
+            if line.upper().startswith(EXTVLCOPT_PREFIX):
+                opt = line.split(":", 1)[1].strip()
+                if opt:
+                    vlc_opts.append(opt)
+            continue
+
+        yield _make_channel(extinf, line, vlc_opts)
+        extinf = None
+
+    if extinf is not None:
+        yield _make_channel(extinf, "", vlc_opts)
+
+
+def _make_channel(extinf: str, url: str, vlc_opts: list[str]) -> Channel:
+    meta = parse_extinf(extinf)
+    return Channel(
+        extinf=extinf,
+        url=url,
+        name=meta["name"],
+        group=meta["group"],
+        tvg_id=meta["tvg_id"],
+        vlc_opts=vlc_opts,
+    )
 
 
 def parse_m3u(text: str) -> List[Channel]:
@@ -26,52 +87,47 @@ def parse_m3u(text: str) -> List[Channel]:
     Convertit le texte M3U en objets Channel.
     Supporte les options VLC via des lignes `#EXTVLCOPT:...` entre `#EXTINF` et l'URL.
     """
-    lines = [l.strip() for l in text.splitlines() if l.strip()]
-    out: List[Channel] = []
-    i = 0
-    while i < len(lines):
-        if lines[i].startswith("#EXTINF"):
-            extinf = lines[i]
-
-            vlc_opts: list[str] = []
-            url = ""
-
-            # La ligne URL n'est pas forcément juste après EXTINF (peut y avoir EXTVLCOPT, etc.).
-            j = i + 1
-            while j < len(lines) and lines[j].startswith("#"):
-                if lines[j].upper().startswith(EXTVLCOPT_PREFIX):
-                    opt = lines[j].split(":", 1)[1].strip()
-                    if opt:
-                        vlc_opts.append(opt)
-                j += 1
-
-            if j < len(lines) and not lines[j].startswith("#"):
-                url = lines[j]
-                j += 1
-            meta = parse_extinf(extinf)
-            out.append(Channel(
-                extinf=extinf,
-                url=url,
-                name=meta["name"],
-                group=meta["group"],
-                tvg_id=meta["tvg_id"],
-                vlc_opts=vlc_opts,
-            ))
-            i = j
+    return list(parse_m3u_iter(text.splitlines()))
+
+
+def _iter_file_lines(mm: mmap.mmap) -> Iterator[str]:
+    # Découpe aux \n (readline C) puis splitlines() sur chaque ligne: mêmes coupures que text.splitlines()
+    for raw in iter(mm.readline, b""):
+        yield from raw.decode("utf-8", errors="ignore").splitlines()
+
+
+def parse_m3u_file(path: str | Path) -> List[Channel]:
+    """
+    Parse une playlist depuis le disque via mmap: les pages du fichier sont lues à la demande
+    et seules les lignes en cours sont décodées (pas de str géant pour tout le fichier).
+    """
+    with open(path, "rb") as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # fichier vide
+            return []
+        with mm:
+            return list(parse_m3u_iter(_iter_file_lines(mm)))
+
+
+def write_m3u_stream(channels: Iterable[Channel], f: IO[str]) -> int:
+    """Écrit la playlist dans un flux texte ouvert, une écriture par chaîne. Retourne le nombre de chaînes écrites."""
+    write = f.write
+    write("#EXTM3U\n")
+    written = 0
+    for ch in channels:
+        if not ch.url:
+            continue
+        opts = [o for o in (str(opt).strip() for opt in (getattr(ch, "vlc_opts", None) or ())) if o]
+        if opts:
+            write("".join([ch.extinf, "\n", *(f"{EXTVLCOPT_PREFIX}{o}\n" for o in opts), ch.url, "\n"]))
         else:
-            i += 1
-    return out
-
-
-def write_m3u(channels: List[Channel], path: Path):
-    """Écrit une playlist M3U minimale à partir d'une liste de Channel."""
-    with path.open("w", encoding="utf-8") as f:
-        f.write("#EXTM3U\n")
-        for ch in channels:
-            if ch.url:
-                f.write(ch.extinf + "\n")
-                for opt in getattr(ch, "vlc_opts", []) or []:
-                    opt = str(opt).strip()
-                    if opt:
-                        f.write(f"{EXTVLCOPT_PREFIX}{opt}\n")
-                f.write(ch.url + "\n")
+            write(f"{ch.extinf}\n{ch.url}\n")
+        written += 1
+    return written
+
+
+def write_m3u(channels: Iterable[Channel], path: Path) -> int:
+    """Écrit une playlist M3U minimale à partir d'une liste de Channel (tampon de 1 Mio, fins de ligne LF)."""
+    with path.open("w", encoding="utf-8", buffering=1 << 20, newline="\n") as f:
+        return write_m3u_stream(channels, f)
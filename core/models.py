@@ -4,9 +4,12 @@ from dataclasses import dataclass, field
 # Structures de données partagées entre UI, workers et stockage.
 
 
-@dataclass
+@dataclass(slots=True)
 class Channel:
-    """Représente une entrée M3U/playlist enrichie d'un scoring de risque."""
+    """
+    Représente une entrée M3U/playlist enrichie d'un scoring de risque.
+    slots=True: alloué par milliers (une instance par entrée), sans __dict__ par objet.
+    """
     extinf: str
     url: str
     name: str = ""
@@ -20,3 +23,5 @@ class Channel:
     risk_level: str = "Inconnu"
     risk_badge: str = "🟢"
     risk_reasons: str = ""
+    # Texte minuscule du filtre de la table (calculé à la demande, remis à "" quand statut/risque changent)
+    _search_hay: str = field(default="", init=False, repr=False, compare=False)
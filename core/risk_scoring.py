@@ -3,6 +3,7 @@ from __future__ import annotations
 import ipaddress
 import re
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Iterable
 from urllib.parse import urlparse
 
@@ -64,6 +65,12 @@ COUNTRY_TLD_MAP = {
 }
 
 
+# Formes précalculées (l'évaluation tourne sur des milliers de chaînes à chaque import).
+_CATEGORY_KEYWORDS_LOWER = tuple((kw, kw.lower()) for kw in CATEGORY_RISK_KEYWORDS)
+_HINT_SPLIT_RE = re.compile(r"[.\s\-_]+")
+_HINT_TOKEN_RE = re.compile(r"\b([A-Za-z]{2})\b")
+
+
 @dataclass
 class RiskAssessment:
     score: float
@@ -102,18 +109,55 @@ def _extract_country_hint(*values: str) -> str | None:
         if not val:
             continue
         # tvg-id or dotted suffix
-        parts = re.split(r"[.\s\-_]+", val)
+        parts = _HINT_SPLIT_RE.split(val)
         if parts:
             last = parts[-1]
             if len(last) == 2 and last.isalpha():
                 return last.upper()
         # explicit [XX] marker
-        m = re.search(r"\b([A-Za-z]{2})\b", val)
+        m = _HINT_TOKEN_RE.search(val)
         if m:
             return m.group(1).upper()
     return None
 
 
+@lru_cache(maxsize=4096)
+def _host_signals(host: str) -> tuple[float, tuple[str, ...]]:
+    """
+    Signaux ne dépendant que de l'hôte (IP brute, TLD, mots-clés), mémorisés:
+    une playlist réutilise typiquement une poignée d'hôtes pour des milliers de chaînes.
+    """
+    delta = 0.0
+    reasons: list[str] = []
+    tld = host.rsplit(".", 1)[-1] if "." in host else ""
+
+    if not host:
+        delta += 25
+        reasons.append(_tag("Hôte manquant dans l'URL.", 25))
+    elif _is_ip(host):
+        delta += 20
+        reasons.append(_tag("Flux servi depuis une IP brute (pas de domaine).", 20))
+    else:
+        if tld in SUSPICIOUS_TLDS:
+            delta += 12
+            reasons.append(_tag(f"TLD fréquent sur flux non officiels ({tld}).", 12))
+        if tld in LOWER_RISK_TLDS:
+            delta -= 4
+            reasons.append(_tag(f"TLD aligné sur pays courant ({tld}).", -4))
+
+        for kw in LOWER_RISK_HOST_KEYWORDS:
+            if kw in host:
+                delta -= 6
+                reasons.append(_tag(f"Hébergement CDN connu ({kw}).", -6))
+                break
+        for kw in HIGHER_RISK_HOST_KEYWORDS:
+            if kw in host:
+                delta += 8
+                reasons.append(_tag(f"Mot-clé hôte indicatif de restream ({kw}).", 8))
+                break
+    return delta, tuple(reasons)
+
+
 def assess_channel_risk(ch: Channel) -> RiskAssessment:
     """
     Stateless risk estimator: returns a 0-100 score + badge + reasons.
@@ -139,30 +183,9 @@ def assess_channel_risk(ch: Channel) -> RiskAssessment:
     host = (parsed.hostname or "").lower()
     tld = host.rsplit(".", 1)[-1] if "." in host else ""
 
-    if not host:
-        score += 25
-        reasons.append(_tag("Hôte manquant dans l'URL.", 25))
-    elif _is_ip(host):
-        score += 20
-        reasons.append(_tag("Flux servi depuis une IP brute (pas de domaine).", 20))
-    else:
-        if tld in SUSPICIOUS_TLDS:
-            score += 12
-            reasons.append(_tag(f"TLD fréquent sur flux non officiels ({tld}).", 12))
-        if tld in LOWER_RISK_TLDS:
-            score -= 4
-            reasons.append(_tag(f"TLD aligné sur pays courant ({tld}).", -4))
-
-        for kw in LOWER_RISK_HOST_KEYWORDS:
-            if kw in host:
-                score -= 6
-                reasons.append(_tag(f"Hébergement CDN connu ({kw}).", -6))
-                break
-        for kw in HIGHER_RISK_HOST_KEYWORDS:
-            if kw in host:
-                score += 8
-                reasons.append(_tag(f"Mot-clé hôte indicatif de restream ({kw}).", 8))
-                break
+    host_delta, host_reasons = _host_signals(host)
+    score += host_delta
+    reasons.extend(host_reasons)
 
     # Port
     if parsed.port and parsed.port not in {80, 443, 1935, 8080}:
@@ -182,8 +205,8 @@ def assess_channel_risk(ch: Channel) -> RiskAssessment:
 
     # Channel metadata signals (category/type)
     name_lower = f"{ch.name} {ch.group}".lower()
-    for kw in CATEGORY_RISK_KEYWORDS:
-        if kw.lower() in name_lower:
+    for kw, kw_lower in _CATEGORY_KEYWORDS_LOWER:
+        if kw_lower in name_lower:
             score += 6
             reasons.append(_tag(f"Libellé sensible ({kw}).", 6))
             break
@@ -210,16 +233,25 @@ def _finalize(raw_score: float, reasons: list[str]) -> RiskAssessment:
     return RiskAssessment(score=score, badge=badge, level=level, reasons=trimmed)
 
 
-def score_channels(channels: Iterable[Channel]) -> list[RiskAssessment]:
-    """
-    Helper to mutate Channel objects with risk info while returning the assessments.
-    """
-    assessments: list[RiskAssessment] = []
-    for ch in channels:
-        assessment = assess_channel_risk(ch)
+def assess_channels(channels: Iterable[Channel]) -> list[RiskAssessment]:
+    """Évalue chaque chaîne sans la modifier (appelable depuis un thread de travail)."""
+    return [assess_channel_risk(ch) for ch in channels]
+
+
+def apply_assessments(channels: Iterable[Channel], assessments: Iterable[RiskAssessment]) -> None:
+    """Recopie les évaluations sur les Channel correspondants (même ordre)."""
+    for ch, assessment in zip(channels, assessments):
         ch.risk_score = assessment.score
         ch.risk_level = assessment.level
         ch.risk_badge = assessment.badge
         ch.risk_reasons = " • ".join(assessment.reasons)
-        assessments.append(assessment)
+
+
+def score_channels(channels: Iterable[Channel]) -> list[RiskAssessment]:
+    """
+    Helper to mutate Channel objects with risk info while returning the assessments.
+    """
+    channels = list(channels)
+    assessments = assess_channels(channels)
+    apply_assessments(channels, assessments)
     return assessments
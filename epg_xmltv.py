@@ -3,10 +3,18 @@ from __future__ import annotations
 
 import gzip
 import io
+import os
+import pickle
 import re
+import zlib
 import xml.etree.ElementTree as ET
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timezone, timedelta
-from typing import Callable, Iterable
+from itertools import islice
+from pathlib import Path
+from typing import BinaryIO, Callable, Iterable, Iterator
 
 import requests
 
@@ -18,37 +26,94 @@ Outils XMLTV: téléchargement d'un guide (XML/ZIP) puis parsing en flux pour in
 _DT_RE = re.compile(r"^(\d{14})")  # YYYYMMDDHHMMSS
 
 
-def download_xmltv(url: str, timeout: int = 90, progress_cb: Callable[[int, int], None] | None = None) -> bytes:
+@dataclass
+class XmltvFetch:
+    """Résultat d'un téléchargement conditionnel (validateurs HTTP à mémoriser pour le prochain appel)."""
+    path: Path
+    not_modified: bool = False
+    etag: str = ""
+    last_modified: str = ""
+
+
+def download_xmltv_to_file(
+    url: str,
+    dest: str | Path,
+    timeout: int = 90,
+    progress_cb: Callable[[int, int], None] | None = None,
+    *,
+    etag: str = "",
+    last_modified: str = "",
+) -> XmltvFetch:
     """
-    Télécharge un flux XMLTV (support .gz) et renvoie les bytes décompressés.
-    progress_cb(read_bytes, total_bytes) est appelé périodiquement (total=0 si inconnu).
+    Télécharge un flux XMLTV directement sur disque, en décompressant le .gz à la volée.
+    La mémoire reste constante quelle que soit la taille du guide (pas de buffer complet).
+    progress_cb(read_bytes, total_bytes) porte sur les octets reçus (total=0 si inconnu).
+    Si etag/last_modified sont fournis, la requête est conditionnelle: sur 304, `dest` n'est pas
+    écrit et le résultat porte not_modified=True (le fichier en cache reste valide).
     """
-    with requests.get(url, timeout=timeout, stream=True) as r:
-        r.raise_for_status()
-        total = int(r.headers.get("content-length") or 0)
-        buf = bytearray()
-        for chunk in r.iter_content(chunk_size=64 * 1024):
-            if not chunk:
-                continue
-            buf.extend(chunk)
-            if progress_cb:
-                try:
-                    progress_cb(len(buf), total)
-                except Exception:
-                    pass
-        data = bytes(buf)
+    dest = Path(dest)
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    part = dest.with_name(dest.name + ".part")
+
+    headers = {}
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
+
+    read = 0
+    try:
+        with requests.get(url, timeout=timeout, stream=True, headers=headers) as r:
+            if r.status_code == 304:
+                return XmltvFetch(path=dest, not_modified=True, etag=etag, last_modified=last_modified)
+            r.raise_for_status()
+            fetch = XmltvFetch(
+                path=dest,
+                etag=r.headers.get("ETag", ""),
+                last_modified=r.headers.get("Last-Modified", ""),
+            )
+            total = int(r.headers.get("content-length") or 0)
+            inflater = None
+
+            with part.open("wb") as out:
+                for chunk in r.iter_content(chunk_size=64 * 1024):
+                    if not chunk:
+                        continue
+                    if read == 0 and chunk[:2] == b"\x1f\x8b":
+                        inflater = zlib.decompressobj(16 + zlib.MAX_WBITS)
+                    read += len(chunk)
 
-    # .gz support
-    if url.lower().endswith(".gz") or data[:2] == b"\x1f\x8b":
-        data = gzip.decompress(data)
+                    if inflater is None:
+                        out.write(chunk)
+                    else:
+                        # Un .gz peut contenir plusieurs membres concaténés.
+                        while chunk:
+                            out.write(inflater.decompress(chunk))
+                            chunk = b""
+                            if inflater.eof and inflater.unused_data:
+                                chunk = inflater.unused_data
+                                inflater = zlib.decompressobj(16 + zlib.MAX_WBITS)
+
+                    if progress_cb:
+                        try:
+                            progress_cb(read, total)
+                        except Exception:
+                            pass
+
+                if inflater is not None:
+                    out.write(inflater.flush())
+
+        os.replace(part, dest)
+    finally:
+        part.unlink(missing_ok=True)
 
     if progress_cb:
         try:
-            progress_cb(len(data), len(data))
+            progress_cb(read, read)
         except Exception:
             pass
 
-    return data
+    return fetch
 
 
 def _parse_xmltv_dt(s: str) -> int:
@@ -83,34 +148,237 @@ def _parse_xmltv_dt(s: str) -> int:
     return int(dt.timestamp())
 
 
-def iter_programs(xml_bytes: bytes) -> Iterable[dict]:
+def _programme_row(elem: ET.Element) -> tuple[str, int, int, str, str] | None:
+    """<programme> -> (tvg_id, start_ts, stop_ts, title, desc), ou None si incomplet."""
+    tvg_id = (elem.attrib.get("channel") or "").strip()
+    start_ts = _parse_xmltv_dt(elem.attrib.get("start", ""))
+    stop_ts = _parse_xmltv_dt(elem.attrib.get("stop", ""))
+
+    title = ""
+    desc = ""
+
+    t = elem.find("title")
+    if t is not None and t.text:
+        title = t.text.strip()
+
+    d = elem.find("desc")
+    if d is not None and d.text:
+        desc = d.text.strip()
+
+    if tvg_id and start_ts and stop_ts:
+        return tvg_id, start_ts, stop_ts, title, desc
+    return None
+
+
+def iter_programme_rows(source: bytes | str | Path | BinaryIO) -> Iterable[tuple[str, int, int, str, str]]:
     """
-    Yields dicts: {tvg_id, start_ts, stop_ts, title, desc}
-    Utilise iterparse pour gros guides.
+    Yields tuples (tvg_id, start_ts, stop_ts, title, desc), prêts pour un executemany SQLite.
+    Utilise iterparse pour gros guides. `source` peut être des bytes, un chemin ou un fichier ouvert.
+    Mémoire constante: chaque élément traité est détaché de la racine (elem.clear() seul laisserait
+    un squelette vide par programme accroché à <tv>).
     """
-    f = io.BytesIO(xml_bytes)
-    context = ET.iterparse(f, events=("end",))
+    f = io.BytesIO(source) if isinstance(source, (bytes, bytearray)) else source
+    context = ET.iterparse(f, events=("start", "end"))
+    root = None
 
-    for _, elem in context:
-        if elem.tag != "programme":
+    for event, elem in context:
+        if event == "start":
+            if root is None:
+                root = elem
             continue
+        if elem.tag == "programme":
+            row = _programme_row(elem)
+            if row is not None:
+                yield row
+        elif elem.tag != "channel":
+            continue
+        # Enfants directs de <tv> (programme/channel) terminés: on les libère entièrement.
+        root.clear()
+
+
+def iter_programs(source: bytes | str | Path | BinaryIO) -> Iterable[dict]:
+    """
+    Yields dicts: {tvg_id, start_ts, stop_ts, title, desc}
+    Voir iter_programme_rows() pour la variante tuple (sans allocation de dict).
+    """
+    for tvg_id, start_ts, stop_ts, title, desc in iter_programme_rows(source):
+        yield {"tvg_id": tvg_id, "start_ts": start_ts, "stop_ts": stop_ts, "title": title, "desc": desc}
+
+
+# -------------------------
+# Parsing parallèle (gros guides)
+# -------------------------
+
+PARALLEL_MIN_BYTES = 32 * 1024 * 1024
+_BATCH_BYTES = 4 * 1024 * 1024
+_PROG_END = b"</programme>"
+_XML_ENCODING_RE = re.compile(rb"""<\?xml[^>]*encoding=["']([A-Za-z0-9._\-]+)["']""")
 
-        tvg_id = (elem.attrib.get("channel") or "").strip()
-        start_ts = _parse_xmltv_dt(elem.attrib.get("start", ""))
-        stop_ts = _parse_xmltv_dt(elem.attrib.get("stop", ""))
 
-        title = ""
-        desc = ""
+def _parse_programme_batch(blob: bytes, encoding: str) -> list[tuple[str, int, int, str, str]] | None:
+    """
+    Worker (processus séparé): parse un lot d'éléments <programme> consécutifs.
+    None si le lot n'est pas du XML valide (coupure mal placée, voir _iter_programme_batches).
+    """
+    doc = b'<?xml version="1.0" encoding="' + encoding.encode("ascii") + b'"?><tv>' + blob + b"</tv>"
+    try:
+        root = ET.fromstring(doc)
+    except ET.ParseError:
+        return None
+    rows = []
+    for elem in root.iter("programme"):
+        row = _programme_row(elem)
+        if row is not None:
+            rows.append(row)
+    return rows
+
+
+def _iter_programme_batches(path: Path, batch_bytes: int) -> Iterable[bytes]:
+    """
+    Découpe le fichier en lots d'éléments <programme> complets (coupure juste après </programme>).
+    Tout ce qui précède le premier <programme> (prologue, <tv>, <channel>) est ignoré.
+    Limite connue: la coupure se fait sur les octets bruts, sans comprendre le XML; un commentaire
+    ou une section CDATA contenant littéralement "</programme>" coupe un élément en deux. Le lot
+    concerné ne se parse plus et iter_programme_rows_parallel() repasse alors en séquentiel.
+    """
+    carry = b""
+    started = False
+    with path.open("rb") as f:
+        while True:
+            block = f.read(batch_bytes)
+            if not block:
+                break
+            buf = carry + block
+            if not started:
+                first = buf.find(b"<programme")
+                if first < 0:
+                    carry = buf[-len(b"<programme"):]
+                    continue
+                buf = buf[first:]
+                started = True
+            cut = buf.rfind(_PROG_END)
+            if cut < 0:
+                carry = buf
+                continue
+            cut += len(_PROG_END)
+            yield buf[:cut]
+            carry = buf[cut:]
+    if started and _PROG_END in carry:
+        yield carry[: carry.rfind(_PROG_END) + len(_PROG_END)]
+
+
+def iter_programme_rows_parallel(
+    path: str | Path,
+    max_workers: int | None = None,
+    batch_bytes: int = _BATCH_BYTES,
+) -> Iterable[tuple[str, int, int, str, str]]:
+    """
+    Comme iter_programme_rows(), mais répartit le parsing sur plusieurs processus (producteur/consommateurs).
+    Le fichier est lu par blocs et découpé aux frontières </programme>; l'ordre des programmes est
+    conservé et le nombre de lots en vol est borné (mémoire constante).
+    Si un lot est illisible (coupure tombée dans un commentaire/CDATA), on abandonne les lots restants
+    et on reprend le fichier avec iter_programme_rows(), en sautant les programmes déjà produits.
+    Pour un petit guide (ou une seule CPU), on reste sur le parsing séquentiel: le démarrage des
+    processus coûterait plus que le parsing lui-même.
+    """
+    path = Path(path)
+    workers = max_workers or max(1, (os.cpu_count() or 2) - 1)
+    if workers <= 1 or path.stat().st_size < PARALLEL_MIN_BYTES:
+        yield from iter_programme_rows(path)
+        return
+
+    with path.open("rb") as f:
+        m = _XML_ENCODING_RE.search(f.read(256))
+    encoding = m.group(1).decode("ascii") if m else "utf-8"
+
+    done = 0
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        batches = iter(_iter_programme_batches(path, batch_bytes))
+        while True:
+            while len(pending) < workers * 2:
+                blob = next(batches, None)
+                if blob is None:
+                    break
+                pending.append(executor.submit(_parse_programme_batch, blob, encoding))
+            if not pending:
+                return
+            rows = pending.popleft().result()
+            if rows is None:
+                for fut in pending:
+                    fut.cancel()
+                break
+            done += len(rows)
+            yield from rows
 
-        t = elem.find("title")
-        if t is not None and t.text:
-            title = t.text.strip()
+    yield from islice(iter_programme_rows(path), done, None)
 
-        d = elem.find("desc")
-        if d is not None and d.text:
-            desc = d.text.strip()
 
-        if tvg_id and start_ts and stop_ts:
-            yield {"tvg_id": tvg_id, "start_ts": start_ts, "stop_ts": stop_ts, "title": title, "desc": desc}
+# -------------------------
+# Cache des programmes déjà parsés (évite de re-parser le XML au chargement suivant)
+# -------------------------
+
+ROWS_CACHE_SUFFIX = ".rows.pkl.gz"
+_ROWS_CACHE_MAGIC = ("3dll-epg-rows", 1)
+
+
+def rows_cache_path(xml_path: str | Path) -> Path:
+    """Fichier compagnon d'un guide XML: ses programmes parsés (pickle par lots, gzip)."""
+    xml_path = Path(xml_path)
+    return xml_path.with_name(xml_path.stem + ROWS_CACHE_SUFFIX)
+
+
+def tee_rows_to_cache(
+    rows: Iterable[tuple[str, int, int, str, str]],
+    cache_path: str | Path,
+    batch: int = 5000,
+) -> Iterator[tuple[str, int, int, str, str]]:
+    """
+    Relaie `rows` tel quel tout en l'écrivant dans `cache_path` (lots de `batch` tuples).
+    Le fichier n'apparaît qu'une fois le flux entièrement consommé (écriture dans .part puis renommage).
+    """
+    cache_path = Path(cache_path)
+    tmp = cache_path.with_name(cache_path.name + ".part")
+    try:
+        with gzip.open(tmp, "wb", compresslevel=1) as f:
+            pickle.dump(_ROWS_CACHE_MAGIC, f, protocol=pickle.HIGHEST_PROTOCOL)
+            buf = []
+            for row in rows:
+                buf.append(row)
+                yield row
+                if len(buf) >= batch:
+                    pickle.dump(buf, f, protocol=pickle.HIGHEST_PROTOCOL)
+                    buf = []
+            if buf:
+                pickle.dump(buf, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, cache_path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def iter_rows_cache(cache_path: str | Path) -> Iterator[tuple[str, int, int, str, str]]:
+    """
+    Relit un cache écrit par tee_rows_to_cache(). L'en-tête est vérifié immédiatement
+    (ValueError/OSError si le fichier n'est pas exploitable), les lots sont lus à la demande.
+    """
+    f = gzip.open(cache_path, "rb")
+    try:
+        magic = pickle.load(f)
+    except Exception as e:
+        f.close()
+        raise ValueError(f"cache EPG illisible: {cache_path}") from e
+    if magic != _ROWS_CACHE_MAGIC:
+        f.close()
+        raise ValueError(f"cache EPG non reconnu: {cache_path}")
+
+    def rows():
+        with f:
+            while True:
+                try:
+                    chunk = pickle.load(f)
+                except EOFError:
+                    return
+                yield from chunk
 
-        elem.clear()
+    return rows()
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 import sqlite3
+import threading
+from contextlib import closing, contextmanager
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable, Optional
+from typing import Iterable, Iterator, Optional
 import json
 
 # Persistance SQLite pour playlists, chaînes et EPG (tables simples, aucune dépendance réseau).
@@ -29,6 +31,18 @@ class Storage:
     def __init__(self, db_path: str | Path = "data/iptv.db"):
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        # Liste des playlists (petite table lue à chaque clic Salon), invalidée à chaque écriture.
+        self._playlists_listed: list[PlaylistRec] | None = None
+        # Connexion de lecture persistante du thread créateur (thread UI): les requêtes EPG fréquentes
+        # (now/next à chaque sélection/zapping) réutilisent leurs statements préparés (cache sqlite3
+        # par connexion). Les autres threads ouvrent une connexion le temps de la lecture; close() la ferme.
+        self._reader_thread = threading.get_ident()
+        self._reader_con: sqlite3.Connection | None = None
+        # now/next par tvg_id: (instant de la requête, fin de validité, résultat). Le résultat reste exact
+        # tant que l'heure n'atteint ni la fin du programme courant ni le début du suivant.
+        self._now_next_cache: dict[str, tuple[int, float, tuple[Optional[dict], Optional[dict]]]] = {}
+        # Incrémenté à chaque écriture du guide: les caches EPG côté UI l'incluent dans leurs clés.
+        self.epg_version = 0
         self._init_db()
 
     def _connect(self) -> sqlite3.Connection:
@@ -36,8 +50,27 @@ class Storage:
         con = sqlite3.connect(self.db_path)
         con.execute("PRAGMA journal_mode=WAL;")
         con.execute("PRAGMA foreign_keys=ON;")
+        # En WAL, synchronous=NORMAL reste sûr (pas de corruption) et évite un fsync par commit.
+        con.execute("PRAGMA synchronous=NORMAL;")
+        con.execute("PRAGMA temp_store=MEMORY;")
         return con
 
+    @contextmanager
+    def _reading(self) -> Iterator[sqlite3.Connection]:
+        if threading.get_ident() != self._reader_thread:
+            with closing(self._connect()) as con:
+                yield con
+            return
+        if self._reader_con is None:
+            self._reader_con = self._connect()
+        yield self._reader_con
+
+    def close(self) -> None:
+        """Ferme la connexion de lecture persistante (à appeler depuis le thread créateur)."""
+        if self._reader_con is not None:
+            self._reader_con.close()
+            self._reader_con = None
+
     def _init_db(self) -> None:
         con = self._connect()
         try:
@@ -117,14 +150,24 @@ class Storage:
             return int(cur.lastrowid)
         finally:
             con.close()
+            self._invalidate_playlists()
+
+    def _invalidate_playlists(self) -> None:
+        self._playlists_listed = None
 
     def list_playlists(self) -> list[PlaylistRec]:
+        """Liste complète (plus récente d'abord), mémorisée jusqu'à la prochaine écriture sur les playlists."""
+        cached = self._playlists_listed
+        if cached is not None:
+            return list(cached)
         con = self._connect()
         try:
             rows = con.execute("SELECT id, name, url, COALESCE(epg_url, '') FROM playlists ORDER BY id DESC").fetchall()
-            return [PlaylistRec(*r) for r in rows]
+            recs = [PlaylistRec(*r) for r in rows]
         finally:
             con.close()
+        self._playlists_listed = recs
+        return list(recs)
 
     def delete_playlist(self, playlist_id: int) -> None:
         con = self._connect()
@@ -133,33 +176,54 @@ class Storage:
             con.commit()
         finally:
             con.close()
+            self._invalidate_playlists()
 
-    def replace_channels(self, playlist_id: int, channels: Iterable[dict]) -> None:
+    def replace_channels(self, playlist_id: int, channels: Iterable[dict]) -> int:
         """
         channels: iterable de dict {name, group, tvg_id, url, extinf, vlc_opts}
+        Variante dict de replace_channel_rows().
+        """
+        return self.replace_channel_rows(
+            playlist_id,
+            (
+                (c.get("name"), c.get("group"), c.get("tvg_id"), c.get("url"), c.get("extinf"), c.get("vlc_opts"))
+                for c in channels
+            ),
+        )
+
+    def replace_channel_rows(self, playlist_id: int, rows: Iterable[tuple]) -> int:
+        """
+        rows: iterable de tuples (name, group, tvg_id, url, extinf, vlc_opts)
+        DELETE + executemany dans une seule transaction (rollback si erreur); `rows` est
+        consommé en flux, sans liste intermédiaire. Retourne le nombre de chaînes écrites.
         """
         con = self._connect()
         try:
+            con.execute("BEGIN IMMEDIATE")
             con.execute("DELETE FROM channels WHERE playlist_id=?", (playlist_id,))
-            con.executemany(
+            cur = con.executemany(
                 """
                 INSERT INTO channels(playlist_id, name, group_title, tvg_id, url, extinf, vlc_opts)
                 VALUES (?,?,?,?,?,?,?)
                 """,
-                [
+                (
                     (
                         playlist_id,
-                        (c.get("name") or ""),
-                        (c.get("group") or ""),
-                        (c.get("tvg_id") or ""),
-                        (c.get("url") or ""),
-                        (c.get("extinf") or ""),
-                        json.dumps([str(v).strip() for v in (c.get("vlc_opts") or []) if str(v).strip()]),
+                        name or "",
+                        group or "",
+                        tvg_id or "",
+                        url or "",
+                        extinf or "",
+                        json.dumps([str(v).strip() for v in (vlc_opts or []) if str(v).strip()]),
                     )
-                    for c in channels
-                ],
+                    for (name, group, tvg_id, url, extinf, vlc_opts) in rows
+                ),
             )
             con.commit()
+            return max(0, cur.rowcount)
+        except Exception:
+            con.rollback()
+            raise
         finally:
             con.close()
 
@@ -202,6 +266,10 @@ class Storage:
     # -------------------------
     # EPG Programs
     # -------------------------
+    def _invalidate_epg(self) -> None:
+        self._now_next_cache = {}
+        self.epg_version += 1
+
     def clear_epg(self) -> None:
         con = self._connect()
         try:
@@ -209,78 +277,104 @@ class Storage:
             con.commit()
         finally:
             con.close()
+        self._invalidate_epg()
 
-    def upsert_epg_programs(self, programs: Iterable[dict], chunk: int = 5000) -> None:
+    def replace_epg_rows(self, rows: Iterable[tuple], chunk: int = 5000) -> int:
         """
-        programs: iterable de dict {tvg_id, start_ts, stop_ts, title, desc}
-        Insert chunked pour éviter de charger tout le guide en mémoire.
+        Remplace tout le guide dans une seule transaction (DELETE + executemany par paquets).
+        rows: iterable de tuples (tvg_id, start_ts, stop_ts, title, desc), consommé au fil de l'eau:
+        le guide n'est jamais matérialisé en mémoire, et une erreur en cours de lecture laisse
+        l'ancien guide intact (rollback). Retourne le nombre de programmes insérés.
+        L'index (tvg_id, start_ts) est reconstruit une fois après l'insertion plutôt que mis à jour ligne à ligne.
         """
+        sql = "INSERT INTO epg_programs(tvg_id, start_ts, stop_ts, title, desc) VALUES (?,?,?,?,?)"
         con = self._connect()
+        count = 0
         try:
+            con.execute("BEGIN IMMEDIATE")
+            con.execute("DELETE FROM epg_programs")
+            con.execute("DROP INDEX IF EXISTS idx_epg_tvg_start")
             buf = []
-            for p in programs:
-                buf.append(
-                    (
-                        p["tvg_id"],
-                        int(p["start_ts"]),
-                        int(p["stop_ts"]),
-                        p.get("title", ""),
-                        p.get("desc", ""),
-                    )
-                )
+            for row in rows:
+                buf.append(row)
                 if len(buf) >= chunk:
-                    con.executemany(
-                        "INSERT INTO epg_programs(tvg_id, start_ts, stop_ts, title, desc) VALUES (?,?,?,?,?)",
-                        buf,
-                    )
+                    con.executemany(sql, buf)
+                    count += len(buf)
                     buf.clear()
-
             if buf:
-                con.executemany(
-                    "INSERT INTO epg_programs(tvg_id, start_ts, stop_ts, title, desc) VALUES (?,?,?,?,?)",
-                    buf,
-                )
+                con.executemany(sql, buf)
+                count += len(buf)
+            con.execute("CREATE INDEX IF NOT EXISTS idx_epg_tvg_start ON epg_programs(tvg_id, start_ts)")
             con.commit()
+        except Exception:
+            con.rollback()
+            raise
         finally:
             con.close()
+        self._invalidate_epg()
+        return count
+
+    def epg_summary(self) -> tuple[int, set[str]]:
+        """(nombre de programmes, tvg-id présents) du guide en base, sans relire de XML."""
+        with self._reading() as con:
+            count = int(con.execute("SELECT COUNT(*) FROM epg_programs").fetchone()[0])
+            ids = {r[0] for r in con.execute("SELECT DISTINCT tvg_id FROM epg_programs")}
+        return count, ids
 
     def get_now_next(self, tvg_id: str, now_ts: int) -> tuple[Optional[dict], Optional[dict]]:
         """
         Retourne (now, next) pour un tvg_id donné.
-        Requêtes indexées pour un affichage rapide (player/onglet EPG).
+        Requêtes indexées pour un affichage rapide (player/onglet EPG); un clic répété sur la même
+        chaîne avant la prochaine transition de programme est servi sans requête.
         """
-        con = self._connect()
-        try:
-            now_row = con.execute(
-                """
-                SELECT start_ts, stop_ts, title, desc
-                FROM epg_programs
-                WHERE tvg_id=? AND start_ts <= ? AND stop_ts > ?
-                ORDER BY start_ts DESC
-                LIMIT 1
-                """,
-                (tvg_id, now_ts, now_ts),
-            ).fetchone()
-
-            next_row = con.execute(
-                """
-                SELECT start_ts, stop_ts, title, desc
-                FROM epg_programs
-                WHERE tvg_id=? AND start_ts > ?
-                ORDER BY start_ts ASC
-                LIMIT 1
-                """,
-                (tvg_id, now_ts),
-            ).fetchone()
-
-            def row_to_dict(r):
-                if not r:
-                    return None
-                return {"start_ts": r[0], "stop_ts": r[1], "title": r[2], "desc": r[3]}
-
-            return row_to_dict(now_row), row_to_dict(next_row)
-        finally:
-            con.close()
+        cached = self._now_next_cache.get(tvg_id)
+        if cached is not None and cached[0] <= now_ts < cached[1]:
+            return cached[2]
+
+        with self._reading() as con:
+            now_row = con.execute(self._NOW_SQL, (tvg_id, now_ts, now_ts)).fetchone()
+            next_row = con.execute(self._NEXT_SQL, (tvg_id, now_ts)).fetchone()
+
+        def row_to_dict(r):
+            if not r:
+                return None
+            return {"start_ts": r[0], "stop_ts": r[1], "title": r[2], "desc": r[3]}
+
+        result = (row_to_dict(now_row), row_to_dict(next_row))
+        until = float("inf")
+        if now_row:
+            until = min(until, now_row[1])
+        if next_row:
+            until = min(until, next_row[0])
+        if len(self._now_next_cache) >= 4096:
+            self._now_next_cache.clear()
+        self._now_next_cache[tvg_id] = (now_ts, until, result)
+        return result
+
+    # Texte SQL constant: clé du cache de statements préparés de la connexion de lecture.
+    _NOW_SQL = """
+        SELECT start_ts, stop_ts, title, desc
+        FROM epg_programs
+        WHERE tvg_id=? AND start_ts <= ? AND stop_ts > ?
+        ORDER BY start_ts DESC
+        LIMIT 1
+    """
+    _NEXT_SQL = """
+        SELECT start_ts, stop_ts, title, desc
+        FROM epg_programs
+        WHERE tvg_id=? AND start_ts > ?
+        ORDER BY start_ts ASC
+        LIMIT 1
+    """
+    _LIST_EPG_SQL = """
+        SELECT start_ts, stop_ts, title, desc
+        FROM epg_programs
+        WHERE tvg_id=?
+          AND stop_ts > ?
+          AND start_ts < ?
+        ORDER BY start_ts ASC
+        LIMIT ?
+    """
 
     # -------------------------
     # NOUVEAU: Liste EPG (pour la fenêtre "Guide…")
@@ -299,27 +393,42 @@ class Storage:
         if not tvg_id:
             return []
 
-        con = self._connect()
-        try:
+        with self._reading() as con:
             rows = con.execute(
-                """
-                SELECT start_ts, stop_ts, title, desc
-                FROM epg_programs
-                WHERE tvg_id=?
-                  AND stop_ts > ?
-                  AND start_ts < ?
-                ORDER BY start_ts ASC
-                LIMIT ?
-                """,
-                (tvg_id, int(start_ts), int(stop_ts), int(limit)),
+                self._LIST_EPG_SQL, (tvg_id, int(start_ts), int(stop_ts), int(limit))
             ).fetchall()
-
-            return [
-                {"start_ts": r[0], "stop_ts": r[1], "title": r[2] or "", "desc": r[3] or ""}
-                for r in rows
-            ]
-        finally:
-            con.close()
+        return [
+            {"start_ts": r[0], "stop_ts": r[1], "title": r[2] or "", "desc": r[3] or ""}
+            for r in rows
+        ]
+
+    _CHANNELS_SQL = """
+        SELECT name, group_title, tvg_id, url, extinf, vlc_opts
+        FROM channels
+        WHERE playlist_id=?
+        ORDER BY id ASC
+    """
+
+    @staticmethod
+    def _channel_dicts(rows: list[tuple]) -> list[dict]:
+        out = []
+        for (name, group_title, tvg_id, url, extinf, vlc_opts) in rows:
+            opts = []
+            try:
+                opts = json.loads(vlc_opts) if vlc_opts else []
+                if not isinstance(opts, list):
+                    opts = []
+            except Exception:
+                opts = []
+            out.append({
+                "name": name or "",
+                "group": group_title or "",
+                "tvg_id": tvg_id or "",
+                "url": url or "",
+                "extinf": extinf or "",
+                "vlc_opts": opts,
+            })
+        return out
 
     def get_channels(self, playlist_id: int) -> list[dict]:
         """
@@ -327,36 +436,46 @@ class Storage:
         """
         con = self._connect()
         try:
-            rows = con.execute(
-                """
-                SELECT name, group_title, tvg_id, url, extinf, vlc_opts
-                FROM channels
-                WHERE playlist_id=?
-                ORDER BY id ASC
-                """,
-                (int(playlist_id),),
-            ).fetchall()
+            rows = con.execute(self._CHANNELS_SQL, (int(playlist_id),)).fetchall()
+        finally:
+            con.close()
+        return self._channel_dicts(rows)
+
+    # Lignes brutes (tuples) pour construire directement des Channel, sans dict intermédiaire:
+    # (extinf, url, name, group_title, tvg_id, vlc_opts_json)
+    _CHANNEL_ROWS_SQL = """
+        SELECT COALESCE(extinf, ''), COALESCE(url, ''), COALESCE(name, ''),
+               COALESCE(group_title, ''), COALESCE(tvg_id, ''), vlc_opts
+        FROM channels
+        WHERE playlist_id=?
+        ORDER BY id ASC
+    """
+
+    def get_channel_rows(self, playlist_id: int) -> list[tuple]:
+        """Chaînes d'une playlist en tuples (extinf, url, name, group, tvg_id, vlc_opts_json)."""
+        con = self._connect()
+        try:
+            return con.execute(self._CHANNEL_ROWS_SQL, (int(playlist_id),)).fetchall()
+        finally:
+            con.close()
 
-            out = []
-            for (name, group_title, tvg_id, url, extinf, vlc_opts) in rows:
-                opts = []
-                try:
-                    opts = json.loads(vlc_opts) if vlc_opts else []
-                    if not isinstance(opts, list):
-                        opts = []
-                except Exception:
-                    opts = []
-                out.append({
-                    "name": name or "",
-                    "group": group_title or "",
-                    "tvg_id": tvg_id or "",
-                    "url": url or "",
-                    "extinf": extinf or "",
-                    "vlc_opts": opts,
-                })
-            return out
+    def get_playlist_with_channels(self, playlist_id: int) -> tuple[Optional[PlaylistRec], list[tuple]]:
+        """
+        Fiche playlist + ses chaînes (tuples, cf. get_channel_rows) en un seul aller-retour
+        (une connexion, une transaction de lecture cohérente), pour l'ouverture d'une playlist du Salon.
+        """
+        pid = int(playlist_id)
+        con = self._connect()
+        try:
+            con.execute("BEGIN")
+            row = con.execute(
+                "SELECT id, name, url, COALESCE(epg_url, '') FROM playlists WHERE id=? LIMIT 1", (pid,)
+            ).fetchone()
+            rows = con.execute(self._CHANNEL_ROWS_SQL, (pid,)).fetchall()
+            con.commit()
         finally:
             con.close()
+        return (PlaylistRec(*row) if row is not None else None), rows
 
     def update_playlist(self, playlist_id: int, name: str, url: str, epg_url: str = "") -> None:
         con = self._connect()
@@ -368,3 +487,4 @@ class Storage:
             con.commit()
         finally:
             con.close()
+            self._invalidate_playlists()
@@ -1,30 +1,47 @@
 # ui/main_window.py
 from __future__ import annotations
 
+from bisect import bisect_right
 from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from functools import lru_cache
+from hashlib import blake2b
+from operator import attrgetter
 import json
+import os
 import re
 import shutil
 import threading
 import time
+import traceback
 from pathlib import Path
+from typing import Iterable, Iterator
 from urllib.parse import urlparse
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from PySide6 import QtCore, QtGui, QtWidgets
 
 from core.models import Channel
-from core.m3u import parse_m3u, write_m3u
-from core.risk_scoring import score_channels
+from core.m3u import parse_m3u, parse_m3u_file, parse_m3u_iter, write_m3u
+from core.risk_scoring import apply_assessments, assess_channels
 from workers.probe_worker import ProbeWorker
 
 from imbed_vlc import VlcPlayerPanel
 from storage import Storage
-from epg_xmltv import download_xmltv, iter_programs
+from epg_xmltv import (
+    download_xmltv_to_file,
+    iter_programme_rows_parallel,
+    iter_rows_cache,
+    rows_cache_path,
+    tee_rows_to_cache,
+)
 from epg_npm_bridge import generate_xmltv_for_tvg_ids
 from salon_tab import SalonTab
 from ui.settings_tab import SettingsTab
-from ui.themes import discover_themes
+from ui.themes import ThemeSpec, get_theme, theme_names
 
 
 # =========================
@@ -34,25 +51,231 @@ from ui.themes import discover_themes
 PLAYLISTS_API_BASE = "https://iptv-org.github.io/api"
 IPTV_PLAYLIST_BASE = "https://iptv-org.github.io/iptv"
 PLAYLISTS_MD_RAW = "https://raw.githubusercontent.com/iptv-org/iptv/master/PLAYLISTS.md"
+HTTP_CACHE_DIR = Path("data/http_cache")  # copies des JSON iptv-org/api + validateurs HTTP
 
-CODE_URL_RE = re.compile(r"<code>\s*(https?://[^<\s]+?\.m3u8?)\s*</code>", re.IGNORECASE)
-BT_URL_RE = re.compile(r"`(https?://[^`]+?\.m3u8?)`")
-PLAIN_URL_RE = re.compile(r"^\s*(https?://\S+?\.m3u8?)\s*$")
+# Motifs PLAYLISTS.md sur bytes (ASCII uniquement): le document est analysé sans décodage global.
+CODE_URL_RE = re.compile(rb"<code>\s*(https?://[^<\s]+?\.m3u8?)\s*</code>", re.IGNORECASE)
+BT_URL_RE = re.compile(rb"`(https?://[^`]+?\.m3u8?)`")
+PLAIN_URL_RE = re.compile(rb"^\s*(https?://\S+?\.m3u8?)\s*$")
+TRAIL_NUM_RE = re.compile(rb"\s*\d+\s*$")
 
-TR_ROW_RE = re.compile(r"<tr>(.*?)</tr>", re.IGNORECASE)
-TD_RE = re.compile(r"<td[^>]*>(.*?)</td>", re.IGNORECASE)
+TR_ROW_RE = re.compile(rb"<tr>(.*?)</tr>", re.IGNORECASE)
+TD_RE = re.compile(rb"<td[^>]*>(.*?)</td>", re.IGNORECASE)
 TAG_RE = re.compile(r"<[^>]+>")
+SEARCH_TOKEN_RE = re.compile(r"\w+")
+TREE_FILTER_MIN_CHARS = 2  # en dessous, le filtre de l'index des playlists n'est pas appliqué
+
+
+@lru_cache(maxsize=64)
+def _compile_search_query(tokens: tuple[str, ...]) -> re.Pattern:
+    """
+    Un seul motif pour tous les mots de la requête: chaque texte est parcouru une fois,
+    quel que soit le nombre de mots. Capture les mots du texte qui commencent par un des tokens.
+    """
+    alts = "|".join(re.escape(t) for t in sorted(set(tokens), key=len, reverse=True))
+    return re.compile(rf"\b(?:{alts})\w*")
 
 
 def strip_tags(s: str) -> str:
-    s = TAG_RE.sub("", s)
-    return s.replace("&amp;", "&").replace("&nbsp;", " ").strip()
+    # Tests de présence avant regex/remplacements: la plupart des cellules n'ont ni balise ni entité.
+    if "<" in s:
+        s = TAG_RE.sub("", s)
+    if "&" in s:
+        s = s.replace("&amp;", "&").replace("&nbsp;", " ")
+    return s.strip()
+
+
+@lru_cache(maxsize=256)
+def _epg_url_key(raw: str) -> str:
+    """
+    Clé de cache EPG stable d'une exécution à l'autre (hash() est randomisé par processus,
+    ce qui rendait invisibles les fichiers url_<h>.xml des sessions précédentes).
+    """
+    return "url_" + blake2b(raw.encode("utf-8"), digest_size=8).hexdigest()
+
+
+@lru_cache(maxsize=1)
+def _style_keys() -> tuple[str, ...]:
+    """Styles Qt installés (hors windowsvista), lus une seule fois dans les plugins."""
+    return tuple(s for s in QtWidgets.QStyleFactory.keys() if s.lower() != "windowsvista")
+
+
+_HTTP_SESSION: requests.Session | None = None
+
+
+def http_session() -> requests.Session:
+    """
+    Session HTTP partagée (keep-alive): les nombreux petits JSON d'iptv-org et les playlists
+    téléchargées en parallèle réutilisent les mêmes connexions TCP/TLS au lieu d'en ouvrir une par requête.
+    Un échec de connexion est retenté une fois et une réponse 5xx transitoire jusqu'à deux fois;
+    un délai de lecture dépassé ne l'est jamais (chaque `timeout=` garde sa durée).
+    """
+    global _HTTP_SESSION
+    if _HTTP_SESSION is None:
+        session = requests.Session()
+        session.headers["User-Agent"] = "Mozilla/5.0"
+        retry = Retry(
+            total=2,
+            connect=1,
+            read=0,
+            status_forcelist=(500, 502, 503, 504),
+            raise_on_status=False,  # dernière réponse 5xx rendue telle quelle (raise_for_status côté appelant)
+            backoff_factor=0.3,
+            allowed_methods=frozenset({"GET", "HEAD"}),
+        )
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=retry)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        _HTTP_SESSION = session
+    return _HTTP_SESSION
+
+
+class _TaskPool(QtCore.QObject):
+    """
+    Pool borné de threads démons, propre à la fenêtre (enfant Qt de celle-ci).
+    Contrairement à QThreadPool.globalInstance(), la sortie de l'application n'attend pas les tâches
+    en cours (téléchargement, parsing). shutdown() abandonne les tâches en file et déconnecte `done`:
+    aucun résultat n'est plus livré après la fermeture, et Qt jette ceux en attente si la fenêtre est détruite.
+    """
+
+    done = QtCore.Signal(object, object, object)  # valeur, callback(valeur), on_finally
+
+    def __init__(self, max_workers: int, parent: QtCore.QObject | None = None):
+        super().__init__(parent)
+        self._max_workers = max(1, max_workers)
+        self._queue: deque = deque()
+        self._cond = threading.Condition()
+        self._workers = 0
+        self._idle = 0
+        self._closed = False
+
+    def start(self, fn) -> None:
+        with self._cond:
+            if self._closed:
+                return
+            self._queue.append(fn)
+            if len(self._queue) > self._idle and self._workers < self._max_workers:
+                self._workers += 1
+                threading.Thread(target=self._work, daemon=True).start()
+            else:
+                self._cond.notify()
+
+    def shutdown(self) -> None:
+        with self._cond:
+            self._closed = True
+            self._queue.clear()
+            self._cond.notify_all()
+        try:
+            self.done.disconnect()
+        except (RuntimeError, TypeError):
+            pass
+
+    def _work(self) -> None:
+        while True:
+            with self._cond:
+                while not self._queue and not self._closed:
+                    self._idle += 1
+                    self._cond.wait()
+                    self._idle -= 1
+                if self._closed:
+                    self._workers -= 1
+                    return
+                fn = self._queue.popleft()
+            try:
+                fn()
+            except Exception:
+                # Après fermeture: objets Qt détruits pendant la tâche, rien à signaler.
+                if not self._closed:
+                    traceback.print_exc()
+
+
+def run_pooled(owner: QtCore.QObject, fn) -> None:
+    """
+    Exécute `fn` sur le pool (borné) de la fenêtre qui contient `owner`, plutôt que dans un nouveau thread:
+    des clics répétés mettent les tâches en file au lieu d'empiler les threads.
+    """
+    obj = owner
+    while obj is not None:
+        pool = getattr(obj, "_task_pool", None)
+        if isinstance(pool, _TaskPool):
+            pool.start(fn)
+            return
+        obj = obj.parent()
+    threading.Thread(target=fn, daemon=True).start()
 
 
 def _get_json(url: str, timeout: int):
-    r = requests.get(url, timeout=timeout)
+    """
+    JSON distant revalidé contre une copie disque (ETag/Last-Modified): sur 304, le corps est relu
+    depuis data/http_cache au lieu d'être retéléchargé (feeds.json, languages.json… pèsent plusieurs Mo).
+    """
+    key = blake2b(url.encode("utf-8"), digest_size=8).hexdigest()
+    body_path = HTTP_CACHE_DIR / f"{key}.json"
+    meta_path = HTTP_CACHE_DIR / f"{key}.meta.json"
+
+    headers = {}
+    try:
+        meta = json.loads(meta_path.read_text(encoding="utf-8")) if body_path.exists() else {}
+    except Exception:
+        meta = {}
+    if meta.get("etag"):
+        headers["If-None-Match"] = meta["etag"]
+    if meta.get("last_modified"):
+        headers["If-Modified-Since"] = meta["last_modified"]
+
+    r = http_session().get(url, timeout=timeout, headers=headers)
+    if r.status_code == 304 and headers:
+        try:
+            return json.loads(body_path.read_bytes())
+        except Exception:
+            # Copie disque illisible: requête complète, sans validateurs.
+            r = http_session().get(url, timeout=timeout)
     r.raise_for_status()
-    return r.json()
+    data = r.json()
+
+    etag, last_modified = r.headers.get("ETag", ""), r.headers.get("Last-Modified", "")
+    if etag or last_modified:
+        try:
+            HTTP_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            # Noms temporaires par thread: _get_json_many écrit plusieurs entrées en parallèle.
+            suffix = f".{threading.get_ident()}.tmp"
+            tmp = body_path.with_name(body_path.name + suffix)
+            tmp.write_bytes(r.content)
+            os.replace(tmp, body_path)
+            tmp = meta_path.with_name(meta_path.name + suffix)
+            tmp.write_text(json.dumps({"etag": etag, "last_modified": last_modified}), encoding="utf-8")
+            os.replace(tmp, meta_path)
+        except Exception:
+            pass
+    return data
+
+
+def fetch_m3u_channels(url: str, timeout: int = 20) -> list[Channel]:
+    """
+    Télécharge et parse une playlist en flux: les lignes sont analysées pendant la lecture réseau,
+    sans matérialiser tout le texte en mémoire.
+    """
+    with http_session().get(url, timeout=timeout, stream=True) as r:
+        r.raise_for_status()
+        r.encoding = r.encoding or "utf-8"
+        return list(parse_m3u_iter(r.iter_lines(chunk_size=65536, decode_unicode=True)))
+
+
+def _get_json_many(urls: dict[str, str], timeout: int) -> dict:
+    """
+    Télécharge plusieurs JSON en parallèle (session partagée). Retourne {clé: données | Exception}.
+    """
+    out: dict = {}
+    if not urls:
+        return out
+    with ThreadPoolExecutor(max_workers=min(8, len(urls))) as executor:
+        futures = {key: executor.submit(_get_json, url, timeout) for key, url in urls.items()}
+        for key, fut in futures.items():
+            try:
+                out[key] = fut.result()
+            except Exception as e:
+                out[key] = e
+    return out
 
 
 def fetch_feeds(timeout: int = 25) -> list[dict]:
@@ -160,18 +383,30 @@ def _bucket_from_api(timeout: int) -> dict:
       On filtree donc avec `feeds.json` pour ne garder que ce qui est utilise, sinon on produirait
       beaucoup d'URLs inexistantes cote iptv-org/iptv.
     """
-    buckets = {"Category": [], "Language": [], "Country": [], "Subdivision/City": []}
-    seen = set()
+    # Un dict par bucket: dédoublonnage par hachage, ordre d'insertion conservé.
+    buckets: dict[str, dict[tuple[str, str], None]] = {
+        "Category": {}, "Language": {}, "Country": {}, "Subdivision/City": {},
+    }
 
     def add(bucket: str, name: str, url: str):
-        key = (bucket, name, url)
-        if key in seen:
-            return
-        seen.add(key)
-        buckets[bucket].append((name, url))
+        buckets[bucket][(name, url)] = None
+
+    # Les index indépendants partent en parallèle sur la session partagée.
+    base = _get_json_many(
+        {
+            "feeds": f"{PLAYLISTS_API_BASE}/feeds.json",
+            "categories": f"{PLAYLISTS_API_BASE}/categories.json",
+            "languages": f"{PLAYLISTS_API_BASE}/languages.json",
+            "countries": f"{PLAYLISTS_API_BASE}/countries.json",
+        },
+        timeout,
+    )
+    for key in ("feeds", "categories", "countries"):
+        if isinstance(base[key], Exception):
+            raise base[key]
 
     # Feeds: source de verite pour "ce qui existe vraiment" dans l'ecosysteme iptv.
-    feeds = _get_json(f"{PLAYLISTS_API_BASE}/feeds.json", timeout)
+    feeds = base["feeds"]
 
     used_languages: set[str] = set()
     used_countries: set[str] = set()
@@ -194,8 +429,16 @@ def _bucket_from_api(timeout: int) -> dict:
             elif area.startswith("ct/") and len(area) > 3:
                 used_cities.add(area[3:])
 
+    # Subdivisions / villes (fichiers lourds, optionnels): seulement si utilisés, en parallèle aussi.
+    extra_urls = {}
+    if used_subdivisions:
+        extra_urls["subdivisions"] = f"{PLAYLISTS_API_BASE}/subdivisions.json"
+    if used_cities:
+        extra_urls["cities"] = f"{PLAYLISTS_API_BASE}/cities.json"
+    extra = _get_json_many(extra_urls, timeout)
+
     # Categories (liste courte, on les affiche toutes)
-    for c in _get_json(f"{PLAYLISTS_API_BASE}/categories.json", timeout):
+    for c in base["categories"]:
         slug = (c.get("id") or "").strip()
         name = (c.get("name") or slug).strip()
         if not slug or not name:
@@ -207,7 +450,10 @@ def _bucket_from_api(timeout: int) -> dict:
     lang_name: dict[str, str] = {}
     if used_languages:
         # languages.json est gros: on ne garde que les codes utilises
-        for l in _get_json(f"{PLAYLISTS_API_BASE}/languages.json", timeout):
+        languages = base["languages"]
+        if isinstance(languages, Exception):
+            raise languages
+        for l in languages:
             code = (l.get("code") or "").strip()
             if code in used_languages:
                 lang_name[code] = (l.get("name") or code).strip() or code
@@ -222,8 +468,7 @@ def _bucket_from_api(timeout: int) -> dict:
 
     # Countries (filtreees par feeds.json)
     country_name: dict[str, str] = {}
-    countries = _get_json(f"{PLAYLISTS_API_BASE}/countries.json", timeout)
-    for c in countries:
+    for c in base["countries"]:
         code = (c.get("code") or "").strip()
         if code:
             country_name[code] = (c.get("name") or code).strip() or code
@@ -237,7 +482,10 @@ def _bucket_from_api(timeout: int) -> dict:
     # Subdivisions (filtreees par feeds.json)
     if used_subdivisions:
         try:
-            for s in _get_json(f"{PLAYLISTS_API_BASE}/subdivisions.json", timeout):
+            subdivisions = extra.get("subdivisions")
+            if isinstance(subdivisions, Exception):
+                raise subdivisions
+            for s in subdivisions or []:
                 code = (s.get("code") or "").strip()
                 if code not in used_subdivisions:
                     continue
@@ -252,7 +500,10 @@ def _bucket_from_api(timeout: int) -> dict:
     # Cities (filtreees par feeds.json, fichier lourd -> optionnel)
     if used_cities:
         try:
-            for c in _get_json(f"{PLAYLISTS_API_BASE}/cities.json", timeout):
+            cities = extra.get("cities")
+            if isinstance(cities, Exception):
+                raise cities
+            for c in cities or []:
                 code = (c.get("code") or "").strip()
                 if code not in used_cities:
                     continue
@@ -265,54 +516,74 @@ def _bucket_from_api(timeout: int) -> dict:
             pass
 
     # Filtrage: garder uniquement les buckets non vides
-    return {k: v for k, v in buckets.items() if v}
+    return {k: list(v) for k, v in buckets.items() if v}
 
 
-def _bucket_from_md(timeout: int) -> dict:
-    """Fallback: parse PLAYLISTS.md si l'API est KO."""
-    text = requests.get(PLAYLISTS_MD_RAW, timeout=timeout).text
+def _bucket_from_md(timeout: int, cached: dict | None = None) -> dict:
+    """
+    Fallback: parse PLAYLISTS.md si l'API est KO.
+    `cached`: index précédent issu de PLAYLISTS.md; ses validateurs HTTP rendent la requête
+    conditionnelle et, sur 304, ses buckets sont réutilisés sans téléchargement ni parsing.
+    """
+    validators = (cached or {}).get("__md_validators__") or {}
+    headers = {}
+    if validators.get("etag"):
+        headers["If-None-Match"] = validators["etag"]
+    if validators.get("last_modified"):
+        headers["If-Modified-Since"] = validators["last_modified"]
+    r = http_session().get(PLAYLISTS_MD_RAW, headers=headers, timeout=timeout)
+    if r.status_code == 304 and cached:
+        return {k: v for k, v in cached.items() if not k.startswith("__")} | {"__md_validators__": validators}
+    data = r.content
     buckets = {"Category": [], "Language": [], "Country": [], "Subdivision/City": []}
 
+    def dec(b: bytes) -> str:
+        return b.decode("utf-8", "replace")
+
     section = None
     in_code_fence = False
 
-    for line in text.splitlines():
+    # Parcours en bytes: seuls les noms/URLs retenus sont décodés.
+    for line in data.splitlines():
         l = line.strip()
 
-        if "### Grouped by category" in l:
-            section = "Category"
-            continue
-        if "### Grouped by language" in l:
-            section = "Language"
-            continue
-        if "#### Countries" in l:
-            section = "Country"
-            continue
-        if "### Grouped by broadcast area" in l:
-            section = None
-            continue
+        # Titres de section: tous contiennent "###", test bon marché avant les comparaisons.
+        if b"###" in l:
+            if b"### Grouped by category" in l:
+                section = "Category"
+                continue
+            if b"### Grouped by language" in l:
+                section = "Language"
+                continue
+            if b"#### Countries" in l:
+                section = "Country"
+                continue
+            if b"### Grouped by broadcast area" in l:
+                section = None
+                continue
 
-        if l.startswith("```"):
+        if l.startswith(b"```"):
             in_code_fence = not in_code_fence
             continue
 
         if not section:
             continue
 
-        m = CODE_URL_RE.search(line)
+        # Pré-filtres par sous-chaîne: la plupart des lignes n'atteignent aucune regex.
+        m = CODE_URL_RE.search(line) if b"<" in line else None
         if m:
-            url = m.group(1).strip()
+            url = dec(m.group(1).strip())
 
             name = ""
             row_m = TR_ROW_RE.search(line)
             if row_m:
                 tds = TD_RE.findall(row_m.group(1))
                 if tds:
-                    name = strip_tags(tds[0])
+                    name = strip_tags(dec(tds[0]))
 
             if not name:
-                before = line.split("<code", 1)[0]
-                name = strip_tags(before).strip(" -|")
+                before = line.split(b"<code", 1)[0]
+                name = strip_tags(dec(before)).strip(" -|")
 
             if not name:
                 continue
@@ -323,12 +594,12 @@ def _bucket_from_md(timeout: int) -> dict:
                 buckets[section].append((name, url))
             continue
 
-        m = BT_URL_RE.search(line)
+        m = BT_URL_RE.search(line) if b"`" in line else None
         if m:
-            url = m.group(1).strip()
-            before = line.split("`", 1)[0]
-            name = before.strip().lstrip("-").strip()
-            name = re.sub(r"\s*\d+\s*$", "", name).strip()
+            url = dec(m.group(1).strip())
+            before = line.split(b"`", 1)[0]
+            name = before.strip().lstrip(b"-").strip()
+            name = dec(TRAIL_NUM_RE.sub(b"", name).strip())
             if not name:
                 continue
 
@@ -341,7 +612,7 @@ def _bucket_from_md(timeout: int) -> dict:
         if in_code_fence:
             m = PLAIN_URL_RE.match(line)
             if m:
-                url = m.group(1).strip()
+                url = dec(m.group(1).strip())
                 if section == "Category":
                     name = "Index (grouped by category)"
                 elif section == "Language":
@@ -353,22 +624,21 @@ def _bucket_from_md(timeout: int) -> dict:
                 buckets[section].append((name, url))
             continue
 
+    # Dédoublonnage en C, ordre d'insertion conservé
     for k in buckets:
-        seen = set()
-        out = []
-        for name, url in buckets[k]:
-            key = (name, url)
-            if key not in seen:
-                seen.add(key)
-                out.append((name, url))
-        buckets[k] = out
+        buckets[k] = list(dict.fromkeys(buckets[k]))
 
+    buckets["__md_validators__"] = {
+        "etag": r.headers.get("ETag", ""),
+        "last_modified": r.headers.get("Last-Modified", ""),
+    }
     return buckets
 
 
-def fetch_playlists_index(timeout=15) -> dict:
+def fetch_playlists_index(timeout=15, cached: dict | None = None) -> dict:
     """
     Charge d'abord depuis iptv-org/api (JSON cat/lang/pays/subdivisions), puis fallback sur PLAYLISTS.md.
+    `cached` (index du cache disque) permet une revalidation conditionnelle de PLAYLISTS.md.
     """
     api_err = None
     try:
@@ -380,7 +650,7 @@ def fetch_playlists_index(timeout=15) -> dict:
         api_err = e
 
     try:
-        buckets = _bucket_from_md(timeout)
+        buckets = _bucket_from_md(timeout, cached if cached and cached.get("__source__") == "md" else None)
         buckets["__source__"] = "md"
         return buckets
     except Exception as md_err:
@@ -389,6 +659,34 @@ def fetch_playlists_index(timeout=15) -> dict:
         raise
 
 
+def load_playlists_index_cache(path: Path) -> dict | None:
+    """Index de playlists enregistré par save_playlists_index_cache (None si absent/illisible)."""
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+        buckets = data["buckets"]
+        idx = {k: [tuple(it) for it in v] for k, v in buckets.items() if isinstance(v, list)}
+        idx["__source__"] = buckets.get("__source__", "")
+        if isinstance(buckets.get("__md_validators__"), dict):
+            idx["__md_validators__"] = buckets["__md_validators__"]
+        idx["__fetched_at__"] = float(data.get("fetched_at") or 0)
+        return idx
+    except Exception:
+        return None
+
+
+def save_playlists_index_cache(path: Path, idx: dict) -> None:
+    """Écriture atomique (tmp + os.replace) de l'index, pour un affichage immédiat au prochain démarrage."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        buckets = {k: v for k, v in idx.items() if k != "__fetched_at__"}
+        tmp = path.with_suffix(".tmp")
+        payload = {"fetched_at": time.time(), "buckets": buckets}
+        tmp.write_text(json.dumps(payload, ensure_ascii=False, separators=(",", ":")), encoding="utf-8")
+        os.replace(tmp, path)
+    except Exception:
+        pass
+
+
 # =========================
 # Feeds dialog (advanced listing + multi-criteria filtreers)
 # =========================
@@ -477,6 +775,8 @@ class FeedsDialog(QtWidgets.QDialog):
         self.tbl.setSortingEnabled(True)
         self.tbl.verticalHeader().setVisible(False)
         self.tbl.horizontalHeader().setStretchLastSection(True)
+        # Ajustement des colonnes mesuré sur 200 lignes au plus (jusqu'à 5000 affichées)
+        self.tbl.horizontalHeader().setResizeContentsPrecision(200)
         layout.addWidget(self.tbl, 1)
 
         # Signals
@@ -529,7 +829,7 @@ class FeedsDialog(QtWidgets.QDialog):
             except Exception as e:
                 self.feeds_error.emit(str(e))
 
-        threading.Thread(target=run, daemon=True).start()
+        run_pooled(self, run)
 
 
 class StreamsDialog(QtWidgets.QWidget):
@@ -621,6 +921,8 @@ class StreamsDialog(QtWidgets.QWidget):
         self.tbl.setSortingEnabled(True)
         self.tbl.verticalHeader().setVisible(False)
         self.tbl.horizontalHeader().setStretchLastSection(True)
+        # Ajustement des colonnes mesuré sur 200 lignes au plus (jusqu'à 5000 affichées)
+        self.tbl.horizontalHeader().setResizeContentsPrecision(200)
         layout.addWidget(self.tbl, 1)
 
         # Signals
@@ -714,7 +1016,7 @@ class StreamsDialog(QtWidgets.QWidget):
             except Exception as e:
                 self.streams_error.emit(str(e))
 
-        threading.Thread(target=run, daemon=True).start()
+        run_pooled(self, run)
 
     @QtCore.Slot(str)
     def _feeds_on_error(self, err: str):
@@ -935,53 +1237,59 @@ class StreamsDialog(QtWidgets.QWidget):
 
     def _render_table(self):
         self.tbl.setSortingEnabled(False)
-        feed_meta = self._meta.get("feed_meta") or {}
-        country_name = self._meta.get("country_name") or {}
-
-        self.tbl.setRowCount(len(self._visible_rows))
-        for r, src_i in enumerate(self._visible_rows):
-            s = self._streams_all[src_i]
-            title = (s.get("title") or "").strip()
-            ch = (s.get("channel") or "").strip()
-            fid = (s.get("feed") or "").strip()
-            quality = (s.get("quality") or "").strip()
-            url = (s.get("url") or "").strip()
-            parsed = urlparse(url)
-            host = (parsed.hostname or "").strip()
-
-            countries, langs = self._stream_countries_langs(s)
-            countries_txt = ", ".join([f"{country_name.get(c) or c} ({c})" for c in countries]) if countries else ""
-            langs_txt = ", ".join(langs) if langs else ""
-
-            opts = []
-            if (s.get("referrer") or "").strip():
-                opts.append("referrer")
-            if (s.get("user_agent") or "").strip():
-                opts.append("ua")
-
-            title_item = QtWidgets.QTableWidgetItem(title or "(sans titre)")
-            title_item.setData(QtCore.Qt.ItemDataRole.UserRole, int(src_i))
-
-            # Tooltip: show feed name if known
-            try:
-                meta = feed_meta.get((ch, fid)) if ch and fid else None
-                if meta:
-                    title_item.setToolTip(f"feed_name={meta.get('name')}\nformat={meta.get('format')}\ntimezones={','.join(meta.get('timezones') or [])}")
-            except Exception:
-                pass
+        self.tbl.setUpdatesEnabled(False)
+        try:
+            feed_meta = self._meta.get("feed_meta") or {}
+            country_name = self._meta.get("country_name") or {}
+            Item, set_item = QtWidgets.QTableWidgetItem, self.tbl.setItem
+
+            self.tbl.setRowCount(len(self._visible_rows))
+            for r, src_i in enumerate(self._visible_rows):
+                s = self._streams_all[src_i]
+                title = (s.get("title") or "").strip()
+                ch = (s.get("channel") or "").strip()
+                fid = (s.get("feed") or "").strip()
+                quality = (s.get("quality") or "").strip()
+                url = (s.get("url") or "").strip()
+                parsed = urlparse(url)
+                host = (parsed.hostname or "").strip()
+
+                countries, langs = self._stream_countries_langs(s)
+                countries_txt = ", ".join([f"{country_name.get(c) or c} ({c})" for c in countries]) if countries else ""
+                langs_txt = ", ".join(langs) if langs else ""
+
+                opts = []
+                if (s.get("referrer") or "").strip():
+                    opts.append("referrer")
+                if (s.get("user_agent") or "").strip():
+                    opts.append("ua")
+
+                title_item = Item(title or "(sans titre)")
+                title_item.setData(QtCore.Qt.ItemDataRole.UserRole, int(src_i))
+
+                # Tooltip: show feed name if known
+                try:
+                    meta = feed_meta.get((ch, fid)) if ch and fid else None
+                    if meta:
+                        title_item.setToolTip(f"feed_name={meta.get('name')}\nformat={meta.get('format')}\ntimezones={','.join(meta.get('timezones') or [])}")
+                except Exception:
+                    pass
 
-            self.tbl.setItem(r, 0, title_item)
-            self.tbl.setItem(r, 1, QtWidgets.QTableWidgetItem(ch))
-            self.tbl.setItem(r, 2, QtWidgets.QTableWidgetItem(fid))
-            self.tbl.setItem(r, 3, QtWidgets.QTableWidgetItem(quality))
-            self.tbl.setItem(r, 4, QtWidgets.QTableWidgetItem(countries_txt))
-            self.tbl.setItem(r, 5, QtWidgets.QTableWidgetItem(langs_txt))
-            self.tbl.setItem(r, 6, QtWidgets.QTableWidgetItem(host))
-            self.tbl.setItem(r, 7, QtWidgets.QTableWidgetItem(url))
-            self.tbl.setItem(r, 8, QtWidgets.QTableWidgetItem(", ".join(opts)))
-
-        self.tbl.resizeColumnsToContents()
-        self.tbl.setSortingEnabled(True)
+                set_item(r, 0, title_item)
+                set_item(r, 1, Item(ch))
+                set_item(r, 2, Item(fid))
+                set_item(r, 3, Item(quality))
+                set_item(r, 4, Item(countries_txt))
+                set_item(r, 5, Item(langs_txt))
+                set_item(r, 6, Item(host))
+                set_item(r, 7, Item(url))
+                set_item(r, 8, Item(", ".join(opts)))
+
+            self.tbl.resizeColumnsToContents()
+        finally:
+            # Un flux malformé ne doit pas laisser la table figée (tri/rafraîchissement coupés).
+            self.tbl.setSortingEnabled(True)
+            self.tbl.setUpdatesEnabled(True)
 
     def _selected_streams(self) -> list[dict]:
         sel = self.tbl.selectionModel().selectedRows()
@@ -1179,54 +1487,60 @@ class StreamsDialog(QtWidgets.QWidget):
 
     def _feeds_render_table(self):
         self.tbl.setSortingEnabled(False)
-        self.tbl.setRowCount(len(self._visible_rows))
-        for r, src_i in enumerate(self._visible_rows):
-            f = self._feeds_all[src_i]
-            name = (f.get("name") or "").strip()
-            channel = (f.get("channel") or "").strip()
-            feed_id = (f.get("id") or "").strip()
-            is_main = "Yes" if f.get("is_main") else ""
-
-            # UX: dans beaucoup de cas `name` correspond à une zone (souvent un pays/ville).
-            # On préfixe donc par le channel pour que la colonne "Nom" soit plus parlante.
-            display_name = name
-            if channel and name and channel.lower() not in name.lower():
-                display_name = f"{channel} — {name}"
-            elif channel and not name:
-                display_name = channel
-            elif (not channel) and not name:
-                display_name = "(sans nom)"
-
-            countries = []
-            for area in (f.get("broadcast_area") or []):
-                if isinstance(area, str) and area.startswith("c/") and len(area) > 2:
-                    countries.append(area[2:])
-            countries_txt = ", ".join(sorted(set(countries)))
-
-            langs_txt = ", ".join([str(x) for x in (f.get("languages") or []) if x])
-            tz_txt = ", ".join([str(x) for x in (f.get("timezones") or []) if x])
-            fmt = (f.get("format") or "").strip()
-
-            name_item = QtWidgets.QTableWidgetItem(display_name)
-            name_item.setData(QtCore.Qt.ItemDataRole.UserRole, int(src_i))
-            # Détails complets en tooltip
-            try:
-                ba_txt = ", ".join([str(x) for x in (f.get("broadcast_area") or []) if x])
-                tt = f"channel={channel}\nfeed={feed_id}\nname={name}\narea={ba_txt}"
-                name_item.setToolTip(tt)
-            except Exception:
-                pass
-            self.tbl.setItem(r, 0, name_item)
-            self.tbl.setItem(r, 1, QtWidgets.QTableWidgetItem(channel))
-            self.tbl.setItem(r, 2, QtWidgets.QTableWidgetItem(feed_id))
-            self.tbl.setItem(r, 3, QtWidgets.QTableWidgetItem(is_main))
-            self.tbl.setItem(r, 4, QtWidgets.QTableWidgetItem(countries_txt))
-            self.tbl.setItem(r, 5, QtWidgets.QTableWidgetItem(langs_txt))
-            self.tbl.setItem(r, 6, QtWidgets.QTableWidgetItem(tz_txt))
-            self.tbl.setItem(r, 7, QtWidgets.QTableWidgetItem(fmt))
-
-        self.tbl.resizeColumnsToContents()
-        self.tbl.setSortingEnabled(True)
+        self.tbl.setUpdatesEnabled(False)
+        try:
+            Item, set_item = QtWidgets.QTableWidgetItem, self.tbl.setItem
+            self.tbl.setRowCount(len(self._visible_rows))
+            for r, src_i in enumerate(self._visible_rows):
+                f = self._feeds_all[src_i]
+                name = (f.get("name") or "").strip()
+                channel = (f.get("channel") or "").strip()
+                feed_id = (f.get("id") or "").strip()
+                is_main = "Yes" if f.get("is_main") else ""
+
+                # UX: dans beaucoup de cas `name` correspond à une zone (souvent un pays/ville).
+                # On préfixe donc par le channel pour que la colonne "Nom" soit plus parlante.
+                display_name = name
+                if channel and name and channel.lower() not in name.lower():
+                    display_name = f"{channel} — {name}"
+                elif channel and not name:
+                    display_name = channel
+                elif (not channel) and not name:
+                    display_name = "(sans nom)"
+
+                countries = []
+                for area in (f.get("broadcast_area") or []):
+                    if isinstance(area, str) and area.startswith("c/") and len(area) > 2:
+                        countries.append(area[2:])
+                countries_txt = ", ".join(sorted(set(countries)))
+
+                langs_txt = ", ".join([str(x) for x in (f.get("languages") or []) if x])
+                tz_txt = ", ".join([str(x) for x in (f.get("timezones") or []) if x])
+                fmt = (f.get("format") or "").strip()
+
+                name_item = Item(display_name)
+                name_item.setData(QtCore.Qt.ItemDataRole.UserRole, int(src_i))
+                # Détails complets en tooltip
+                try:
+                    ba_txt = ", ".join([str(x) for x in (f.get("broadcast_area") or []) if x])
+                    tt = f"channel={channel}\nfeed={feed_id}\nname={name}\narea={ba_txt}"
+                    name_item.setToolTip(tt)
+                except Exception:
+                    pass
+                set_item(r, 0, name_item)
+                set_item(r, 1, Item(channel))
+                set_item(r, 2, Item(feed_id))
+                set_item(r, 3, Item(is_main))
+                set_item(r, 4, Item(countries_txt))
+                set_item(r, 5, Item(langs_txt))
+                set_item(r, 6, Item(tz_txt))
+                set_item(r, 7, Item(fmt))
+
+            self.tbl.resizeColumnsToContents()
+        finally:
+            # Un feed malformé ne doit pas laisser la table figée (tri/rafraîchissement coupés).
+            self.tbl.setSortingEnabled(True)
+            self.tbl.setUpdatesEnabled(True)
 
     def _feeds_selected_feeds(self) -> list[dict]:
         sel = self.tbl.selectionModel().selectedRows()
@@ -1275,13 +1589,64 @@ class StreamsDialog(QtWidgets.QWidget):
                 QtCore.QTimer.singleShot(0, self, lambda: self.btn_import.setEnabled(True))
                 QtCore.QTimer.singleShot(0, self, lambda: self._feeds_apply_filtreers())
 
-        threading.Thread(target=run, daemon=True).start()
+        run_pooled(self, run)
 
 
 # =========================
 # EPG Guide Dialog
 # =========================
 
+@lru_cache(maxsize=8192)
+def _fmt_epg_ts(ts: int) -> str:
+    # Les fins/débuts de programmes adjacents se répètent: un seul strftime par horodatage.
+    return time.strftime("%Y-%m-%d %H:%M", time.localtime(ts))
+
+
+class EpgProgramsModel(QtCore.QAbstractTableModel):
+    """Programmes EPG (Début, Fin, Titre) servis à la demande: un reset par rafraîchissement, aucun item par cellule."""
+
+    HEADERS = ("Début", "Fin", "Titre")
+
+    def __init__(self, fmt_ts, parent: QtCore.QObject | None = None):
+        super().__init__(parent)
+        self._fmt_ts = fmt_ts
+        self._rows: list[dict] = []
+        self._times: list[tuple[str, str]] = []  # (début, fin) formatés, parallèle à _rows
+
+    def set_rows(self, rows: list[dict]):
+        # Colonnes horaires formatées en un seul passage (horodatages uniques seulement),
+        # data() n'est plus qu'une lecture de liste pendant le défilement/redimensionnement.
+        fmt = self._fmt_ts
+        unique = {ts: fmt(ts) for p in rows for ts in (p["start_ts"], p["stop_ts"])}
+        self.beginResetModel()
+        self._rows = rows
+        self._times = [(unique[p["start_ts"]], unique[p["stop_ts"]]) for p in rows]
+        self.endResetModel()
+
+    def times(self, row: int) -> tuple[str, str]:
+        """(début, fin) déjà formatés de la ligne `row`."""
+        return self._times[row]
+
+    def rowCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index: QtCore.QModelIndex, role: int = QtCore.Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or role != QtCore.Qt.ItemDataRole.DisplayRole:
+            return None
+        row, col = index.row(), index.column()
+        if col < 2:
+            return self._times[row][col]
+        return self._rows[row].get("title", "") or ""
+
+    def headerData(self, section: int, orientation: QtCore.Qt.Orientation, role: int = QtCore.Qt.ItemDataRole.DisplayRole):
+        if orientation == QtCore.Qt.Orientation.Horizontal and role == QtCore.Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+
 class EpgDialog(QtWidgets.QDialog):
     """Modal dialog to browse EPG entries for a single tvg-id."""
 
@@ -1291,6 +1656,9 @@ class EpgDialog(QtWidgets.QDialog):
         self.tvg_id = tvg_id
         self.channel_name = channel_name
         self._rows: list[dict] = []
+        # (tvg_id, heures, tranche de 5 min, version du guide) -> programmes: un nouveau clic sur
+        # « Afficher » dans la même tranche ne relance pas la requête; un import XMLTV change la clé.
+        self._epg_cache: dict[tuple[str, int, int, int], list[dict]] = {}
 
         self.setWindowTitle(f"Guide EPG — {channel_name} ({tvg_id})")
         self.resize(950, 650)
@@ -1312,48 +1680,65 @@ class EpgDialog(QtWidgets.QDialog):
         top.addStretch(1)
         top.addWidget(self.btn_refresh)
 
-        self.table = QtWidgets.QTableWidget(0, 3)
-        self.table.setHorizontalHeaderLabels(["Début", "Fin", "Titre"])
+        self.model = EpgProgramsModel(self._fmt_ts, self)
+        self.table = QtWidgets.QTableView()
+        self.table.setModel(self.model)
         self.table.horizontalHeader().setStretchLastSection(True)
+        # Hauteur de ligne fixe: pas de mesure par ligne
+        self.table.verticalHeader().setSectionResizeMode(QtWidgets.QHeaderView.ResizeMode.Fixed)
+        # Largeurs mesurées sur 100 lignes au plus (horaires à format fixe), pas sur les 2000 programmes
+        self.table.horizontalHeader().setResizeContentsPrecision(100)
+        self.table.setMouseTracking(False)
         self.table.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectionBehavior.SelectRows)
         self.table.setEditTriggers(QtWidgets.QAbstractItemView.EditTrigger.NoEditTriggers)
         layout.addWidget(self.table, 1)
 
-        self.desc = QtWidgets.QPlainTextEdit()
-        self.desc.setReadOnly(True)
-        self.desc.setMaximumBlockCount(3000)
-        layout.addWidget(self.desc, 0)
+        # Texte statique de quelques centaines de caractères: un QLabel évite le QTextDocument éditable
+        # (mise en page, curseur, blocs) reconstruit à chaque sélection. Texte brut: pas d'interprétation HTML.
+        self.desc = QtWidgets.QLabel()
+        self.desc.setTextFormat(QtCore.Qt.TextFormat.PlainText)
+        self.desc.setWordWrap(True)
+        self.desc.setAlignment(QtCore.Qt.AlignmentFlag.AlignLeft | QtCore.Qt.AlignmentFlag.AlignTop)
+        self.desc.setTextInteractionFlags(QtCore.Qt.TextInteractionFlag.TextSelectableByMouse)
+        desc_scroll = QtWidgets.QScrollArea()
+        desc_scroll.setWidgetResizable(True)
+        desc_scroll.setWidget(self.desc)
+        layout.addWidget(desc_scroll, 0)
 
         self.btn_refresh.clicked.connect(self.refresh)
-        self.table.itemSelectionChanged.connect(self._on_select)
+        self.table.selectionModel().selectionChanged.connect(self._on_select)
 
         self.refresh()
 
-    def _fmt_ts(self, ts: int) -> str:
-        return time.strftime("%Y-%m-%d %H:%M", time.localtime(int(ts)))
+    @staticmethod
+    def _fmt_ts(ts: int) -> str:
+        return _fmt_epg_ts(int(ts))
 
     def refresh(self):
         # ✅ plage: maintenant -> maintenant + N heures
         start_ts = int(time.time())
-        stop_ts = start_ts + int(self.hours.value()) * 3600
-
-        self._rows = self.db.list_epg_programs(self.tvg_id, start_ts, stop_ts, limit=2000)
-
-        self.table.setRowCount(len(self._rows))
-        for i, p in enumerate(self._rows):
-            self.table.setItem(i, 0, QtWidgets.QTableWidgetItem(self._fmt_ts(p["start_ts"])))
-            self.table.setItem(i, 1, QtWidgets.QTableWidgetItem(self._fmt_ts(p["stop_ts"])))
-            self.table.setItem(i, 2, QtWidgets.QTableWidgetItem(p.get("title", "") or ""))
-
+        hours = int(self.hours.value())
+        stop_ts = start_ts + hours * 3600
+
+        key = (self.tvg_id, hours, start_ts // 300, self.db.epg_version)
+        rows = self._epg_cache.get(key)
+        if rows is None:
+            rows = self.db.list_epg_programs(self.tvg_id, start_ts, stop_ts, limit=2000)
+            if len(self._epg_cache) >= 16:
+                self._epg_cache.clear()
+            self._epg_cache[key] = rows
+        self._rows = rows
+
+        self.model.set_rows(self._rows)
         self.table.resizeColumnsToContents()
 
         if not self._rows:
-            self.desc.setPlainText("(Aucun programme dans cette plage.)")
+            self.desc.setText("(Aucun programme dans cette plage.)")
         else:
-            self.desc.setPlainText("Sélectionne une émission pour voir la description.")
+            self.desc.setText("Sélectionne une émission pour voir la description.")
 
 
-    def _on_select(self):
+    def _on_select(self, *_):
         sel = self.table.selectionModel().selectedRows()
         if not sel:
             return
@@ -1362,19 +1747,461 @@ class EpgDialog(QtWidgets.QDialog):
             return
 
         p = self._rows[r]
-        st = self._fmt_ts(p["start_ts"])
-        en = self._fmt_ts(p["stop_ts"])
+        st, en = self.model.times(r)  # formatés une fois dans set_rows()
         title = (p.get("title") or "").strip()
         desc = (p.get("desc") or "").strip()
 
         txt = f"{st} → {en}\n{title}\n\n{desc}" if desc else f"{st} → {en}\n{title}"
-        self.desc.setPlainText(txt)
+        self.desc.setText(txt)
+
+
+# =========================
+# Info tab
+# =========================
+
+INFO_HTML = """
+<h3>Liens GitHub</h3>
+<ul>
+  <li><a href="https://github.com/iptv-org/iptv">iptv-org/iptv</a></li>
+  <li><a href="https://github.com/iptv-org/api">iptv-org/api</a></li>
+  <li><a href="https://github.com/iptv-org/epg">iptv-org/epg</a></li>
+</ul>
+<p>Un grand merci aux créateurs et mainteneurs d'<a href="https://github.com/iptv-org">iptv-org</a> pour leur travail communautaire sur les playlists et l'API.</p>
+<h3>Raccourcis lecteur</h3>
+<ul>
+  <li><b>F</b> : plein écran / sortie</li>
+  <li><b>C</b> : afficher/masquer la barre en plein écran</li>
+  <li><b>Espace</b> ou <b>K</b> : play/pause</li>
+  <li><b>M</b> : mute</li>
+  <li><b>↑</b> / <b>+</b> / <b>=</b> : volume +5</li>
+  <li><b>↓</b> / <b>-</b> : volume -5</li>
+  <li><b>→</b> : chaîne suivante</li>
+  <li><b>←</b> : chaîne précédente</li>
+  <li><b>L</b> : avance rapide (10 s)</li>
+  <li><b>J</b> : retour en arrière (10 s)</li>
+</ul>
+"""
+
+_INFO_DOC: QtGui.QTextDocument | None = None
+
+
+def info_document() -> QtGui.QTextDocument:
+    """
+    Document Info parsé une seule fois (au premier appel: un QTextDocument exige une QApplication,
+    donc pas à l'import du module). Chaque vue reçoit un clone.
+    """
+    global _INFO_DOC
+    if _INFO_DOC is None:
+        _INFO_DOC = QtGui.QTextDocument()
+        _INFO_DOC.setHtml(INFO_HTML)
+    return _INFO_DOC
+
+
+# =========================
+# Channels table delegate
+# =========================
+
+class CachedCellDelegate(QtWidgets.QStyledItemDelegate):
+    """
+    Delegate qui mémorise le rendu de chaque cellule dans QPixmapCache.
+    Au scroll/repaint, une cellule inchangée est simplement recopiée au lieu d'être redessinée.
+    dataChanged n'invalide que sa plage: estampille par cellule pour une petite plage, génération
+    par colonne pour une grande (ex: colonne Statut après un lot de sondes); un changement de
+    structure (reset, layout, insert/remove) incrémente une génération globale.
+    """
+
+    # Plage au-delà de laquelle on invalide des colonnes entières plutôt que cellule par cellule
+    _MAX_SPAN_CELLS = 512
+    # Nombre d'estampilles conservées avant de repartir d'une génération globale
+    _MAX_CELL_STAMPS = 4096
+
+    def __init__(self, parent: QtCore.QObject | None = None):
+        super().__init__(parent)
+        self._generation = 0
+        self._col_generations: dict[int, int] = {}
+        self._cell_stamps: dict[tuple[int, int], int] = {}
+        self._stamp = 0
+        QtGui.QPixmapCache.setCacheLimit(32 * 1024)  # KB
+
+    def invalidate(self, *_):
+        self._generation += 1
+        self._col_generations.clear()
+        self._cell_stamps.clear()
+
+    def invalidate_span(self, top_left: QtCore.QModelIndex, bottom_right: QtCore.QModelIndex, *_):
+        if not top_left.isValid() or not bottom_right.isValid():
+            self.invalidate()
+            return
+        rows = range(top_left.row(), bottom_right.row() + 1)
+        cols = range(top_left.column(), bottom_right.column() + 1)
+        if len(rows) * len(cols) > self._MAX_SPAN_CELLS:
+            gens = self._col_generations
+            for c in cols:
+                gens[c] = gens.get(c, 0) + 1
+            return
+        if len(self._cell_stamps) + len(rows) * len(cols) > self._MAX_CELL_STAMPS:
+            self.invalidate()
+            return
+        self._stamp += 1
+        stamps = self._cell_stamps
+        for r in rows:
+            for c in cols:
+                stamps[(r, c)] = self._stamp
+
+    def watch(self, model: QtCore.QAbstractItemModel):
+        model.dataChanged.connect(self.invalidate_span)
+        for sig in (
+            model.modelReset,
+            model.layoutChanged,
+            model.rowsInserted,
+            model.rowsRemoved,
+        ):
+            sig.connect(self.invalidate)
+
+    def paint(self, painter: QtGui.QPainter, option: QtWidgets.QStyleOptionViewItem, index: QtCore.QModelIndex):
+        rect = option.rect
+        if rect.isEmpty():
+            super().paint(painter, option, index)
+            return
+
+        row, col = index.row(), index.column()
+        key = (
+            f"ch:{self._generation}.{self._col_generations.get(col, 0)}.{self._cell_stamps.get((row, col), 0)}:"
+            f"{row}:{col}:{int(option.state.value)}:"
+            f"{rect.width()}x{rect.height()}:{option.palette.cacheKey()}"
+        )
+        pix = QtGui.QPixmapCache.find(key)
+        if pix is None:
+            dev = painter.device()
+            dpr = dev.devicePixelRatioF() if dev is not None else 1.0
+            pix = QtGui.QPixmap(rect.size() * dpr)
+            pix.setDevicePixelRatio(dpr)
+            pix.fill(QtCore.Qt.GlobalColor.transparent)
+
+            opt = QtWidgets.QStyleOptionViewItem(option)
+            opt.rect = QtCore.QRect(QtCore.QPoint(0, 0), rect.size())
+            p = QtGui.QPainter(pix)
+            try:
+                super().paint(p, opt, index)
+            finally:
+                p.end()
+            QtGui.QPixmapCache.insert(key, pix)
+
+        painter.drawPixmap(rect.topLeft(), pix)
+
+
+class LogView(QtWidgets.QPlainTextEdit):
+    """
+    Journal en lecture seule borné à `max_blocks` lignes.
+    Au lieu de setMaximumBlockCount (qui décale le document à chaque ajout au-delà du plafond),
+    on laisse dépasser de `trim_chunk` lignes puis on supprime ce paquet en une seule opération.
+    """
+
+    def __init__(self, max_blocks: int = 3000, trim_chunk: int = 500, parent: QtWidgets.QWidget | None = None):
+        super().__init__(parent)
+        self._max_blocks = max_blocks
+        self._trim_chunk = trim_chunk
+        self.setReadOnly(True)
+        self.setUndoRedoEnabled(False)
+
+    def appendPlainText(self, text: str):
+        super().appendPlainText(text)
+        self._trim()
+
+    def _trim(self):
+        excess = self.blockCount() - self._max_blocks
+        if excess <= self._trim_chunk:
+            return
+        cursor = QtGui.QTextCursor(self.document())
+        cursor.movePosition(QtGui.QTextCursor.MoveOperation.Start)
+        cursor.movePosition(
+            QtGui.QTextCursor.MoveOperation.NextBlock,
+            QtGui.QTextCursor.MoveMode.KeepAnchor,
+            excess,
+        )
+        cursor.removeSelectedText()
+
+
+def _channel_haystack(ch: Channel) -> str:
+    """Texte minuscule sur lequel porte le filtre de la table chaînes (mémorisé sur la chaîne)."""
+    hay = ch._search_hay
+    if not hay:
+        hay = ch._search_hay = (
+            f"{ch.name} {ch.group} {ch.tvg_id} {ch.status} {ch.url} {ch.risk_level} {ch.risk_reasons} {ch.risk_score}".lower()
+        )
+    return hay
+
+
+def _channel_name_cell(ch: Channel) -> str:
+    return (ch.name or "") + " [OPT]" if getattr(ch, "vlc_opts", None) else ch.name
+
+
+def _channel_risk_cell(ch: Channel) -> str:
+    return f"{ch.risk_badge} {ch.risk_level} ({int(round(ch.risk_score))}/100)"
+
+
+# Colonnes écrites par Storage.replace_channel_rows(), dans l'ordre attendu.
+_CHANNEL_ROW = attrgetter("name", "group", "tvg_id", "url", "extinf", "vlc_opts")
+
+
+def _join_haystacks(hays: list[str]) -> tuple[str, list[int]]:
+    """Colonne de textes en un seul bloc (séparateur \x00) + position de début de chaque ligne."""
+    starts: list[int] = []
+    pos = 0
+    for hay in hays:
+        starts.append(pos)
+        pos += len(hay) + 1
+    return "\x00".join(hays), starts
+
+
+def _rows_containing(blob: str, starts: list[int], needle: str) -> Iterator[int]:
+    """Indices des lignes contenant needle: un str.find par occurrence, pas un test par ligne."""
+    pos = blob.find(needle)
+    while pos >= 0:
+        row = bisect_right(starts, pos) - 1
+        yield row
+        if row + 1 >= len(starts):
+            return
+        pos = blob.find(needle, starts[row + 1])
+
+
+class ChannelTableModel(QtCore.QAbstractTableModel):
+    """
+    Modèle virtuel de la table chaînes: la vue ne demande que les cellules visibles,
+    et remplacer la liste affichée se résume à un reset (aucun item Qt alloué par cellule).
+    """
+
+    HEADERS = ("Nom", "Groupe", "tvg-id", "Risque", "Raisons", "Statut", "URL")
+    DEFAULT_WIDTHS = (260, 140, 140, 180, 300, 80, 420)  # px, quand la mesure au contenu serait trop chère
+    COL_STATUS = 5
+    _CELL = (
+        _channel_name_cell,
+        lambda ch: ch.group,
+        lambda ch: ch.tvg_id,
+        _channel_risk_cell,
+        lambda ch: ch.risk_reasons,
+        lambda ch: ch.status,
+        lambda ch: ch.url,
+    )
+
+    def __init__(self, parent: QtCore.QObject | None = None):
+        super().__init__(parent)
+        self._rows: list[Channel] = []
+
+    def set_rows(self, rows: list[Channel]):
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+
+    def channel(self, row: int) -> Channel | None:
+        return self._rows[row] if 0 <= row < len(self._rows) else None
+
+    def refresh_span(self, first_row: int, last_row: int, col: int):
+        last_row = min(last_row, len(self._rows) - 1)
+        if 0 <= first_row <= last_row:
+            self.dataChanged.emit(
+                self.index(first_row, col), self.index(last_row, col), [QtCore.Qt.ItemDataRole.DisplayRole]
+            )
+
+    def refresh_columns(self, first: int, last: int):
+        if self._rows:
+            self.dataChanged.emit(self.index(0, first), self.index(len(self._rows) - 1, last))
+
+    def rowCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index: QtCore.QModelIndex, role: int = QtCore.Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        ch = self._rows[index.row()]
+        col = index.column()
+        if role == QtCore.Qt.ItemDataRole.DisplayRole:
+            return self._CELL[col](ch)
+        if role == QtCore.Qt.ItemDataRole.ToolTipRole:
+            if col == 0 and getattr(ch, "vlc_opts", None):
+                return "Options VLC:\n" + "\n".join(str(o) for o in ch.vlc_opts)
+            if col == 3 and ch.risk_reasons:
+                return ch.risk_reasons
+        return None
+
+    def headerData(self, section: int, orientation: QtCore.Qt.Orientation, role: int = QtCore.Qt.ItemDataRole.DisplayRole):
+        if orientation == QtCore.Qt.Orientation.Horizontal and role == QtCore.Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+
+class PlaylistIndexModel(QtCore.QAbstractItemModel):
+    """
+    Index des playlists sur deux niveaux (bucket -> (nom, url)) adossé à de simples listes Python:
+    aucun QTreeWidgetItem alloué par playlist. internalId = 0 pour un bucket, n° de bucket + 1 pour un enfant.
+    Le tri est fait ici (permutations de listes) et non par le proxy, qui appellerait data() à chaque
+    comparaison; les positions « à plat » (flat_row) restent celles du chargement quel que soit le tri.
+    """
+
+    HEADERS = ("Playlist", "URL")
+
+    def __init__(self, parent: QtCore.QObject | None = None):
+        super().__init__(parent)
+        self._buckets: list[tuple[str, list[tuple[str, str]]]] = []
+        self._offsets: list[int] = []  # position du premier enfant de chaque bucket dans la liste à plat
+        self._top_order: list[int] = []  # ligne affichée -> n° de bucket
+        self._child_order: list[list[int]] = []  # par bucket: ligne affichée -> position de chargement
+        self._sort: tuple[int, QtCore.Qt.SortOrder] | None = None
+
+    def set_buckets(self, buckets: list[tuple[str, list[tuple[str, str]]]]):
+        self.beginResetModel()
+        self._buckets = buckets
+        self._offsets = []
+        total = 0
+        for _, items in buckets:
+            self._offsets.append(total)
+            total += len(items)
+        self._top_order, self._child_order = self._orders(self._sort)
+        self.endResetModel()
+
+    def _orders(self, sort: tuple[int, QtCore.Qt.SortOrder] | None) -> tuple[list[int], list[list[int]]]:
+        buckets = self._buckets
+        if sort is None:
+            return list(range(len(buckets))), [list(range(len(items))) for _, items in buckets]
+        column, order = sort
+        reverse = order == QtCore.Qt.SortOrder.DescendingOrder
+        # Les buckets n'ont pas d'URL: ils restent classés par titre.
+        tops = sorted(range(len(buckets)), key=lambda b: buckets[b][0], reverse=reverse and column == 0)
+        children = [
+            sorted(range(len(items)), key=lambda i, items=items: items[i][column], reverse=reverse)
+            for _, items in buckets
+        ]
+        return tops, children
+
+    def sort(self, column: int, order: QtCore.Qt.SortOrder = QtCore.Qt.SortOrder.AscendingOrder):
+        if column < 0 or column >= len(self.HEADERS):
+            return
+        self._sort = (column, order)
+        self.layoutAboutToBeChanged.emit()
+        old_top, old_children = self._top_order, self._child_order
+        self._top_order, self._child_order = self._orders(self._sort)
+        # Sélection/dépliage conservés: chaque index persistant suit sa playlist.
+        top_pos = {b: r for r, b in enumerate(self._top_order)}
+        child_pos = [{i: r for r, i in enumerate(order_)} for order_ in self._child_order]
+        old_list = self.persistentIndexList()
+        new_list = []
+        for idx in old_list:
+            bucket_id = idx.internalId()
+            if bucket_id:
+                b = bucket_id - 1
+                new_list.append(self.createIndex(child_pos[b][old_children[b][idx.row()]], idx.column(), bucket_id))
+            else:
+                new_list.append(self.createIndex(top_pos[old_top[idx.row()]], idx.column(), 0))
+        self.changePersistentIndexList(old_list, new_list)
+        self.layoutChanged.emit()
+
+    def iter_flat(self):
+        """(bucket, nom, url) de chaque playlist, dans l'ordre à plat de flat_row()."""
+        for title, items in self._buckets:
+            for name, url in items:
+                yield title, name, url
+
+    def flat_row(self, bucket_row: int, row: int) -> int:
+        """Position à plat (ordre de chargement) de la ligne `row` sous le bucket affiché en `bucket_row`."""
+        b = self._top_order[bucket_row]
+        return self._offsets[b] + self._child_order[b][row]
+
+    def urls_under(self, index: QtCore.QModelIndex) -> list[str]:
+        """URL d'une feuille, ou toutes celles d'un bucket (ordre affiché)."""
+        if not index.isValid():
+            return []
+        bucket_id = index.internalId()
+        if bucket_id:
+            b = bucket_id - 1
+            return [self._buckets[b][1][self._child_order[b][index.row()]][1]]
+        b = self._top_order[index.row()]
+        items = self._buckets[b][1]
+        return [items[i][1] for i in self._child_order[b]]
+
+    def index(self, row: int, column: int, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> QtCore.QModelIndex:
+        if not self.hasIndex(row, column, parent):
+            return QtCore.QModelIndex()
+        return self.createIndex(row, column, self._top_order[parent.row()] + 1 if parent.isValid() else 0)
+
+    def parent(self, index: QtCore.QModelIndex | None = None):
+        if index is None:
+            return super().parent()  # QObject.parent()
+        bucket_id = index.internalId() if index.isValid() else 0
+        if not bucket_id:
+            return QtCore.QModelIndex()
+        return self.createIndex(self._top_order.index(bucket_id - 1), 0, 0)
+
+    def rowCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
+        if not parent.isValid():
+            return len(self._buckets)
+        if parent.internalId() == 0 and parent.column() == 0:
+            return len(self._buckets[self._top_order[parent.row()]][1])
+        return 0
+
+    def columnCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
+        return len(self.HEADERS)
+
+    def data(self, index: QtCore.QModelIndex, role: int = QtCore.Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or role != QtCore.Qt.ItemDataRole.DisplayRole:
+            return None
+        bucket_id = index.internalId()
+        if bucket_id:
+            b = bucket_id - 1
+            return self._buckets[b][1][self._child_order[b][index.row()]][index.column()]
+        return self._buckets[self._top_order[index.row()]][0] if index.column() == 0 else ""
+
+    def headerData(self, section: int, orientation: QtCore.Qt.Orientation, role: int = QtCore.Qt.ItemDataRole.DisplayRole):
+        if orientation == QtCore.Qt.Orientation.Horizontal and role == QtCore.Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+
+class PlaylistFilterProxy(QtCore.QSortFilterProxyModel):
+    """Filtrage de l'index: les buckets restent visibles, les enfants suivent un masque précalculé."""
+
+    def __init__(self, parent: QtCore.QObject | None = None):
+        super().__init__(parent)
+        self._visible: list[bool] | None = None
+        self._flat_row = None  # PlaylistIndexModel.flat_row de la source, lié une fois
+
+    def setSourceModel(self, model: QtCore.QAbstractItemModel):
+        super().setSourceModel(model)
+        self._flat_row = model.flat_row
+
+    def sort(self, column: int, order: QtCore.Qt.SortOrder = QtCore.Qt.SortOrder.AscendingOrder):
+        # Tri délégué au modèle source (voir PlaylistIndexModel.sort): le proxy ne fait que filtrer.
+        self.sourceModel().sort(column, order)
+
+    def set_visible(self, visible: list[bool] | None):
+        self._visible = visible
+        self.invalidateFilter()
+
+    def is_filtered(self) -> bool:
+        return self._visible is not None
+
+    def has_mask(self, visible: list[bool] | None) -> bool:
+        """Vrai si `visible` est déjà le masque appliqué (même objet ou même contenu)."""
+        return visible is self._visible or (visible is not None and visible == self._visible)
+
+    def filterAcceptsRow(self, source_row: int, source_parent: QtCore.QModelIndex) -> bool:
+        # Appelé par Qt pour chaque ligne à chaque filtrage: pas de sourceModel() par appel.
+        visible = self._visible
+        if visible is None or not source_parent.isValid():
+            return True
+        return visible[self._flat_row(source_parent.row(), source_row)]
 
 
 # =========================
 # UI
 # =========================
 
+_LOG_LEVELS = {"DEBUG": 10, "INFO": 20, "WARN": 30, "WARNING": 30, "ERROR": 40}
+_LOG_LEVEL_NAMES = {10: "DEBUG", 20: "INFO", 30: "WARN", 40: "ERROR"}
+
+
 class MainWindow(QtWidgets.QMainWindow):
     """
     Main UI container: playlists browser (GitHub), playlist editor, VLC player, and Salon
@@ -1389,7 +2216,8 @@ class MainWindow(QtWidgets.QMainWindow):
     epg_progress = QtCore.Signal(str)
     epg_progress_value = QtCore.Signal(int)  # -1 = indeterminate, 0-100 = percent
 
-    log_sig = QtCore.Signal(int, str)
+    log_sig = QtCore.Signal()  # réveil du thread UI: des lignes attendent dans _log_inbox
+    progress_value = QtCore.Signal(int)  # _progress_update depuis un thread de travail
 
     def __init__(self):
         super().__init__()
@@ -1397,22 +2225,51 @@ class MainWindow(QtWidgets.QMainWindow):
         self.resize(1200, 720)
 
         self.config_path = Path("data/config.json")
+        self._user_config_cache: dict | None = None  # config lue/écrite, jusqu'au prochain échec d'écriture
+        self._last_saved_cfg_bytes: bytes | None = None  # contenu actuel de config.json (évite les écritures inutiles)
         self._current_style = "Fusion"
         self._current_theme = "light"
         self._current_epg_path = ""
 
         self.channels: list[Channel] = []
+        # Haystacks du filtre, parallèles à self.channels (recalculés seulement si la liste change)
+        self._haystacks: list[str] = []
+        self._haystacks_src: list[Channel] | None = None
+        self._haystacks_dirty: set[int] = set()  # lignes dont le statut a changé, recalculées au prochain filtrage
+        # Même colonne en un bloc contigu (scan complet par str.find), invalidée à chaque modification
+        self._hay_blob: tuple[str, list[int]] | None = None
+        # Dernier filtrage (requête, liste source, positions retenues) pour affiner sans tout rescanner
+        self._last_filter: tuple[str, list[Channel], list[int]] | None = None
+        self._table_shown: tuple[list[Channel], list[int] | None] | None = None  # (liste source, positions | toutes)
+        self._filter_applied: tuple[str, list[Channel]] | None = None  # (requête, liste source) du dernier apply_filter
+        self._pending_fit_rows: int | None = None  # ajustement de colonnes programmé (nb de lignes)
+        # Index url -> Channel de la dernière fusion (valide tant que self.channels est cette liste)
+        self._url_index: dict[str, Channel] = {}
+        self._url_index_src: list[Channel] | None = None
         self._probe_thread: QtCore.QThread | None = None
         self._probe_worker: ProbeWorker | None = None
         self._probe_total: int = 0
         self._probe_done: int = 0
+        # Horodatages des derniers rafraîchissements de progression (limitation de débit)
+        self._last_status_ts: float = 0.0
+        self._last_progress_ts: float = 0.0
         self._editing_playlist_id: int | None = None
         self._editing_playlist_name: str | None = None
         self._last_import_source: str = "-"  # rappel de provenance pour l'export Salon
-        self._last_epg_xml: bytes | None = None
+        self._last_epg_path: Path | None = None  # snapshot XMLTV sur disque (pas en mémoire)
         self._last_epg_coverage: str = ""
         self._epg_cache_dir = Path("data/epg_cache")
         self._epg_cache_ttl_hours = 12
+        # Index du cache EPG: clé -> {url, path, etag, last_modified, fetched_at, size}
+        self._epg_index_path = self._epg_cache_dir / "_index.json"
+        self._epg_index: dict[str, dict] = self._load_epg_index()
+        # Indicateurs distants (onglet Info): résultats OK gardés quelques minutes, connexion réutilisée.
+        self._remote_probe_cache: dict[str, tuple[float, bool, str]] = {}  # url -> (ts monotonic, ok, detail)
+        self._remote_probe_ttl_s = 300
+        self._http_session = http_session()
+        # Pool des tâches réseau courtes (imports, index, dialogues): au moins 4 en parallèle.
+        self._task_pool = _TaskPool(max(4, os.cpu_count() or 1), self)
+        self._task_pool.done.connect(self._dispatch_bg_done, QtCore.Qt.QueuedConnection)
 
         # DB
         self.db = Storage("data/iptv.db")
@@ -1450,15 +2307,23 @@ class MainWindow(QtWidgets.QMainWindow):
         hb.addWidget(self.btn_load_selected_list)
         hb.addWidget(self.list_search, 1)
 
-        self.tree = QtWidgets.QTreeWidget()
-        self.tree.setHeaderLabels(["Playlist", "URL"])
+        self.playlists_model = PlaylistIndexModel(self)
+        self.playlists_proxy = PlaylistFilterProxy(self)
+        self.playlists_proxy.setSourceModel(self.playlists_model)
+        self.tree = QtWidgets.QTreeView()
+        self.tree.setModel(self.playlists_proxy)
         self.tree.setSelectionMode(QtWidgets.QAbstractItemView.SelectionMode.ExtendedSelection)
         self.tree.setSortingEnabled(True)
+        self.tree.sortByColumn(0, QtCore.Qt.SortOrder.AscendingOrder)
         self.tree.setColumnWidth(0, 420)
         self.tree.header().setSectionResizeMode(0, QtWidgets.QHeaderView.ResizeMode.ResizeToContents)
         self.tree.header().setSectionResizeMode(1, QtWidgets.QHeaderView.ResizeMode.Stretch)
         self.tree.setRootIsDecorated(True)
-        self.tree.setExpandsOnDoubleClick(True)
+        # Un clic déplie déjà un bucket (_tree_click_expand); lignes de hauteur identique: pas de mesure par ligne.
+        self.tree.setExpandsOnDoubleClick(False)
+        self.tree.setUniformRowHeights(True)
+        self.tree.setAnimated(False)
+        self.tree.setMouseTracking(False)
 
         vb.addWidget(self.tree, 1)
         self.tabs.addTab(tab_browser, "Playlists (API)")
@@ -1532,11 +2397,17 @@ class MainWindow(QtWidgets.QMainWindow):
         filt.addWidget(self.search)
 
         # Table chaînes
-        self.table = QtWidgets.QTableWidget(0, 7)
-        self.table.setHorizontalHeaderLabels(["Nom", "Groupe", "tvg-id", "Risque", "Raisons", "Statut", "URL"])
+        self.table = QtWidgets.QTableView()
+        self.channels_model = ChannelTableModel(self.table)
+        self.table.setModel(self.channels_model)
         self.table.horizontalHeader().setStretchLastSection(True)
+        self.table.verticalHeader().setSectionResizeMode(QtWidgets.QHeaderView.ResizeMode.Fixed)
+        self.table.setMouseTracking(False)
         self.table.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectionBehavior.SelectRows)
         self.table.setEditTriggers(QtWidgets.QAbstractItemView.EditTrigger.NoEditTriggers)
+        self._channels_delegate = CachedCellDelegate(self.table)
+        self._channels_delegate.watch(self.channels_model)
+        self.table.setItemDelegate(self._channels_delegate)
         vc.addWidget(self.table, 1)
 
         # ---- EPG UI
@@ -1579,9 +2450,10 @@ class MainWindow(QtWidgets.QMainWindow):
         self.channels_tab = tab_channels
         self.tabs.addTab(tab_channels, "Chaînes")
 
-        # ---- Tab 3: Streams API (widget intégré) - après Chaînes
-        self.streams_widget = StreamsDialog(self, log=self.logln, import_mode="replace")
-        self.streams_tab_index = self.tabs.addTab(self.streams_widget, "Streams (API)")
+        # ---- Tab 3: Streams API (widget intégré, création paresseuse) - après Chaînes
+        self.streams_tab, self._streams_layout = self._make_lazy_tab("Streams (API) chargés au premier usage.")
+        self.streams_widget: StreamsDialog | None = None
+        self.streams_tab_index = self.tabs.addTab(self.streams_tab, "Streams (API)")
 
         # ---- Tab 3: VLC Player (création paresseuse)
         tab_player = QtWidgets.QWidget()
@@ -1593,15 +2465,14 @@ class MainWindow(QtWidgets.QMainWindow):
         self.player_tab = tab_player
         self.player_tab_index = self.tabs.addTab(tab_player, "Lecteur")
 
-        # ---- Tab 4: Salon (Quickload)
-        self.salon_tab = SalonTab(self, db=self.db, log=self.logln)
-        self.salon_tab.quickload_requested.connect(self.on_salon_quickload)
-        self.salon_tab.edit_requested.connect(self.on_salon_open_in_editor)
-        self.salon_tab_index = self.tabs.addTab(self.salon_tab, "Salon")
+        # ---- Tab 4: Salon (Quickload, création paresseuse)
+        self.salon_page, self._salon_layout = self._make_lazy_tab("Salon chargé au premier affichage.")
+        self.salon_tab: SalonTab | None = None
+        self.salon_tab_index = self.tabs.addTab(self.salon_page, "Salon")
 
         # ---- Tab 5: Configuration (thème/style)
-        self._theme_specs = discover_themes()
-        self._available_themes = list(self._theme_specs.keys())
+        # Noms seulement: chaque palette est construite (puis mémorisée par ui.themes) au premier usage.
+        self._available_themes = theme_names()
         cfg = self._load_user_config()
         initial_theme = cfg.get("theme") if cfg.get("theme") in self._available_themes else (self._available_themes[0] if self._available_themes else "light")
         initial_style = cfg.get("style") if cfg.get("style") else "Fusion"
@@ -1611,7 +2482,7 @@ class MainWindow(QtWidgets.QMainWindow):
         self._current_epg_path = initial_epg_path
         if initial_epg_path and hasattr(self, "epg_url"):
             self.epg_url.setText(initial_epg_path)
-        styles = [s for s in QtWidgets.QStyleFactory.keys() if s.lower() != "windowsvista"]
+        styles = list(_style_keys())
         if not styles:
             styles = ["Fusion", "Windows"]
 
@@ -1627,63 +2498,15 @@ class MainWindow(QtWidgets.QMainWindow):
         self.settings_tab.config_changed.connect(self.on_config_changed)
         self.tabs.addTab(self.settings_tab, "Configuration")
 
-        # ---- Tab 7: Info (remerciements + liens utiles)
-        info_tab = QtWidgets.QWidget()
-        info_layout = QtWidgets.QVBoxLayout(info_tab)
-
-        info_text = QtWidgets.QTextBrowser()
-        info_text.setOpenExternalLinks(True)
-        info_text.setHtml(
-            """
-            <h3>Liens GitHub</h3>
-            <ul>
-              <li><a href="https://github.com/iptv-org/iptv">iptv-org/iptv</a></li>
-              <li><a href="https://github.com/iptv-org/api">iptv-org/api</a></li>
-              <li><a href="https://github.com/iptv-org/epg">iptv-org/epg</a></li>
-            </ul>
-            <p>Un grand merci aux créateurs et mainteneurs d'<a href="https://github.com/iptv-org">iptv-org</a> pour leur travail communautaire sur les playlists et l'API.</p>
-            <h3>Raccourcis lecteur</h3>
-            <ul>
-              <li><b>F</b> : plein écran / sortie</li>
-              <li><b>C</b> : afficher/masquer la barre en plein écran</li>
-              <li><b>Espace</b> ou <b>K</b> : play/pause</li>
-              <li><b>M</b> : mute</li>
-              <li><b>↑</b> / <b>+</b> / <b>=</b> : volume +5</li>
-              <li><b>↓</b> / <b>-</b> : volume -5</li>
-              <li><b>→</b> : chaîne suivante</li>
-              <li><b>←</b> : chaîne précédente</li>
-              <li><b>L</b> : avance rapide (10 s)</li>
-              <li><b>J</b> : retour en arrière (10 s)</li>
-            </ul>
-            """
-        )
-        info_layout.addWidget(info_text)
-        status_box = QtWidgets.QGroupBox("Indicateurs")
-        status_form = QtWidgets.QFormLayout(status_box)
-        self.info_lbl_vlc = QtWidgets.QLabel("–")
-        self.info_lbl_epg = QtWidgets.QLabel("–")
-        self.info_lbl_api = QtWidgets.QLabel("–")
-        self.info_lbl_md = QtWidgets.QLabel("–")
-        status_form.addRow("VLC", self.info_lbl_vlc)
-        status_form.addRow("EPG", self.info_lbl_epg)
-        status_form.addRow("API iptv-org", self.info_lbl_api)
-        status_form.addRow("PLAYLISTS.md", self.info_lbl_md)
-        info_layout.addWidget(status_box)
-
-        btn_row = QtWidgets.QHBoxLayout()
-        self.btn_info_refresh = QtWidgets.QPushButton("Rafraichir indicateurs")
-        btn_row.addWidget(self.btn_info_refresh)
-        btn_row.addStretch(1)
-        info_layout.addLayout(btn_row)
-
-        info_layout.addStretch(1)
-        self.tabs.addTab(info_tab, "Info")
-        # Appliquer la config dès le démarrage
-        self.on_config_changed({"style": initial_style, "theme": initial_theme, "epg_path": initial_epg_path})
-
-        # ✅ Refresh Qt-safe (au démarrage)
-        QtCore.QTimer.singleShot(0, self.salon_tab.refresh)
-        QtCore.QTimer.singleShot(0, self.refresh_info_status)
+        # ---- Tab 7: Info (remerciements + liens utiles, création paresseuse)
+        self.info_tab, self._info_layout = self._make_lazy_tab("Info chargée au premier affichage.")
+        self.info_tab_index = self.tabs.addTab(self.info_tab, "Info")
+        self.info_lbl_vlc: QtWidgets.QLabel | None = None
+        self._npm_bin_cached: tuple[float, str | None] = (0.0, None)
+        self._vlc_probe: tuple[bool, str] | None = None
+        # Config appliquée au premier showEvent (évite un polish complet du style avant l'affichage)
+        self._cfg_applied = False
+        self._startup_config = {"style": initial_style, "theme": initial_theme, "epg_path": initial_epg_path}
 
         # ---- Log global (visible pour tous les onglets)
         self.log_wrap = QtWidgets.QFrame()
@@ -1715,9 +2538,7 @@ class MainWindow(QtWidgets.QMainWindow):
         log_header.addWidget(self.cmb_log_level)
         log_header.addWidget(self.btn_log_clear)
 
-        self.log = QtWidgets.QPlainTextEdit()
-        self.log.setReadOnly(True)
-        self.log.setMaximumBlockCount(3000)
+        self.log = LogView(max_blocks=3000)
         log_v.addWidget(self.log, 1)
 
         self.vsplit.addWidget(self.log_wrap)
@@ -1729,7 +2550,6 @@ class MainWindow(QtWidgets.QMainWindow):
         self.btn_toggle_log.clicked.connect(self._toggle_log)
         self.btn_log_clear.clicked.connect(self._clear_logs)
         self.cmb_log_level.currentTextChanged.connect(self._on_log_level_changed)
-        self.btn_info_refresh.clicked.connect(self.refresh_info_status)
 
         # Signals
         self.act_import_file.triggered.connect(self.on_load_file)
@@ -1751,14 +2571,19 @@ class MainWindow(QtWidgets.QMainWindow):
         self._channels_filter_timer = QtCore.QTimer(self)
         self._channels_filter_timer.setSingleShot(True)
         self._channels_filter_timer.setInterval(150)
-        self._channels_filter_timer.timeout.connect(self.apply_filter)
+        self._channels_filter_timer.timeout.connect(self._on_filter_timer)
         self.search.textChanged.connect(lambda *_: self._channels_filter_timer.start())
+        # Résultats de test URL regroupés: une mise à jour de la table toutes les 50 ms au plus
+        self._pending_probe: dict[int, str] = {}
+        self._probe_flush_timer = QtCore.QTimer(self)
+        self._probe_flush_timer.setInterval(50)
+        self._probe_flush_timer.timeout.connect(self._flush_probe_progress)
 
         self.btn_refresh_lists.clicked.connect(self.on_refresh_playlists)
         self.btn_open_streams.clicked.connect(self.on_open_streams_dialog)
         self.btn_load_selected_list.clicked.connect(self.on_load_selected_playlists)
-        self.tree.itemSelectionChanged.connect(self.on_tree_selection_changed)
-        self.tree.itemClicked.connect(self._tree_click_expand)
+        self.tree.selectionModel().selectionChanged.connect(self.on_tree_selection_changed)
+        self.tree.clicked.connect(self._tree_click_expand)
 
         self._tree_filtreer_timer = QtCore.QTimer(self)
         self._tree_filtreer_timer.setSingleShot(True)
@@ -1771,8 +2596,8 @@ class MainWindow(QtWidgets.QMainWindow):
         self.import_merged.connect(self._import_merged)
 
         # VLC + EPG
-        self.table.cellDoubleClicked.connect(self.on_channel_double_clicked)
-        self.table.itemSelectionChanged.connect(self.on_channel_selected)
+        self.table.doubleClicked.connect(self.on_channel_double_clicked)
+        self.table.selectionModel().selectionChanged.connect(self.on_channel_selected)
         self.btn_epg_update.clicked.connect(self.on_epg_update)
         self.btn_epg_guide.clicked.connect(self.on_epg_guide)
         self.btn_epg_export.clicked.connect(self.on_epg_export)
@@ -1781,37 +2606,87 @@ class MainWindow(QtWidgets.QMainWindow):
         self.epg_fail.connect(self.on_epg_fail)
         self.epg_progress.connect(self.on_epg_progress)
         self.epg_progress_value.connect(self.on_epg_progress_value)
+        self.progress_value.connect(self._progress_update)
 
-        self._log_buffer: deque[tuple[int, str]] = deque(maxlen=3000)  # (level_num, rendered_line)
+        self._log_buffer: deque[tuple[int, float, str]] = deque(maxlen=3000)  # (level_num, ts, raw), rendu à l'affichage
         self._log_level_min = 20  # INFO
-        self.log_sig.connect(self._append_log_line)
+        self._log_ts_sec = -1
+        self._log_ts_str = ""
+        # Lignes en attente d'affichage: un seul append groupé par tick (~30 Hz) au lieu d'un par ligne.
+        self._log_pending: list[str] = []
+        self._log_flush_timer = QtCore.QTimer(self)
+        self._log_flush_timer.setSingleShot(True)
+        self._log_flush_timer.setInterval(33)
+        self._log_flush_timer.timeout.connect(self._flush_log)
+        # Boîte de dépôt des lignes (n'importe quel thread): un seul signal par rafale, pas un par ligne.
+        self._log_inbox: deque[tuple[int, float, str]] = deque()
+        self._log_inbox_lock = threading.Lock()
+        self._log_wakeup_posted = False
+        self.log_sig.connect(self._drain_log_inbox, QtCore.Qt.QueuedConnection)
         self.tabs.currentChanged.connect(self._on_tab_changed)
         self._update_export_salon_label()
 
         self._playlists_index = None
-        self._all_tree_items: list[tuple[QtWidgets.QTreeWidgetItem, str]] = []
+        self._playlists_cache_path = self.config_path.parent / "playlists_index.json"
+        self._tree_haystacks: list[str] = []  # texte casefold() par playlist, ordre à plat du modèle
+        # Les mêmes textes concaténés ("\x00" entre deux) + position de début de chacun
+        self._tree_blob: str = ""
+        self._tree_starts: list[int] = []
+        self._tree_haystacks_stale = False  # à recalculer depuis le modèle au premier filtrage
+        self._tree_filter_cache: dict[str, list[bool]] = {}  # requête -> visibilité par item
+        # Dernière requête filtrée + lignes retenues (sur-ensemble des résultats d'une requête qui s'allonge)
+        self._tree_last_filter: tuple[str, list[int]] | None = None
+
+    def _fmt_log_line(self, level_num: int, ts: float, raw: str) -> str:
+        # Les lignes arrivent par rafales dans la même seconde: un seul strftime par seconde.
+        sec = int(ts)
+        if sec != self._log_ts_sec:
+            self._log_ts_sec = sec
+            self._log_ts_str = time.strftime("%H:%M:%S", time.localtime(sec))
+        return f"[{self._log_ts_str}] {_LOG_LEVEL_NAMES.get(level_num, 'INFO'):<5} {raw}"
 
-    @QtCore.Slot(int, str)
-    def _append_log_line(self, level_num: int, line: str):
-        self._log_buffer.append((int(level_num), line))
-        if int(level_num) < int(self._log_level_min):
+    @QtCore.Slot()
+    def _drain_log_inbox(self):
+        with self._log_inbox_lock:
+            # Remis à False avant de vider: une ligne déposée pendant le vidage reposte un réveil.
+            self._log_wakeup_posted = False
+        inbox = self._log_inbox
+        added = False
+        while inbox:
+            level_num, ts, raw = inbox.popleft()
+            self._log_buffer.append((level_num, ts, raw))
+            if level_num >= self._log_level_min:
+                self._log_pending.append(self._fmt_log_line(level_num, ts, raw))
+                added = True
+        if added and not self._log_flush_timer.isActive():
+            self._log_flush_timer.start()
+
+    def _flush_log(self):
+        if not self._log_pending:
             return
-
-        self.log.appendPlainText(line)
+        self.log.setUpdatesEnabled(False)
         try:
-            self.log.moveCursor(QtGui.QTextCursor.MoveOperation.End)
-        except Exception:
-            pass
+            self.log.appendPlainText("\n".join(self._log_pending))
+            self._log_pending.clear()
+            try:
+                self.log.moveCursor(QtGui.QTextCursor.MoveOperation.End)
+            except Exception:
+                pass
+        finally:
+            self.log.setUpdatesEnabled(True)
 
     def logln(self, msg: str, level: str = "INFO"):
         if msg is None:
             return
         level = (level or "INFO").strip().upper()
-        level_num = {"DEBUG": 10, "INFO": 20, "WARN": 30, "WARNING": 30, "ERROR": 40}.get(level, 20)
-        ts = time.strftime("%H:%M:%S")
-        for raw_line in str(msg).splitlines() or [""]:
-            line = raw_line.rstrip()
-            self.log_sig.emit(level_num, f"[{ts}] {level:<5} {line}")
+        level_num = _LOG_LEVELS.get(level, 20)
+        ts = time.time()
+        self._log_inbox.extend((level_num, ts, raw_line.rstrip()) for raw_line in str(msg).splitlines() or [""])
+        with self._log_inbox_lock:
+            if self._log_wakeup_posted:
+                return
+            self._log_wakeup_posted = True
+        self.log_sig.emit()
 
     def logexc(self, context: str, exc: Exception):
         ctx = (context or "").strip()
@@ -1824,12 +2699,14 @@ class MainWindow(QtWidgets.QMainWindow):
         self._rebuild_log_view()
 
     def _rebuild_log_view(self):
+        self._log_pending.clear()
         self.log.setUpdatesEnabled(False)
         try:
-            self.log.clear()
-            for level_num, line in self._log_buffer:
-                if int(level_num) >= int(self._log_level_min):
-                    self.log.appendPlainText(line)
+            self.log.setPlainText("\n".join(
+                self._fmt_log_line(level_num, ts, raw)
+                for level_num, ts, raw in self._log_buffer
+                if level_num >= self._log_level_min
+            ))
             try:
                 self.log.moveCursor(QtGui.QTextCursor.MoveOperation.End)
             except Exception:
@@ -1839,6 +2716,7 @@ class MainWindow(QtWidgets.QMainWindow):
 
     def _clear_logs(self):
         self._log_buffer.clear()
+        self._log_pending.clear()
         self.log.clear()
 
     def _progress_start(self, maximum: int | None = None):
@@ -1856,6 +2734,11 @@ class MainWindow(QtWidgets.QMainWindow):
         try:
             if self.progress.isHidden():
                 return
+            # Au plus ~10 rafraîchissements/s; la valeur finale passe toujours.
+            now = time.monotonic()
+            if now - self._last_progress_ts < 0.1 and int(value) < self.progress.maximum():
+                return
+            self._last_progress_ts = now
             self.progress.setRange(self.progress.minimum(), self.progress.maximum())
             self.progress.setValue(int(value))
         except Exception:
@@ -1873,35 +2756,48 @@ class MainWindow(QtWidgets.QMainWindow):
         Exécute une fonction potentiellement bloquante (réseau/I/O) dans un thread, et rapatrie les callbacks sur le thread Qt.
         """
         def target():
+            # Un seul post inter-thread par tâche (callback + on_finally ensemble).
             try:
                 res = func()
-                if on_success:
-                    QtCore.QTimer.singleShot(0, self, lambda r=res: on_success(r))
             except Exception as e:
-                if on_error:
-                    QtCore.QTimer.singleShot(0, self, lambda err=e: on_error(err))
-                else:
+                if not on_error:
                     self.logexc(desc or "Tâche réseau", e)
-            finally:
-                if on_finally:
-                    QtCore.QTimer.singleShot(0, self, on_finally)
+                if on_error or on_finally:
+                    self._task_pool.done.emit(e, on_error, on_finally)
+                return
+            if on_success or on_finally:
+                self._task_pool.done.emit(res, on_success, on_finally)
+
+        self._task_pool.start(target)
 
-        threading.Thread(target=target, daemon=True).start()
+    def _dispatch_bg_done(self, value, callback, on_finally):
+        try:
+            if callback:
+                callback(value)
+        finally:
+            if on_finally:
+                on_finally()
 
     def _info_set_status(self, label: QtWidgets.QLabel, ok: bool, text: str, detail: str | None = None):
         icon = "✅" if ok else "❌"
         extra = f" ({detail})" if detail else ""
         label.setText(f"{icon} {text}{extra}")
 
+    def _rescan_info_status(self):
+        """Bouton « Rafraichir »: oublie les sondes locales mémorisées puis relance les vérifications."""
+        self._npm_bin_cached = (0.0, None)
+        self._vlc_probe = None
+        self.refresh_info_status()
+
     def _refresh_info_local_status(self):
-        # VLC
-        vlc_ok = True
-        vlc_detail = ""
-        try:
-            import vlc as _vlc  # noqa: F401
-        except Exception as e:
-            vlc_ok = False
-            vlc_detail = str(e)
+        # VLC (import tenté une seule fois, résultat mémorisé)
+        if self._vlc_probe is None:
+            try:
+                import vlc as _vlc  # noqa: F401
+                self._vlc_probe = (True, "")
+            except Exception as e:
+                self._vlc_probe = (False, str(e))
+        vlc_ok, vlc_detail = self._vlc_probe
         self._info_set_status(self.info_lbl_vlc, vlc_ok, "VLC installé", vlc_detail if not vlc_ok else None)
 
         # EPG/Node/npm + chemin
@@ -1909,12 +2805,17 @@ class MainWindow(QtWidgets.QMainWindow):
         epg_detail_parts: list[str] = []
 
         try:
-            npm_bin = shutil.which("npm") or shutil.which("npm.cmd")
+            # shutil.which parcourt tout le PATH: résultat gardé 5 minutes.
+            now = time.monotonic()
+            checked_at, npm_bin = self._npm_bin_cached
+            if not checked_at or now - checked_at >= 300:
+                npm_bin = shutil.which("npm") or shutil.which("npm.cmd")
+                self._npm_bin_cached = (now, npm_bin)
             if not npm_bin:
                 epg_detail_parts.append("npm absent")
-            elif getattr(self, "_last_epg_xml", None):
+            elif self._last_epg_path is not None and self._last_epg_path.exists():
                 epg_ok = True
-                epg_detail_parts.append("EPG chargé en mémoire")
+                epg_detail_parts.append(f"EPG chargé: {self._last_epg_path.name}")
             elif self._current_epg_path:
                 p = Path(self._current_epg_path)
                 if p.exists():
@@ -1936,26 +2837,12 @@ class MainWindow(QtWidgets.QMainWindow):
         self._info_set_status(self.info_lbl_md, False, "PLAYLISTS.md", "vérification…")
 
         def check():
-            api_ok = False
-            api_detail = ""
-            md_ok = False
-            md_detail = ""
-            try:
-                r = requests.get(f"{PLAYLISTS_API_BASE}/feeds.json", timeout=5)
-                api_ok = r.ok
-                if not api_ok:
-                    api_detail = f"HTTP {r.status_code}"
-            except Exception as e:
-                api_detail = str(e)
-
-            try:
-                r = requests.get(PLAYLISTS_MD_RAW, timeout=5, stream=True)
-                md_ok = r.ok
-                if not md_ok:
-                    md_detail = f"HTTP {r.status_code}"
-            except Exception as e:
-                md_detail = str(e)
-
+            # Les deux vérifications partent en même temps (connexions distinctes du pool).
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                api = executor.submit(self._probe_remote, f"{PLAYLISTS_API_BASE}/feeds.json")
+                md = executor.submit(self._probe_remote, PLAYLISTS_MD_RAW)
+                api_ok, api_detail = api.result()
+                md_ok, md_detail = md.result()
             return (api_ok, api_detail, md_ok, md_detail)
 
         def on_done(res):
@@ -1970,7 +2857,28 @@ class MainWindow(QtWidgets.QMainWindow):
             desc="Info tab checks",
         )
 
+    def _probe_remote(self, url: str) -> tuple[bool, str]:
+        """HEAD (sans corps) sur `url`; un succès récent est resservi depuis le cache sans réseau."""
+        now = time.monotonic()
+        cached = self._remote_probe_cache.get(url)
+        if cached and now - cached[0] < self._remote_probe_ttl_s:
+            return cached[1], cached[2]
+
+        try:
+            r = self._http_session.head(url, timeout=5, allow_redirects=True)
+            ok = r.ok
+            detail = "" if ok else f"HTTP {r.status_code}"
+        except Exception as e:
+            ok, detail = False, str(e)
+
+        # Les échecs ne sont pas mis en cache: un nouveau clic doit pouvoir revérifier.
+        if ok:
+            self._remote_probe_cache[url] = (now, ok, detail)
+        return ok, detail
+
     def refresh_info_status(self):
+        if self.info_lbl_vlc is None:  # onglet Info pas encore construit
+            return
         self._refresh_info_local_status()
         self._refresh_info_remote_status()
 
@@ -2003,6 +2911,12 @@ class MainWindow(QtWidgets.QMainWindow):
         channels_idx = self.tabs.indexOf(getattr(self, "channels_tab", None))
         if idx == player_idx and player_idx != -1:  # Lecteur
             self._ensure_player_widget()
+        if idx == self.streams_tab_index:
+            self._ensure_streams_widget()
+        elif idx == self.salon_tab_index:
+            self._ensure_salon_tab()
+        elif idx == self.info_tab_index:
+            self._ensure_info_tab()
         if channels_idx != -1 and idx != channels_idx:  # quitter l'onglet Éditeur -> on oublie le contexte d'édition Salon
             self._reset_editing_context()
 
@@ -2022,12 +2936,7 @@ class MainWindow(QtWidgets.QMainWindow):
         )
 
         # Remplace le placeholder par le lecteur instancié
-        while self._player_layout.count():
-            item = self._player_layout.takeAt(0)
-            w = item.widget()
-            if w:
-                w.deleteLater()
-        self._player_layout.addWidget(pw, 1)
+        self._swap_lazy_tab(self._player_layout, pw)
 
         self.player_widget = pw
 
@@ -2048,8 +2957,114 @@ class MainWindow(QtWidgets.QMainWindow):
 
         return pw
 
+    @staticmethod
+    def _make_lazy_tab(placeholder_text: str) -> tuple[QtWidgets.QWidget, QtWidgets.QVBoxLayout]:
+        """Onglet vide avec un libellé d'attente; le vrai contenu est construit au premier affichage."""
+        tab = QtWidgets.QWidget()
+        layout = QtWidgets.QVBoxLayout(tab)
+        layout.setContentsMargins(0, 0, 0, 0)
+        placeholder = QtWidgets.QLabel(placeholder_text)
+        placeholder.setAlignment(QtCore.Qt.AlignCenter)
+        layout.addWidget(placeholder, 1)
+        return tab, layout
+
+    @staticmethod
+    def _swap_lazy_tab(layout: QtWidgets.QLayout, widget: QtWidgets.QWidget):
+        while layout.count():
+            item = layout.takeAt(0)
+            w = item.widget()
+            if w:
+                w.deleteLater()
+        layout.addWidget(widget, 1)
+
+    def _ensure_streams_widget(self) -> StreamsDialog:
+        if self.streams_widget is not None:
+            return self.streams_widget
+        sw = StreamsDialog(self, log=self.logln, import_mode="replace")
+        self._swap_lazy_tab(self._streams_layout, sw)
+        self.streams_widget = sw
+        return sw
+
+    def _ensure_salon_tab(self) -> SalonTab:
+        if self.salon_tab is not None:
+            return self.salon_tab
+        st = SalonTab(self, db=self.db, log=self.logln)
+        st.quickload_requested.connect(self.on_salon_quickload)
+        st.edit_requested.connect(self.on_salon_open_in_editor)
+        self._swap_lazy_tab(self._salon_layout, st)
+        self.salon_tab = st
+        # Refresh Qt-safe (après insertion dans l'onglet)
+        QtCore.QTimer.singleShot(0, st.refresh)
+        return st
+
+    def _refresh_salon_if_built(self):
+        if self.salon_tab is None:
+            return
+        try:
+            self.salon_tab.refresh()
+        except Exception:
+            pass
+
+    def _ensure_info_tab(self):
+        if self.info_lbl_vlc is not None:
+            return
+        page = QtWidgets.QWidget()
+        info_layout = QtWidgets.QVBoxLayout(page)
+
+        info_text = QtWidgets.QTextBrowser()
+        info_text.setOpenExternalLinks(True)
+        info_text.setDocument(info_document().clone(info_text))
+        info_layout.addWidget(info_text)
+        status_box = QtWidgets.QGroupBox("Indicateurs")
+        status_form = QtWidgets.QFormLayout(status_box)
+        self.info_lbl_vlc = QtWidgets.QLabel("–")
+        self.info_lbl_epg = QtWidgets.QLabel("–")
+        self.info_lbl_api = QtWidgets.QLabel("–")
+        self.info_lbl_md = QtWidgets.QLabel("–")
+        status_form.addRow("VLC", self.info_lbl_vlc)
+        status_form.addRow("EPG", self.info_lbl_epg)
+        status_form.addRow("API iptv-org", self.info_lbl_api)
+        status_form.addRow("PLAYLISTS.md", self.info_lbl_md)
+        info_layout.addWidget(status_box)
+
+        btn_row = QtWidgets.QHBoxLayout()
+        self.btn_info_refresh = QtWidgets.QPushButton("Rafraichir indicateurs")
+        btn_row.addWidget(self.btn_info_refresh)
+        btn_row.addStretch(1)
+        info_layout.addLayout(btn_row)
+
+        info_layout.addStretch(1)
+        self._swap_lazy_tab(self._info_layout, page)
+        self.btn_info_refresh.clicked.connect(self._rescan_info_status)
+        QtCore.QTimer.singleShot(0, self.refresh_info_status)
+
     # -------- Settings --------
 
+    def showEvent(self, e):
+        super().showEvent(e)
+        if not self._cfg_applied:
+            self._cfg_applied = True
+            self.on_config_changed(self._startup_config)
+            # Arbre des playlists affiché depuis le cache disque, sans attendre le réseau
+            QtCore.QTimer.singleShot(0, self, self._load_playlists_cache)
+
+    def _load_playlists_cache(self):
+        if self._playlists_index is not None:
+            return
+        # Lecture + décodage JSON hors du thread UI; ignoré si un « Lister playlists » est passé entre-temps.
+        self._run_in_background(
+            lambda: load_playlists_index_cache(self._playlists_cache_path),
+            on_success=lambda idx: self._populate_tree(idx) if idx and self._playlists_index is None else None,
+            desc="Cache playlists",
+        )
+
+    def _theme_spec(self, theme: str) -> ThemeSpec | None:
+        """Thème demandé, ou le premier disponible s'il est inconnu/invalide."""
+        spec = get_theme(theme)
+        if spec is None and self._available_themes:
+            spec = get_theme(self._available_themes[0])
+        return spec
+
     def on_theme_changed(self, theme: str):
         """Applique une palette claire/sombre simple sur l'application."""
         app = QtWidgets.QApplication.instance()
@@ -2057,10 +3072,16 @@ class MainWindow(QtWidgets.QMainWindow):
             return
 
         # Style actuel (géré séparément)
-        spec = self._theme_specs.get(theme) or next(iter(self._theme_specs.values()))
+        spec = self._theme_spec(theme)
+        if spec is None:
+            return
         pal = spec.palette
-        app.setPalette(pal)
+        if pal != app.palette():
+            app.setPalette(pal)
+        if theme == self._current_theme:
+            return
         self._current_theme = theme
+        self._last_cfg_key = None
         self._save_user_config()
 
     def _apply_config(self, payload: dict, persist: bool):
@@ -2071,16 +3092,24 @@ class MainWindow(QtWidgets.QMainWindow):
         theme_name = (payload.get("theme") or "").strip()
         epg_path = (payload.get("epg_path") or "").strip()
 
+        # config_preview est émis à chaque changement de combo: un payload identique ne fait rien.
+        key = (style_name, theme_name, epg_path, persist)
+        if key == getattr(self, "_last_cfg_key", None):
+            return
+        self._last_cfg_key = key
+
         changed_parts = []
 
-        if style_name and app and style_name in QtWidgets.QStyleFactory.keys():
-            app.setStyle(style_name)
+        if style_name and app and style_name in _style_keys():
+            # setStyle/setPalette repolissent tous les widgets: on ignore les écritures sans effet.
+            if app.style().objectName().lower() != style_name.lower():
+                app.setStyle(style_name)
             self._current_style = style_name
             changed_parts.append(f"style={style_name}")
 
         if theme_name:
-            spec = self._theme_specs.get(theme_name) or next(iter(self._theme_specs.values()), None)
-            if spec and app:
+            spec = self._theme_spec(theme_name)
+            if spec and app and spec.palette != app.palette():
                 app.setPalette(spec.palette)
             self._current_theme = theme_name
             changed_parts.append(f"theme={theme_name}")
@@ -2117,18 +3146,13 @@ class MainWindow(QtWidgets.QMainWindow):
 
     def on_salon_quickload(self, playlist_id: int):
         try:
-            rows = self.db.get_channels(int(playlist_id))
+            rec, rows = self.db.get_playlist_with_channels(int(playlist_id))
         except Exception as e:
             self.logln(f"Salon: erreur DB: {e}")
             return
 
-        rec = None
-        try:
-            rec = next((p for p in self.db.list_playlists() if int(p.id) == int(playlist_id)), None)
-            if rec and getattr(self, "epg_url", None) is not None:
-                self.epg_url.setText(rec.epg_url or "")
-        except Exception:
-            rec = None
+        if rec and getattr(self, "epg_url", None) is not None:
+            self.epg_url.setText(rec.epg_url or "")
 
         channels = self._channels_from_db_rows(rows)
         if not channels:
@@ -2153,17 +3177,11 @@ class MainWindow(QtWidgets.QMainWindow):
 
     def on_salon_open_in_editor(self, playlist_id: int):
         try:
-            rows = self.db.get_channels(int(playlist_id))
+            rec, rows = self.db.get_playlist_with_channels(int(playlist_id))
         except Exception as e:
             self.logln(f"Salon: erreur DB: {e}")
             return
 
-        rec = None
-        try:
-            rec = next((p for p in self.db.list_playlists() if int(p.id) == int(playlist_id)), None)
-        except Exception:
-            rec = None
-
         self._editing_playlist_id = int(playlist_id)
         self._editing_playlist_name = rec.name if rec else None
         if rec and rec.url:
@@ -2189,11 +3207,11 @@ class MainWindow(QtWidgets.QMainWindow):
 
     # -------- VLC --------
 
-    def on_channel_double_clicked(self, row: int, col: int):
-        item = self.table.item(row, 6)  # URL
-        if not item:
+    def on_channel_double_clicked(self, index: QtCore.QModelIndex):
+        ch = self.channels_model.channel(index.row())
+        if ch is None:
             return
-        url = item.text().strip()
+        url = (ch.url or "").strip()
         if not url:
             return
 
@@ -2218,11 +3236,21 @@ class MainWindow(QtWidgets.QMainWindow):
         self.epg_progress.emit("EPG: preparation...")
         self.epg_progress_value.emit(-1)  # indéterminé le temps de l'analyse
         cache_key = self._epg_cache_key()
+        staging = self._epg_cache_dir / f"_incoming_{int(time.time() * 1000)}.xml"
+
+        # Revalidation HTTP (If-None-Match / If-Modified-Since) si le cache correspond à la même URL.
+        cached_path = self._epg_cache_path(cache_key) if cache_key else None
+        entry = self._epg_index.get(cache_key) if cache_key else None
+        validators = {}
+        if entry and entry.get("url") == raw and cached_path is not None and cached_path.exists():
+            validators = {"etag": entry.get("etag") or "", "last_modified": entry.get("last_modified") or ""}
 
         def run():
             try:
                 self.epg_progress.emit("EPG: analyse de la cible...")
                 p = Path(raw)
+                xml_path = staging
+                etag = last_modified = ""
 
                 # If the target is a local npm repo, generate XMLTV locally; otherwise download the remote feed.
                 if p.exists() and p.is_dir() and (p / "package.json").exists():
@@ -2238,6 +3266,9 @@ class MainWindow(QtWidgets.QMainWindow):
                         timeout_s=900,
                         log=self.logln,
                     )
+                    staging.parent.mkdir(parents=True, exist_ok=True)
+                    staging.write_bytes(xml)
+                    del xml
                 else:
                     msg = f"EPG: telechargement + import: {raw}"
                     self.logln(msg)
@@ -2249,15 +3280,35 @@ class MainWindow(QtWidgets.QMainWindow):
                         else:
                             self.epg_progress_value.emit(-1)
 
-                    xml = download_xmltv(raw, progress_cb=_progress)
+                    # Flux écrit sur disque (décompression .gz à la volée), jamais bufferisé en RAM.
+                    fetch = download_xmltv_to_file(raw, staging, progress_cb=_progress, **validators)
+                    etag, last_modified = fetch.etag, fetch.last_modified
+                    if fetch.not_modified and cached_path is not None:
+                        self.logln("EPG: guide inchangé (HTTP 304), cache réutilisé.")
+                        xml_path = cached_path
                     self.epg_progress_value.emit(100)
 
-                programs = list(iter_programs(xml))
-                QtCore.QTimer.singleShot(0, self, lambda: self._load_epg_snapshot(xml, programs, cache_key))
+                if xml_path != staging and self._epg_db_holds(cache_key):
+                    # 304 et la base contient déjà ce guide: ni parsing ni réinsertion.
+                    count, tvg_in_epg = self.db.epg_summary()
+                else:
+                    # Analyse + insertion par paquets dans ce thread: seuls les métadonnées remontent à l'UI.
+                    self.epg_progress.emit("EPG: analyse + insertion du guide...")
+                    count, tvg_in_epg = self._import_epg_programs(self._epg_rows(xml_path))
+                QtCore.QTimer.singleShot(
+                    0,
+                    self,
+                    lambda: self._load_epg_snapshot(
+                        xml_path, count, tvg_in_epg, cache_key, source=raw, etag=etag, last_modified=last_modified
+                    ),
+                )
 
             except Exception as e:
+                staging.unlink(missing_ok=True)
+                rows_cache_path(staging).unlink(missing_ok=True)
                 self.epg_fail.emit(str(e))
 
+        # Thread dédié (démon): un import de plusieurs minutes ne doit ni occuper le pool ni bloquer la fermeture.
         threading.Thread(target=run, daemon=True).start()
 
     @QtCore.Slot(str)
@@ -2303,7 +3354,7 @@ class MainWindow(QtWidgets.QMainWindow):
         self._progress_done()
 
     def on_epg_export(self):
-        if not self._last_epg_xml:
+        if self._last_epg_path is None or not self._last_epg_path.exists():
             self.logln("EPG: rien a exporter (pas de snapshot).")
             return
         path, _ = QtWidgets.QFileDialog.getSaveFileName(
@@ -2312,7 +3363,7 @@ class MainWindow(QtWidgets.QMainWindow):
         if not path:
             return
         try:
-            Path(path).write_bytes(self._last_epg_xml)
+            shutil.copyfile(self._last_epg_path, path)
             self.logln(f"EPG: snapshot exporte -> {path}")
         except Exception as e:
             self.logln(f"EPG: erreur Exporte: {e}", level="ERROR")
@@ -2323,12 +3374,12 @@ class MainWindow(QtWidgets.QMainWindow):
             self.logln("EPG: sélectionne une chaîne.")
             return
 
-        row = sel[0].row()
-        name_item = self.table.item(row, 0)
-        tvg_item = self.table.item(row, 2)
+        ch = self.channels_model.channel(sel[0].row())
+        if ch is None:
+            return
 
-        ch_name = (name_item.text() if name_item else "").strip()
-        tvg_id = (tvg_item.text() if tvg_item else "").strip()
+        ch_name = (ch.name or "").strip()
+        tvg_id = (ch.tvg_id or "").strip()
 
         if not tvg_id:
             self.logln("EPG: (pas de tvg-id) → impossible d'ouvrir le guide.")
@@ -2341,17 +3392,16 @@ class MainWindow(QtWidgets.QMainWindow):
         dlg = EpgDialog(self, self.db, tvg_id, ch_name or tvg_id)
         dlg.exec()
 
-    def on_channel_selected(self):
+    def on_channel_selected(self, *_):
         sel = self.table.selectionModel().selectedRows()
         if not sel:
             return
 
-        row = sel[0].row()
-        tvg_item = self.table.item(row, 2)
-        if not tvg_item:
+        ch = self.channels_model.channel(sel[0].row())
+        if ch is None:
             return
 
-        tvg_id = (tvg_item.text() or "").strip()
+        tvg_id = (ch.tvg_id or "").strip()
         if not tvg_id:
             return
 
@@ -2386,75 +3436,168 @@ class MainWindow(QtWidgets.QMainWindow):
         except Exception:
             pass
 
+        # Tâches réseau pas encore démarrées: abandonnées; celles en cours finissent sans rien livrer.
+        try:
+            self._task_pool.shutdown()
+        except Exception:
+            pass
+
+        try:
+            self.db.close()
+        except Exception:
+            pass
+
+        # La session partagée vit le temps de la fenêtre (connexions keep-alive réutilisées d'un chargement à l'autre)
+        try:
+            if _HTTP_SESSION is not None:
+                _HTTP_SESSION.close()
+        except Exception:
+            pass
+
         super().closeEvent(event)
 
     # -------- Channels UI --------
 
-    def refresh_table(self, data: list[Channel] | None = None, *, resize_columns: bool = True):
-        data = data if data is not None else self.channels
-
+    @contextmanager
+    def _table_bulk(self):
+        """
+        Remplissage groupé de la table chaînes: ni repaint, ni tri, ni signaux tant que le bloc s'exécute.
+        Les états précédents sont restaurés à la sortie (appels imbriqués sans effet de bord).
+        """
         was_sorting = self.table.isSortingEnabled()
-        self.table.setSortingEnabled(False)
+        was_updating = self.table.updatesEnabled()
+        was_blocked = self.table.blockSignals(True)
         self.table.setUpdatesEnabled(False)
+        self.table.setSortingEnabled(False)
         try:
-            self.table.setRowCount(len(data))
-            for row, ch in enumerate(data):
-                name_txt = ch.name
-                opts = getattr(ch, "vlc_opts", []) or []
-                if opts:
-                    name_txt = (name_txt or "") + " [OPT]"
-                name_item = QtWidgets.QTableWidgetItem(name_txt)
-                if opts:
-                    name_item.setToolTip("Options VLC:\n" + "\n".join(str(o) for o in opts))
-                self.table.setItem(row, 0, name_item)
-                self.table.setItem(row, 1, QtWidgets.QTableWidgetItem(ch.group))
-                self.table.setItem(row, 2, QtWidgets.QTableWidgetItem(ch.tvg_id))
-                risk_txt = f"{ch.risk_badge} {ch.risk_level} ({int(round(ch.risk_score))}/100)"
-                risk_item = QtWidgets.QTableWidgetItem(risk_txt)
-                if ch.risk_reasons:
-                    risk_item.setToolTip(ch.risk_reasons)
-                self.table.setItem(row, 3, risk_item)
-                self.table.setItem(row, 4, QtWidgets.QTableWidgetItem(ch.risk_reasons))
-                self.table.setItem(row, 5, QtWidgets.QTableWidgetItem(ch.status))
-                self.table.setItem(row, 6, QtWidgets.QTableWidgetItem(ch.url))
+            yield self.table
         finally:
-            self.table.setUpdatesEnabled(True)
             self.table.setSortingEnabled(was_sorting)
+            self.table.blockSignals(was_blocked)
+            self.table.setUpdatesEnabled(was_updating)
+
+    def refresh_table(self, data: list[Channel] | None = None, *, resize_columns: bool = True):
+        data = data if data is not None else self.channels
+        self._table_shown = None  # apply_filter renseigne ce qu'il vient d'afficher
+
+        # Modèle virtuel: un simple reset, les cellules sont lues à l'affichage.
+        with self._table_bulk():
+            self.channels_model.set_rows(data)
 
         if resize_columns:
+            # Mesure différée après le reset (premier rendu immédiat); plusieurs refresh d'affilée n'en font qu'une.
+            if self._pending_fit_rows is None:
+                QtCore.QTimer.singleShot(0, self, self._fit_pending_columns)
+            self._pending_fit_rows = len(data)
+
+    def _fit_pending_columns(self):
+        rows, self._pending_fit_rows = self._pending_fit_rows, None
+        if rows is not None:
+            self._fit_channel_columns(rows)
+
+    def _fit_channel_columns(self, row_count: int):
+        """Ajuste les colonnes au contenu pour une petite table, sinon largeurs fixes (mesure O(N·colonnes))."""
+        if row_count < 500:
             self.table.resizeColumnsToContents()
+            return
+        for col, px in enumerate(ChannelTableModel.DEFAULT_WIDTHS):
+            self.table.setColumnWidth(col, px)
+
+    def _channel_haystacks(self) -> list[str]:
+        # Après fusion/suppression, seules les nouvelles chaînes calculent leur texte (mémorisé par Channel).
+        if self._haystacks_src is not self.channels or len(self._haystacks) != len(self.channels):
+            self._haystacks = [_channel_haystack(c) for c in self.channels]
+            self._haystacks_src = self.channels
+            self._haystacks_dirty.clear()
+            self._hay_blob = None
+        elif self._haystacks_dirty:
+            hays, channels = self._haystacks, self.channels
+            for row in self._haystacks_dirty:
+                if row < len(hays):
+                    hays[row] = _channel_haystack(channels[row])
+            self._haystacks_dirty.clear()
+            self._hay_blob = None
+        return self._haystacks
 
     def get_filtered_channels(self) -> list[Channel]:
         q = self.search.text().strip().lower()
         if not q:
+            self._last_filter = None
             return list(self.channels)
-        out = []
-        for ch in self.channels:
-            hay = f"{ch.name} {ch.group} {ch.tvg_id} {ch.status} {ch.url} {ch.risk_level} {ch.risk_reasons} {ch.risk_score}".lower()
-            if q in hay:
-                out.append(ch)
-        return out
+        channels = self.channels
+        hays = self._channel_haystacks()
+        last = self._last_filter
+        if last is not None and last[1] is channels and q.startswith(last[0]):
+            # Requête qui s'allonge: le résultat est un sous-ensemble du précédent, on ne rescanne que lui.
+            rows = [i for i in last[2] if q in hays[i]]
+        else:
+            # Scan complet sur la colonne contiguë: le coût suit le nombre d'occurrences, pas de lignes.
+            if self._hay_blob is None:
+                self._hay_blob = _join_haystacks(hays)
+            rows = list(_rows_containing(*self._hay_blob, q))
+        self._last_filter = (q, channels, rows)
+        return [channels[i] for i in rows]
 
     def apply_filter(self):
         q = self.search.text().strip().lower()
         filtered = self.get_filtered_channels()
+        # Même ensemble de lignes que celui affiché (ex: un caractère de plus qui n'élimine rien):
+        # pas de reset du modèle, la vue garde défilement et sélection.
+        shown = (self.channels, self._last_filter[2] if q and self._last_filter else None)
+        current = self._table_shown
+        if current is not None and current[0] is shown[0] and current[1] == shown[1]:
+            self._filter_applied = (q, self.channels)
+            return
         self.refresh_table(filtered, resize_columns=not q)
+        self._table_shown = shown
+        self._filter_applied = (q, self.channels)
+
+    def _on_filter_timer(self):
+        # Fin de saisie (debounce): rien à refaire si la requête effective n'a pas bougé
+        # (ex: search.clear() juste après un refresh, ou saisie puis effacement du même caractère).
+        applied = self._filter_applied
+        if applied and applied[0] == self.search.text().strip().lower() and applied[1] is self.channels:
+            return
+        self.apply_filter()
 
     def _log_risk_overview(self, channels: list[Channel]):
-        # Compute risk badges for the current set and log a compact summary.
-        assessments = score_channels(channels)
-        if not assessments:
-            return assessments
+        # Compute risk badges in a worker thread; the table is refreshed and a summary logged when done.
+        if not channels:
+            return
+        chans = list(channels)
+        # Seules les chaînes jamais évaluées passent au scoring: après une fusion, les existantes
+        # gardent leur score (l'évaluation ne dépend que de la chaîne elle-même).
+        todo = [c for c in chans if c.risk_level == "Inconnu"]
+        if not todo:
+            self._on_risk_ready(chans, todo, [])
+            return
+        self._run_in_background(
+            lambda: assess_channels(todo),
+            on_success=lambda assessments: self._on_risk_ready(chans, todo, assessments),
+            desc="Score de risque",
+        )
+
+    def _on_risk_ready(self, channels: list[Channel], scored: list[Channel], assessments: list):
+        apply_assessments(scored, assessments)
+        # Les colonnes risque et les haystacks du filtre dépendent du score.
+        for ch in scored:
+            ch._search_hay = ""
+        self._haystacks_src = None
+        self._last_filter = None
+        if self.search.text().strip():
+            # Le score peut changer les lignes retenues; s'il ne les change pas, apply_filter ne touche
+            # pas au modèle et seules les colonnes risque sont à redessiner (ci-dessous).
+            self.apply_filter()
+        self.channels_model.refresh_columns(3, 4)
 
         counts = {"🟢": 0, "🟡": 0, "🔴": 0}
-        for a in assessments:
-            if a.badge in counts:
-                counts[a.badge] += 1
+        for c in channels:
+            if c.risk_badge in counts:
+                counts[c.risk_badge] += 1
 
         self.logln(
             f"Risque (indicatif, informatif uniquement): {counts['🔴']} 🔴 / {counts['🟡']} 🟡 / {counts['🟢']} 🟢"
         )
-        return assessments
 
     def _reset_editing_context(self):
         self._editing_playlist_id = None
@@ -2473,30 +3616,132 @@ class MainWindow(QtWidgets.QMainWindow):
             return f"playlist_{int(self._editing_playlist_id)}"
         raw = self.epg_url.text().strip() if hasattr(self, "epg_url") else ""
         if raw:
-            return f"url_{abs(hash(raw))}"
+            return _epg_url_key(raw)
         return None
 
     def _epg_cache_path(self, key: str) -> Path:
         return self._epg_cache_dir / f"{key}.xml"
 
-    def _load_epg_snapshot(self, xml_bytes: bytes, programs: list[dict], cache_key: str | None):
+    def _load_epg_index(self) -> dict[str, dict]:
+        try:
+            data = json.loads(self._epg_index_path.read_text(encoding="utf-8"))
+            return data if isinstance(data, dict) else {}
+        except Exception:
+            return {}
+
+    def _save_epg_index(self):
+        try:
+            self._epg_index_path.parent.mkdir(parents=True, exist_ok=True)
+            self._epg_index_path.write_text(json.dumps(self._epg_index, indent=2), encoding="utf-8")
+        except Exception:
+            pass
+
+    def _epg_db_holds(self, cache_key: str | None) -> bool:
+        """Vrai si le guide en base provient déjà du snapshot `cache_key` tel qu'il est sur disque."""
+        if not cache_key:
+            return False
+        marker = self._epg_index.get("__db__") or {}
+        entry = self._epg_index.get(cache_key) or {}
+        try:
+            size = self._epg_cache_path(cache_key).stat().st_size
+        except OSError:
+            return False
+        return marker.get("key") == cache_key and marker.get("size") == size and marker.get("etag", "") == entry.get("etag", "")
+
+    def _epg_rows(self, xml_path: Path) -> Iterable[tuple]:
+        """
+        Programmes d'un guide: relus depuis le cache déjà parsé s'il existe (pas de parsing XML),
+        sinon parsés depuis le XML en écrivant ce cache au passage.
+        """
+        cache = rows_cache_path(xml_path)
+        if cache.exists():
+            try:
+                return iter_rows_cache(cache)
+            except Exception:
+                cache.unlink(missing_ok=True)
+        return tee_rows_to_cache(iter_programme_rows_parallel(xml_path), cache)
+
+    def _import_epg_programs(self, rows: Iterable[tuple]) -> tuple[int, set[str]]:
+        """
+        Remplace le guide en base à partir d'un flux de tuples programme (utilisable hors thread Qt).
+        Retourne (nombre de programmes, tvg-id présents) pour le calcul de couverture.
+        """
+        tvg_in_epg: set[str] = set()
+
+        def tap():
+            for row in rows:
+                tvg_in_epg.add(row[0])
+                yield row
+
+        count = self.db.replace_epg_rows(tap())
+        return count, tvg_in_epg
+
+    def _load_epg_snapshot(
+        self,
+        xml_path: Path,
+        count: int,
+        tvg_in_epg: set[str],
+        cache_key: str | None,
+        *,
+        source: str | None = None,
+        etag: str = "",
+        last_modified: str = "",
+    ):
+        """Finalise un import EPG déjà inséré en base: cache disque, index, couverture."""
         try:
-            self.epg_progress.emit(f"EPG: insertion snapshot ({len(programs)} programmes)...")
-            self.db.clear_epg()
-            self.db.upsert_epg_programs(programs)
+            self.epg_progress.emit(f"EPG: snapshot inséré ({count} programmes).")
             self.epg_loaded = True
-            self._last_epg_xml = xml_bytes
 
-            if cache_key:
+            # Le fichier téléchargé devient directement le cache (simple renommage, pas de copie).
+            target = self._epg_cache_path(cache_key) if cache_key else self._epg_cache_dir / "last_snapshot.xml"
+            if xml_path != target:
+                try:
+                    os.replace(xml_path, target)
+                    # Le cache parsé suit son XML; sans lui, l'ancien (d'un autre guide) est obsolète.
+                    rows_src, rows_dst = rows_cache_path(xml_path), rows_cache_path(target)
+                    if rows_src.exists():
+                        os.replace(rows_src, rows_dst)
+                    else:
+                        rows_dst.unlink(missing_ok=True)
+                    xml_path = target
+                except Exception:
+                    pass
+            self._last_epg_path = xml_path
+
+            # Snapshot frais (téléchargé ou revalidé): on met l'index à jour pour les prochains lancements.
+            if cache_key and source is not None:
                 try:
-                    self._epg_cache_dir.mkdir(parents=True, exist_ok=True)
-                    self._epg_cache_path(cache_key).write_bytes(xml_bytes)
+                    now = time.time()
+                    os.utime(xml_path, (now, now))
+                    self._epg_index[cache_key] = {
+                        "url": source,
+                        "path": xml_path.name,
+                        "etag": etag,
+                        "last_modified": last_modified,
+                        "fetched_at": now,
+                        "size": xml_path.stat().st_size,
+                    }
+                    self._save_epg_index()
                 except Exception:
                     pass
 
-            tvg_in_epg = {p.get("tvg_id", "") for p in programs}
-            total_with_id = sum(1 for c in self.channels if (c.tvg_id or "").strip())
-            matched = sum(1 for c in self.channels if (c.tvg_id or "").strip() in tvg_in_epg)
+            # Mémorise quel snapshot occupe la table: un 304 ultérieur pourra sauter la réinsertion.
+            if cache_key and xml_path == self._epg_cache_path(cache_key):
+                try:
+                    self._epg_index["__db__"] = {
+                        "key": cache_key,
+                        "size": xml_path.stat().st_size,
+                        "etag": (self._epg_index.get(cache_key) or {}).get("etag", ""),
+                    }
+                    self._save_epg_index()
+                except Exception:
+                    pass
+
+            # tvg_in_epg est collecté pendant l'insertion: une seule passe sur les chaînes, puis intersection.
+            channel_ids = {(c.tvg_id or "").strip() for c in self.channels}
+            channel_ids.discard("")
+            total_with_id = len(channel_ids)
+            matched = len(channel_ids & tvg_in_epg)
             coverage_txt = f"EPG: couverture {matched}/{total_with_id} tvg-id" if total_with_id else "EPG: aucune tvg-id"
             self._last_epg_coverage = coverage_txt
             self.epg_progress.emit(coverage_txt)
@@ -2506,19 +3751,23 @@ class MainWindow(QtWidgets.QMainWindow):
             self.epg_fail.emit(str(e))
 
     def _try_load_epg_cache(self, epg_url: str, playlist_id: int | None = None) -> bool:
-        key = f"playlist_{int(playlist_id)}" if playlist_id is not None else (f"url_{abs(hash(epg_url))}" if epg_url else None)
+        key = f"playlist_{int(playlist_id)}" if playlist_id is not None else (_epg_url_key(epg_url) if epg_url else None)
         if not key:
             return False
         path = self._epg_cache_path(key)
         if not path.exists():
             return False
         try:
-            age_h = (time.time() - path.stat().st_mtime) / 3600.0
+            entry = self._epg_index.get(key) or {}
+            fetched_at = float(entry.get("fetched_at") or path.stat().st_mtime)
+            age_h = (time.time() - fetched_at) / 3600.0
             if age_h > float(self._epg_cache_ttl_hours):
                 return False
-            xml = path.read_bytes()
-            programs = list(iter_programs(xml))
-            self._load_epg_snapshot(xml, programs, key)
+            if self._epg_db_holds(key):
+                count, tvg_in_epg = self.db.epg_summary()
+            else:
+                count, tvg_in_epg = self._import_epg_programs(self._epg_rows(path))
+            self._load_epg_snapshot(path, count, tvg_in_epg, key)
             self.logln(f"EPG: cache charge ({path.name}, age {age_h:.1f}h).")
             return True
         except Exception as e:
@@ -2534,13 +3783,19 @@ class MainWindow(QtWidgets.QMainWindow):
         self.on_epg_update()
 
     def import_m3u_text(self, text: str, label: str = ""):
+        self.import_channels(parse_m3u(text), label)
+
+    def import_channels(self, channels: list[Channel], label: str = ""):
         # Toute importation "fraîche" invalide un contexte d'édition Salon
         self._reset_editing_context()
 
         source_label = (label or "").strip() or "Import local"
         self._last_import_source = source_label
 
-        self.channels = parse_m3u(text)
+        self.channels = channels
+        # Nouvelle liste: l'index url sera reconstruit une seule fois à la prochaine fusion
+        self._url_index = {}
+        self._url_index_src = None
         self._log_risk_overview(self.channels)
         self.logln(f"Importé: {len(self.channels)} chaînes ({source_label})")
         self.apply_filter()
@@ -2550,48 +3805,59 @@ class MainWindow(QtWidgets.QMainWindow):
     def _merge_channels(self, new_channels: list[Channel], source_label: str):
         if new_channels is None:
             return
-        existing_by_url: dict[str, Channel] = {}
-        merged: list[Channel] = []
-
-        for c in self.channels:
-            key = (c.url or "").strip()
-            if key and key not in existing_by_url:
-                existing_by_url[key] = c
-                merged.append(c)
-
-        added = 0
+        # Index url -> Channel (ordre d'insertion = ordre de la playlist), conservé entre deux fusions
+        # tant que self.channels n'a pas été remplacé ailleurs.
+        seen = self._url_index
+        if self._url_index_src is not self.channels:
+            seen = {}
+            for c in self.channels:
+                key = (c.url or "").strip()
+                if key and key not in seen:
+                    seen[key] = c
+
+        before = len(seen)
         for c in new_channels:
             key = (c.url or "").strip()
-            if not key or key in existing_by_url:
-                continue
-            existing_by_url[key] = c
-            merged.append(c)
-            added += 1
+            if key and key not in seen:
+                seen[key] = c
+        added = len(seen) - before
 
         if added == 0:
             self.logln(f"Fusion: aucune nouvelle chaine (source: {source_label}).")
             return
 
-        self.channels = merged
+        self.channels = list(seen.values())
+        self._url_index = seen
+        self._url_index_src = self.channels
         self._log_risk_overview(self.channels)
         self.apply_filter()
         self.logln(f"Fusion: +{added}, total {len(self.channels)} (source: {source_label}).")
 
-    def _channels_from_db_rows(self, rows: list[dict]) -> list[Channel]:
-        out = []
-        for r in rows:
-            out.append(
-                Channel(
-                    extinf=r.get("extinf", ""),
-                    url=r.get("url", ""),
-                    name=r.get("name", ""),
-                    group=r.get("group", ""),
-                    tvg_id=r.get("tvg_id", ""),
-                    vlc_opts=r.get("vlc_opts", []) or [],
-                    status="-",
-                )
+    @staticmethod
+    def _vlc_opts_from_json(raw: str | None) -> list[str]:
+        if not raw:
+            return []
+        try:
+            opts = json.loads(raw)
+        except Exception:
+            return []
+        return opts if isinstance(opts, list) else []
+
+    def _channels_from_db_rows(self, rows: list[tuple]) -> list[Channel]:
+        """rows: tuples (extinf, url, name, group, tvg_id, vlc_opts_json) de Storage.get_channel_rows."""
+        opts_from_json = self._vlc_opts_from_json
+        return [
+            Channel(
+                extinf=extinf,
+                url=url,
+                name=name,
+                group=group,
+                tvg_id=tvg_id,
+                vlc_opts=opts_from_json(vlc_opts),
+                status="-",
             )
-        return out
+            for (extinf, url, name, group, tvg_id, vlc_opts) in rows
+        ]
 
     def on_load_file(self):
         path, _ = QtWidgets.QFileDialog.getOpenFileName(
@@ -2599,8 +3865,16 @@ class MainWindow(QtWidgets.QMainWindow):
         )
         if not path:
             return
-        text = Path(path).read_text(encoding="utf-8", errors="ignore")
-        self.import_m3u_text(text, Path(path).name)
+        # Parsing hors du thread UI (fichiers de plusieurs Mo), comme les imports par URL.
+        label = Path(path).name
+        self._progress_start()
+        self._run_in_background(
+            lambda: parse_m3u_file(path),
+            on_success=lambda channels: self.import_channels(channels, label),
+            on_error=lambda e: self.logexc("Erreur lecture fichier", e),
+            on_finally=lambda: self._progress_done(),
+            desc="Import fichier",
+        )
 
     def on_load_url(self):
         url, ok = QtWidgets.QInputDialog.getText(
@@ -2614,8 +3888,8 @@ class MainWindow(QtWidgets.QMainWindow):
         self._progress_start()
 
         self._run_in_background(
-            lambda: requests.get(url, timeout=20).text,
-            on_success=lambda text: self.import_merged.emit(text, url),
+            lambda: fetch_m3u_channels(url, timeout=20),
+            on_success=lambda channels: self.import_channels(channels, url),
             on_error=lambda e: self.logexc("Erreur telechargement", e),
             on_finally=lambda: (self.act_import_url.setEnabled(True), self._progress_done()),
             desc="Import URL",
@@ -2626,9 +3900,15 @@ class MainWindow(QtWidgets.QMainWindow):
         )
         if not path:
             return
-        text = Path(path).read_text(encoding="utf-8", errors="ignore")
-        new_channels = parse_m3u(text)
-        self._merge_channels(new_channels, Path(path).name)
+        label = Path(path).name
+        self._progress_start()
+        self._run_in_background(
+            lambda: parse_m3u_file(path),
+            on_success=lambda new_channels: self._merge_channels(new_channels, label),
+            on_error=lambda e: self.logexc("Erreur fusion fichier", e),
+            on_finally=lambda: self._progress_done(),
+            desc="Fusion fichier",
+        )
 
     def on_merge_url(self):
         url, ok = QtWidgets.QInputDialog.getText(
@@ -2641,7 +3921,7 @@ class MainWindow(QtWidgets.QMainWindow):
         self._progress_start()
 
         self._run_in_background(
-            lambda: parse_m3u(requests.get(url, timeout=20).text),
+            lambda: fetch_m3u_channels(url, timeout=20),
             on_success=lambda new_channels: self._merge_channels(new_channels, url),
             on_error=lambda e: self.logexc("Erreur fusion URL", e),
             on_finally=lambda: self._progress_done(),
@@ -2669,7 +3949,7 @@ class MainWindow(QtWidgets.QMainWindow):
             self.logln("Salon: choix invalide.")
             return
         try:
-            rows = self.db.get_channels(pid)
+            rows = self.db.get_channel_rows(pid)
         except Exception as e:
             self.logln(f"Salon: erreur lecture playlist: {e}")
             return
@@ -2682,30 +3962,40 @@ class MainWindow(QtWidgets.QMainWindow):
         )
         if not path:
             return
-        urls = []
+        links: list[str] = []
         for line in Path(path).read_text(encoding="utf-8", errors="ignore").splitlines():
             u = line.strip()
-            if not u.lower().startswith("http"):
-                continue
-            if not (u.lower().endswith(".m3u") or u.lower().endswith(".m3u8")):
-                continue
-            if u not in urls:
-                urls.append(u)
+            low = u.lower()
+            if low.startswith("http") and low.endswith((".m3u", ".m3u8")):
+                links.append(u)
+        urls = list(dict.fromkeys(links))  # dédoublonnage en un passage, ordre du fichier conservé
         if not urls:
             self.logln("Fusion TXT: aucun lien m3u/m3u8 detecte.")
             return
         self.logln(f"Fusion TXT: telechargement {len(urls)} playlist(s)...")
         self._progress_start(len(urls))
 
+        def fetch_one(u: str) -> list[Channel]:
+            # Téléchargement + parsing dans le thread du pool (session partagée, keep-alive).
+            return fetch_m3u_channels(u, timeout=25)
+
         def fetch_all():
+            parsed: dict[str, list[Channel]] = {}
+            step = max(1, len(urls) // 100)
+            with ThreadPoolExecutor(max_workers=min(8, len(urls))) as executor:
+                futures = {executor.submit(fetch_one, u): u for u in urls}
+                for done, fut in enumerate(as_completed(futures), 1):
+                    u = futures[fut]
+                    try:
+                        parsed[u] = fut.result()
+                    except Exception as e:
+                        self.logln(f"Fusion TXT: KO {u}: {e}")
+                    if done % step == 0 or done == len(urls):
+                        self.progress_value.emit(done)
+            # Ordre du fichier TXT conservé, quel que soit l'ordre d'arrivée.
             merged_channels: list[Channel] = []
-            for i, u in enumerate(urls, 1):
-                try:
-                    t = requests.get(u, timeout=25).text
-                    merged_channels.extend(parse_m3u(t))
-                except Exception as e:
-                    self.logln(f"Fusion TXT: KO {u}: {e}")
-                self._progress_update(i)
+            for u in urls:
+                merged_channels.extend(parsed.get(u, ()))
             return merged_channels
 
         self._run_in_background(
@@ -2717,8 +4007,9 @@ class MainWindow(QtWidgets.QMainWindow):
 
 
     def on_merge_streams_api(self):
-        self.streams_widget.set_import_mode("merge")
-        self.streams_widget.ensure_loaded()
+        sw = self._ensure_streams_widget()
+        sw.set_import_mode("merge")
+        sw.ensure_loaded()
         self.tabs.setCurrentIndex(self.streams_tab_index)
 
     def on_test(self):
@@ -2744,18 +4035,19 @@ class MainWindow(QtWidgets.QMainWindow):
         self._probe_worker.moveToThread(self._probe_thread)
 
         self._probe_thread.started.connect(self._probe_worker.run)
-        self._probe_worker.progress.connect(self.on_probe_progress)
+        self._probe_worker.progress_batch.connect(self.on_probe_progress_batch)
         self._probe_worker.progress_count.connect(self.on_probe_progress_count)
         self._probe_worker.finished.connect(self.on_probe_finished)
         self._probe_worker.finished.connect(self._probe_thread.quit)
         self._probe_worker.finished.connect(self._probe_worker.deleteLater)
 
         self.search.setEnabled(False)
-        self.table.setUpdatesEnabled(False)
-        self.refresh_table(resize_columns=False)
-        self.table.resizeColumnsToContents()
-        self.table.setUpdatesEnabled(True)
+        with self._table_bulk():
+            self.refresh_table(resize_columns=False)
+            self._fit_channel_columns(len(self.channels))
 
+        self._pending_probe.clear()
+        self._probe_flush_timer.start()
         self._probe_thread.start()
 
     def on_export_salon(self):
@@ -2771,10 +4063,7 @@ class MainWindow(QtWidgets.QMainWindow):
                         self.db.delete_playlist(int(self._editing_playlist_id))
                         self.logln("Salon: playlist supprimée (vide).")
                         self._reset_editing_context()
-                        try:
-                            self.salon_tab.refresh()
-                        except Exception:
-                            pass
+                        self._refresh_salon_if_built()
                     except Exception as e:
                         self.logln(f"Salon: erreur suppression playlist: {e}")
                 return
@@ -2859,47 +4148,53 @@ class MainWindow(QtWidgets.QMainWindow):
             self._editing_playlist_id = pid
             self._editing_playlist_name = name
 
-        payload = [
-            {
-                "name": c.name,
-                "group": c.group,
-                "tvg_id": c.tvg_id,
-                "url": c.url,
-                "extinf": c.extinf,
-                "vlc_opts": getattr(c, "vlc_opts", []) or [],
-            }
-            for c in data
-        ]
-        self.db.replace_channels(pid, payload)
+        # Tuples lus par attrgetter (C), sans dict intermédiaire par chaîne.
+        written = self.db.replace_channel_rows(pid, map(_CHANNEL_ROW, data))
 
         action = "mis à jour" if is_update else "exporté"
-        self.logln(f"Salon: {action} -> '{name}' ({len(payload)} chaînes).")
+        self.logln(f"Salon: {action} -> '{name}' ({written} chaînes).")
         self._editing_playlist_id = pid
         self._editing_playlist_name = name
         self._update_export_salon_label()
-        try:
-            self.salon_tab.refresh()
-        except Exception:
-            pass
+        self._refresh_salon_if_built()
 
     @QtCore.Slot(int, int)
     def on_probe_progress_count(self, done: int, total: int):
         self._probe_done = done
         self._probe_total = total
+        now = time.monotonic()
+        if now - self._last_status_ts < 0.1 and done != total:
+            return
+        self._last_status_ts = now
         self.lbl_probe_status.setText(f"Test URLs: {done}/{total}")
 
-    @QtCore.Slot(int, str)
-    def on_probe_progress(self, row: int, status: str):
-        self.channels[row].status = status
-        item = self.table.item(row, 5)
-        if item is None:
-            item = QtWidgets.QTableWidgetItem(status)
-            self.table.setItem(row, 5, item)
-        else:
-            item.setText(status)
+    @QtCore.Slot(list)
+    def on_probe_progress_batch(self, batch: list):
+        # Simple mise en attente: _flush_probe_progress applique le lot au prochain tick.
+        self._pending_probe.update(batch)
+
+    def _flush_probe_progress(self):
+        if not self._pending_probe:
+            return
+        pending, self._pending_probe = self._pending_probe, {}
+        self._last_filter = None  # statuts modifiés: un résultat de filtre antérieur n'est plus un sur-ensemble
+        # Les textes de recherche ne sont recalculés qu'à la prochaine frappe (_channel_haystacks),
+        # pas à chaque tick de sonde: le statut change des milliers de fois pendant un test.
+        channels = self.channels
+        for row, status in pending.items():
+            if row >= len(channels):
+                continue
+            ch = channels[row]
+            ch.status = status
+            ch._search_hay = ""
+        self._haystacks_dirty.update(pending)
+        # Un seul dataChanged couvrant les lignes touchées du lot
+        self.channels_model.refresh_span(min(pending), max(pending), ChannelTableModel.COL_STATUS)
 
     @QtCore.Slot()
     def on_probe_finished(self):
+        self._probe_flush_timer.stop()
+        self._flush_probe_progress()
         self.logln("Test termine.")
         self.btn_test.setEnabled(True)
         self.btn_stop.setEnabled(False)
@@ -2922,10 +4217,49 @@ class MainWindow(QtWidgets.QMainWindow):
             self.logln("Stop demande.")
             self.lbl_probe_status.setText("Test URLs: stop demande")
 
+    def _source_rows(self, view_rows: list[int]) -> list[int]:
+        """Lignes de la table -> positions dans self.channels (triées), sans comparer de textes."""
+        shown = self._table_shown
+        if shown is not None and shown[0] is self.channels:
+            positions = shown[1]
+            return sorted(positions[r] if positions is not None else r for r in view_rows)
+        # Affichage posé hors apply_filter: correspondance par identité des objets affichés.
+        where = {id(c): i for i, c in enumerate(self.channels)}
+        model = self.channels_model
+        return sorted(
+            i for i in (where.get(id(model.channel(r))) for r in view_rows) if i is not None
+        )
+
+    def _remove_channels(self, drop) -> int:
+        """Retire les chaînes pour lesquelles drop(c) est vrai."""
+        return self._remove_rows([i for i, c in enumerate(self.channels) if drop(c)])
+
+    def _remove_rows(self, rows: list[int]) -> int:
+        """
+        Retire les positions `rows` (triées) de self.channels: la liste restante est recopiée par tranches,
+        et l'index url suit sans reconstruction.
+        """
+        if not rows:
+            return 0
+        channels = self.channels
+        kept: list[Channel] = []
+        prev = 0
+        for i in rows:
+            kept.extend(channels[prev:i])
+            prev = i + 1
+        kept.extend(channels[prev:])
+        removed = [channels[i] for i in rows]
+        if self._url_index_src is channels:
+            # Index synchronisé: une entrée par chaîne, on retire seulement les clés supprimées.
+            for c in removed:
+                self._url_index.pop((c.url or "").strip(), None)
+            self._url_index_src = kept
+        self.channels = kept
+        return len(removed)
+
     def on_delete_dead(self):
-        before = len(self.channels)
-        self.channels = [c for c in self.channels if not c.status.startswith("KO")]
-        self.logln(f"Supprimé KO: {before - len(self.channels)}")
+        removed = self._remove_channels(lambda c: c.status.startswith("KO"))
+        self.logln(f"Supprimé KO: {removed}")
         self.apply_filter()
 
     def on_delete_selected(self):
@@ -2933,16 +4267,10 @@ class MainWindow(QtWidgets.QMainWindow):
         if not sel:
             return
 
-        selected_keys = set()
-        for idx in sel:
-            r = idx.row()
-            name = self.table.item(r, 0).text()
-            url = self.table.item(r, 6).text()
-            selected_keys.add((name, url))
-
-        before = len(self.channels)
-        self.channels = [c for c in self.channels if (c.name, c.url) not in selected_keys]
-        self.logln(f"Supprime selection: {before - len(self.channels)}")
+        # Positions source directement (doublons nom/url compris): aucune clé texte à hacher.
+        rows = self._source_rows([idx.row() for idx in sel])
+        removed = self._remove_rows(rows)
+        self.logln(f"Supprime selection: {removed}")
         self.apply_filter()
 
     def on_export(self):
@@ -2953,8 +4281,16 @@ class MainWindow(QtWidgets.QMainWindow):
         )
         if not path:
             return
-        write_m3u(self.channels, Path(path))
-        self.logln(f"Exporte: {path}")
+        # Écriture hors du thread UI sur un instantané de la liste (gros exports: plusieurs secondes).
+        channels = list(self.channels)
+        self.act_export_filtered.setEnabled(False)
+        self._run_in_background(
+            lambda: write_m3u(channels, Path(path)),
+            on_success=lambda written: self.logln(f"Exporte: {path} ({written} chaines)"),
+            on_error=lambda e: self.logexc("Erreur export", e),
+            on_finally=lambda: self.act_export_filtered.setEnabled(True),
+            desc="Export M3U",
+        )
 
     def on_send_to_player(self):
         if not self.channels:
@@ -2972,28 +4308,48 @@ class MainWindow(QtWidgets.QMainWindow):
             self.logln(f"Lecteur: erreur chargement playlist: {e}")
             return
 
-    def _tree_click_expand(self, item, column):
-        if not item.text(1).strip():
-            item.setExpanded(not item.isExpanded())
+    def _tree_click_expand(self, index: QtCore.QModelIndex):
+        if not index.parent().isValid():
+            index = index.siblingAtColumn(0)
+            self.tree.setExpanded(index, not self.tree.isExpanded(index))
 
-    def on_tree_selection_changed(self):
-        self.btn_load_selected_list.setEnabled(len(self.tree.selectedItems()) > 0)
+    def on_tree_selection_changed(self, *_):
+        self.btn_load_selected_list.setEnabled(self.tree.selectionModel().hasSelection())
 
     def on_open_streams_dialog(self):
-        self.streams_widget.set_import_mode("replace")
-        self.streams_widget.ensure_loaded()
+        sw = self._ensure_streams_widget()
+        sw.set_import_mode("replace")
+        sw.ensure_loaded()
         self.tabs.setCurrentIndex(self.streams_tab_index)
 
     def on_refresh_playlists(self):
         self.btn_refresh_lists.setEnabled(False)
         self.btn_load_selected_list.setEnabled(False)
-        self.tree.clear()
-        self._all_tree_items.clear()
+        self.playlists_proxy.set_visible(None)
+        self.playlists_model.set_buckets([])
+        self._set_tree_haystacks([])
+        self._tree_filter_cache.clear()
         self.logln("Récupération playlists (api iptv-org, fallback PLAYLISTS.md)…")
         self._progress_start()
 
+        cache_path = self._playlists_cache_path
+
+        def fetch():
+            # Réseau d'abord; le cache disque est réécrit, et sert de repli hors-ligne.
+            cached = load_playlists_index_cache(cache_path)
+            try:
+                idx = fetch_playlists_index(cached=cached)
+            except Exception as e:
+                idx = cached
+                if not idx:
+                    raise
+                self.logln(f"Playlists: réseau KO ({e}), index du cache disque utilisé.", level="WARN")
+                return idx
+            save_playlists_index_cache(cache_path, idx)
+            return idx
+
         self._run_in_background(
-            fetch_playlists_index,
+            fetch,
             on_success=lambda idx: self.playlists_loaded.emit(idx),
             on_error=lambda e: self.playlists_error.emit(str(e)),
             on_finally=lambda: self._progress_done(),
@@ -3008,74 +4364,145 @@ class MainWindow(QtWidgets.QMainWindow):
     @QtCore.Slot(dict)
     def _populate_tree(self, idx: dict):
         self._playlists_index = idx
-        self.tree.clear()
-        self._all_tree_items.clear()
+        self._tree_filter_cache.clear()
 
         src = (idx.get("__source__") or "").strip().lower()
-        if src == "api":
+        fetched_at = idx.get("__fetched_at__")
+        if fetched_at:
+            when = time.strftime("%Y-%m-%d %H:%M", time.localtime(fetched_at))
+            self.logln(f"Source playlists: cache disque ({when}); « Lister playlists » pour mettre à jour.")
+        elif src == "api":
             self.logln("Source playlists: API iptv-org (feeds.json).")
         elif src == "md":
             self.logln("Source playlists: fallback PLAYLISTS.md.")
 
-        def add_bucket(title: str, items: list[tuple[str, str]]):
-            parent = QtWidgets.QTreeWidgetItem([title, ""])
-            parent.setExpanded(False)
-            self.tree.addTopLevelItem(parent)
-            for name, url in items:
-                child = QtWidgets.QTreeWidgetItem([name, url])
-                parent.addChild(child)
-                hay = f"{title} {name} {url}".lower()
-                self._all_tree_items.append((child, hay))
-
-        add_bucket("Category", idx.get("Category", []))
-        add_bucket("Language", idx.get("Language", []))
-        add_bucket("Country", idx.get("Country", []))
+        titles = ["Category", "Language", "Country"]
         if idx.get("Subdivision/City"):
-            add_bucket("Subdivision/City", idx.get("Subdivision/City", []))
-
-        self.tree.resizeColumnToContents(0)
-        self.tree.resizeColumnToContents(1)
+            titles.append("Subdivision/City")
+        # Ordre d'affichage (tri courant de l'en-tête) appliqué par le modèle lui-même.
+        buckets = [(title, list(idx.get(title, []))) for title in titles]
+        # Textes de recherche dérivés du modèle à la première frappe seulement (pas de liste parallèle ici)
+        self._tree_haystacks_stale = True
+
+        # Un seul reset (le modèle trie ses listes une fois); largeurs gérées par les modes du header
+        # (colonne 0 au contenu, colonne 1 étirée), sans mesure explicite après coup.
+        self.tree.setUpdatesEnabled(False)
         try:
-            self.tree.sortItems(0, QtCore.Qt.SortOrder.AscendingOrder)
-        except Exception:
-            pass
+            self.playlists_proxy.set_visible(None)
+            self.playlists_model.set_buckets(buckets)
+            if self.list_search.text().strip():
+                self.apply_tree_filtreer()
+        finally:
+            self.tree.setUpdatesEnabled(True)
         self.btn_refresh_lists.setEnabled(True)
         self.logln("OK: playlists chargées. Déplie Category/Language/Country puis sélectionne → « Charger la sélection ».")
 
+    def _ensure_tree_haystacks(self):
+        if self._tree_haystacks_stale:
+            self._tree_haystacks_stale = False
+            self._set_tree_haystacks(
+                [f"{title} {name} {url}".casefold() for title, name, url in self.playlists_model.iter_flat()]
+            )
+
+    def _set_tree_haystacks(self, hays: list[str]):
+        self._tree_haystacks_stale = False
+        self._tree_haystacks = hays
+        self._tree_blob, self._tree_starts = _join_haystacks(hays)
+        self._tree_last_filter = None
+
+    def _tree_rows_containing(self, needle: str) -> Iterator[int]:
+        return _rows_containing(self._tree_blob, self._tree_starts, needle)
+
+    @staticmethod
+    def _tree_item_matches(q: str, q_tokens: list[str], pattern: re.Pattern | None, hay: str) -> bool:
+        if not q_tokens or pattern is None:
+            return q in hay
+        # Chaque mot de la requête doit être un mot (ou un début de mot) de l'item.
+        words = pattern.findall(hay)
+        if not words:
+            return False
+        return all(any(w.startswith(tok) for w in words) for tok in q_tokens)
+
     def apply_tree_filtreer(self):
-        q = self.list_search.text().strip().lower()
-        if not q:
-            for item, _ in self._all_tree_items:
-                item.setHidden(False)
+        # casefold des deux côtés (comme les haystacks): « Straße » trouve « strasse », İ/ı cohérents.
+        q = self.list_search.text().strip().casefold()
+        if len(q) < TREE_FILTER_MIN_CHARS:
+            # Requête vide ou d'un seul caractère: elle garderait presque tout, au prix d'un
+            # dépliage de milliers de lignes. On montre l'index complet (reset une seule fois).
+            if self.playlists_proxy.is_filtered():
+                self.playlists_proxy.set_visible(None)
             return
-        for item, hay in self._all_tree_items:
-            item.setHidden(q not in hay)
 
-    def on_load_selected_playlists(self):
-        selected = self.tree.selectedItems()
-        if not selected:
+        visible = self._tree_filter_cache.get(q)
+        if visible is None:
+            q_tokens = SEARCH_TOKEN_RE.findall(q)
+            # Candidats = textes contenant le token le plus long (condition nécessaire), trouvés par
+            # str.find sur le bloc contigu; la correspondance exacte n'est vérifiée que sur eux.
+            needle = max(q_tokens, key=len) if q_tokens else q
+            self._ensure_tree_haystacks()
+            hays = self._tree_haystacks
+            last = self._tree_last_filter
+            if last is not None and q.startswith(last[0]) and bool(SEARCH_TOKEN_RE.search(last[0])) == bool(q_tokens):
+                # Requête qui s'allonge (même mode de correspondance): chaque token précédent est préfixe
+                # d'un token courant, le résultat est inclus dans le précédent; on ne revérifie que lui.
+                candidates = (i for i in last[1] if needle in hays[i])
+            else:
+                candidates = self._tree_rows_containing(needle)
+            # Motif compilé une fois par requête, pas une recherche dans le cache par ligne.
+            pattern = _compile_search_query(tuple(q_tokens)) if q_tokens else None
+            matches = self._tree_item_matches
+            # Les autres tokens doivent aussi apparaître tels quels: simple test de sous-chaîne
+            # avant l'analyse par mots (regex) réservée aux lignes qui les contiennent tous.
+            others = [t for t in dict.fromkeys(q_tokens) if t != needle]
+            visible = [False] * len(hays)
+            rows: list[int] = []
+            for i in candidates:
+                hay = hays[i]
+                if all(t in hay for t in others) and matches(q, q_tokens, pattern, hay):
+                    visible[i] = True
+                    rows.append(i)
+            self._tree_last_filter = (q, rows)
+            if len(self._tree_filter_cache) >= 64:
+                self._tree_filter_cache.clear()
+            self._tree_filter_cache[q] = visible
+
+        if self.playlists_proxy.has_mask(visible):
+            # Même ensemble visible (ex: un caractère de plus qui n'élimine rien): ni invalidation
+            # du proxy ni repli/dépliage, la vue garde son état.
             return
 
-        def collect_urls(item: QtWidgets.QTreeWidgetItem) -> list[str]:
-            # Recursively walk the tree to gather playlist URLs from any selected node.
-            urls = []
-            u = item.text(1).strip()
-            if u.startswith("http"):
-                urls.append(u)
-            for i in range(item.childCount()):
-                urls.extend(collect_urls(item.child(i)))
-            return urls
+        # Replié avant filtrage: la vue ne remet en page que les buckets rouverts ensuite.
+        # Le proxy applique le masque en une passe (aucun setHidden par item).
+        was_updating = self.tree.updatesEnabled()
+        self.tree.setUpdatesEnabled(False)
+        try:
+            self.tree.collapseAll()
+            self.playlists_proxy.set_visible(visible)
+            if sum(visible) <= 10:
+                self.tree.expandAll()
+            else:
+                proxy = self.playlists_proxy
+                for r in range(proxy.rowCount()):
+                    top = proxy.index(r, 0)
+                    if proxy.rowCount(top):
+                        self.tree.expand(top)
+        finally:
+            self.tree.setUpdatesEnabled(was_updating)
 
-        urls = []
-        for it in selected:
-            urls.extend(collect_urls(it))
+    def on_load_selected_playlists(self):
+        selected = self.tree.selectionModel().selectedRows(0)
+        if not selected:
+            return
 
-        seen = set()
-        urls_unique = []
-        for u in urls:
-            if u not in seen:
-                seen.add(u)
-                urls_unique.append(u)
+        # Un bucket sélectionné apporte toutes ses playlists (y compris masquées par le filtre),
+        # dédoublonnées par dict.fromkeys dans l'ordre de sélection.
+        model, proxy = self.playlists_model, self.playlists_proxy
+        urls_unique: list[str] = list(dict.fromkeys(
+            u
+            for index in selected
+            for u in (raw.strip() for raw in model.urls_under(proxy.mapToSource(index)))
+            if u.startswith("http")
+        ))
 
         if not urls_unique:
             self.logln("Aucune URL détectée. Sélectionne une feuille (URL) ou un parent (Category/Language/Country).")
@@ -3085,48 +4512,64 @@ class MainWindow(QtWidgets.QMainWindow):
         self._progress_start(len(urls_unique))
 
         def fetch_and_merge():
-            merged_texts = []
-            for i, url in enumerate(urls_unique, 1):
-                try:
-                    t = requests.get(url, timeout=25).text
-                    merged_texts.append(t)
-                except Exception as e:
-                    merged_texts.append("")
-                    self.playlists_error.emit(f"KO {url}: {e}")
-                self._progress_update(i)
-
-            # Merge simple: concatène toutes les lignes non vides (en gardant un seul EXTM3U).
-            out = ["#EXTM3U"]
-            for t in merged_texts:
-                for line in t.splitlines():
-                    if line.strip() and line.strip() != "#EXTM3U":
-                        out.append(line.rstrip())
-            final = "\n".join(out) + "\n"
+            # Téléchargements en parallèle sur la session partagée, chaque playlist parsée en flux
+            # pendant sa lecture réseau; ordre de sélection conservé au merge.
+            parsed: dict[str, list[Channel]] = {}
+            step = max(1, len(urls_unique) // 100)
+            with ThreadPoolExecutor(max_workers=min(12, len(urls_unique))) as executor:
+                futures = {executor.submit(fetch_m3u_channels, u, 25): u for u in urls_unique}
+                for i, fut in enumerate(as_completed(futures), 1):
+                    url = futures[fut]
+                    try:
+                        parsed[url] = fut.result()
+                    except Exception as e:
+                        self.playlists_error.emit(f"KO {url}: {e}")
+                    if i % step == 0 or i == len(urls_unique):
+                        self.progress_value.emit(i)
+
+            # Merge simple: concaténation des chaînes déjà parsées, l'UI ne reçoit que la liste finale.
+            channels = [ch for u in urls_unique for ch in parsed.get(u, ())]
 
             label = ", ".join(urls_unique[:3]) + ("…" if len(urls_unique) > 3 else "")
-            return final, label
+            return channels, label
 
         self._run_in_background(
             fetch_and_merge,
-            on_success=lambda res: self.import_merged.emit(res[0], res[1]),
+            on_success=lambda res: self.import_channels(res[0], res[1]),
             on_finally=lambda: self._progress_done(),
             desc="Chargement playlists sélectionnées",
         )
 
     @QtCore.Slot(str, str)
     def _import_merged(self, text: str, label: str):
-        self.import_m3u_text(text, label)
+        # Texte M3U reçu d'un autre onglet/dialogue: parsing hors du thread UI (gros imports API).
+        self._run_in_background(
+            lambda: parse_m3u(text),
+            on_success=lambda channels: self.import_channels(channels, label),
+            on_error=lambda e: self.logln(f"Import: parsing KO ({label}): {e}", level="ERROR"),
+            desc="Import M3U",
+        )
 
     # -------------------------
     # Config persistante
     # -------------------------
     def _load_user_config(self) -> dict:
+        # Mis en cache jusqu'au prochain _save_user_config (copie pour éviter les mutations externes).
+        cached = self._user_config_cache
+        if cached is not None:
+            return dict(cached)
+        cfg = {}
         try:
             if self.config_path.exists():
-                return json.loads(self.config_path.read_text(encoding="utf-8"))
+                raw = self.config_path.read_bytes()
+                self._last_saved_cfg_bytes = raw
+                cfg = json.loads(raw.decode("utf-8"))
         except Exception:
-            return {}
-        return {}
+            cfg = {}
+        if not isinstance(cfg, dict):
+            cfg = {}
+        self._user_config_cache = cfg
+        return dict(cfg)
 
     def _save_user_config(self):
         try:
@@ -3136,8 +4579,16 @@ class MainWindow(QtWidgets.QMainWindow):
                 "style": self._current_style,
                 "epg_path": self._current_epg_path,
             }
-            self.config_path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+            payload = json.dumps(data, indent=2).encode("utf-8")
+            self._user_config_cache = data
+            if payload == self._last_saved_cfg_bytes:
+                return  # contenu identique au fichier: aucune écriture
+            # Écriture atomique: un arrêt brutal ne laisse jamais un config.json tronqué.
+            tmp = self.config_path.with_suffix(".tmp")
+            tmp.write_bytes(payload)
+            os.replace(tmp, self.config_path)
+            self._last_saved_cfg_bytes = payload
         except Exception:
-            pass
+            self._user_config_cache = None
 
 
@@ -68,14 +68,29 @@ class SettingsTab(QtWidgets.QWidget):
         layout.addLayout(btn_row)
         layout.addStretch(1)
 
+        # Saisie du chemin EPG: une prévisualisation après une pause de frappe, pas une par caractère.
+        # Les combos (un signal par sélection) restent directs.
+        self._preview_timer = QtCore.QTimer(self)
+        self._preview_timer.setSingleShot(True)
+        self._preview_timer.setInterval(150)
+        self._preview_timer.timeout.connect(self._emit_preview)
+
         self.cmb_theme.currentTextChanged.connect(self._emit_preview)
         self.cmb_style.currentTextChanged.connect(self._emit_preview)
-        self.txt_epg_path.textChanged.connect(self._emit_preview)
+        self.txt_epg_path.textChanged.connect(self._schedule_preview)
         self.btn_epg_browse.clicked.connect(self._browse_epg_path)
         self.btn_save.clicked.connect(self._emit_save)
 
-    def _emit_preview(self, *_):
+    @QtCore.Slot(str)
+    def _schedule_preview(self, _text: str):
+        self._preview_timer.start()
+
+    # Deux signatures: currentTextChanged(QString) des combos et timeout() du minuteur.
+    @QtCore.Slot()
+    @QtCore.Slot(str)
+    def _emit_preview(self, _text: str = ""):
         # Prévisualisation immédiate dans les widgets, l'enregistrement se fait via MainWindow au clic sur Enregistrer.
+        self._preview_timer.stop()  # ce payload inclut déjà la saisie en attente
         payload = {
             "theme": self.cmb_theme.currentText(),
             "style": self.cmb_style.currentText(),
@@ -83,7 +98,9 @@ class SettingsTab(QtWidgets.QWidget):
         }
         self.config_preview.emit(payload)
 
+    @QtCore.Slot()
     def _emit_save(self):
+        self._preview_timer.stop()
         payload = {
             "theme": self.cmb_theme.currentText(),
             "style": self.cmb_style.currentText(),
@@ -91,8 +108,19 @@ class SettingsTab(QtWidgets.QWidget):
         }
         self.config_changed.emit(payload)
 
+    @QtCore.Slot()
     def _browse_epg_path(self):
+        # Dialogue ouvert par open() (asynchrone): la boucle d'événements continue de tourner
+        # (journal, progression des tests) pendant la navigation, contrairement à getExistingDirectory().
         start_dir = self.txt_epg_path.text().strip() or str(Path.home())
-        chosen = QtWidgets.QFileDialog.getExistingDirectory(self, "Choisir le dossier EPG", start_dir)
+        dlg = QtWidgets.QFileDialog(self, "Choisir le dossier EPG", start_dir)
+        dlg.setFileMode(QtWidgets.QFileDialog.FileMode.Directory)
+        dlg.setOption(QtWidgets.QFileDialog.Option.ShowDirsOnly, True)
+        dlg.setAttribute(QtCore.Qt.WidgetAttribute.WA_DeleteOnClose)
+        dlg.fileSelected.connect(self._on_epg_dir_selected)
+        dlg.open()
+
+    @QtCore.Slot(str)
+    def _on_epg_dir_selected(self, chosen: str):
         if chosen:
             self.txt_epg_path.setText(chosen)
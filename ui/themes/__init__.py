@@ -2,10 +2,28 @@ from __future__ import annotations
 
 import importlib.util
 from dataclasses import dataclass
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Dict, List
+from typing import Callable, Dict, Iterable, List
 
-from PySide6 import QtGui, QtWidgets
+from PySide6 import QtGui
+
+from ._base import fusion_base
+from . import dark, dracula, forest, light, midnight, monokai, neon, ocean, pastel, retro, sand, solarized, sunset
+
+# Thèmes intégrés: importés normalement (mis en cache par sys.modules), sans chargeur dynamique.
+# Ordre alphabétique des fichiers, comme l'ancien parcours du dossier.
+_REGISTRY = {
+    mod.THEME_NAME: mod.build_palette
+    for mod in (dark, dracula, forest, light, midnight, monokai, neon, ocean, pastel, retro, sand, solarized, sunset)
+}
+_BUILTIN_DIR = Path(__file__).parent.resolve()
+
+
+@lru_cache(maxsize=None)
+def _builtin_palette(name: str) -> QtGui.QPalette:
+    """Palette d'un thème intégré, construite au premier usage puis réutilisée (immuable par thème)."""
+    return _REGISTRY[name]()
 
 
 @dataclass
@@ -25,19 +43,30 @@ def _load_module(path: Path):
 
 def discover_themes(theme_dir: Path | None = None) -> Dict[str, ThemeSpec]:
     """
-    Charge dynamiquement chaque fichier de thème dans ui/themes/*.py (hors __init__.py).
-    Chaque module doit exposer THEME_NAME et build_palette() -> QPalette.
+    Thèmes de ui/themes (registre statique, palettes mémorisées par nom) ou, pour un autre dossier,
+    chargement dynamique de chaque fichier *.py (hors __init__.py).
+    Chaque module expose THEME_NAME et build_palette() -> QPalette.
     """
-    theme_dir = theme_dir or Path(__file__).parent
-    themes: Dict[str, ThemeSpec] = {}
+    theme_dir = (theme_dir or _BUILTIN_DIR).resolve()
+    if theme_dir == _BUILTIN_DIR:
+        return _build_themes((name, partial(_builtin_palette, name)) for name in _REGISTRY)
+    builders = []
     for p in sorted(theme_dir.glob("*.py")):
         if p.name == "__init__.py":
             continue
-        mod = _load_module(p)
-        if not mod:
+        try:
+            mod = _load_module(p)
+        except Exception:
+            # ex: copie d'un thème intégré (import relatif de ._base) hors du paquet
             continue
-        name = getattr(mod, "THEME_NAME", p.stem)
-        build_palette = getattr(mod, "build_palette", None)
+        if mod:
+            builders.append((getattr(mod, "THEME_NAME", p.stem), getattr(mod, "build_palette", None)))
+    return _build_themes(builders)
+
+
+def _build_themes(builders: Iterable[tuple[str, Callable[[], QtGui.QPalette] | None]]) -> Dict[str, ThemeSpec]:
+    themes: Dict[str, ThemeSpec] = {}
+    for name, build_palette in builders:
         if callable(build_palette):
             try:
                 pal = build_palette()
@@ -47,10 +76,24 @@ def discover_themes(theme_dir: Path | None = None) -> Dict[str, ThemeSpec]:
                 continue
     if not themes:
         # Fallback minimal : palette Fusion claire
-        base = QtWidgets.QStyleFactory.create("Fusion").standardPalette()
-        themes["light"] = ThemeSpec("light", base)
+        themes["light"] = ThemeSpec("light", fusion_base())
     return themes
 
 
-def theme_names(theme_dir: Path | None = None) -> List[str]:
-    return list(discover_themes(theme_dir).keys())
+def get_theme(name: str, theme_dir: Path | None = None) -> ThemeSpec | None:
+    """Un seul thème: pour ui/themes, seule sa palette est construite (les autres restent à faire)."""
+    theme_dir = (theme_dir or _BUILTIN_DIR).resolve()
+    if theme_dir != _BUILTIN_DIR:
+        return discover_themes(theme_dir).get(name)
+    if name not in _REGISTRY:
+        return None
+    try:
+        pal = _builtin_palette(name)
+    except Exception:
+        return None
+    return ThemeSpec(name=name, palette=pal) if isinstance(pal, QtGui.QPalette) else None
+
+
+def theme_names() -> List[str]:
+    """Noms des thèmes intégrés (ordre du registre), sans construire de palette."""
+    return list(_REGISTRY)
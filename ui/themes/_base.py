@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Iterable
+
+from PySide6 import QtGui, QtWidgets
+
+# Socle commun des thèmes intégrés (pas un thème: ignoré par le registre de ui/themes).
+
+
+@lru_cache(maxsize=1)
+def _fusion_standard() -> QtGui.QPalette:
+    # Un seul QStyle Fusion instancié par processus, au lieu d'un par thème construit.
+    return QtWidgets.QStyleFactory.create("Fusion").standardPalette()
+
+
+def fusion_base() -> QtGui.QPalette:
+    """Copie de la palette standard Fusion, à personnaliser par chaque build_palette()."""
+    return QtGui.QPalette(_fusion_standard())
+
+
+def apply_colors(
+    pal: QtGui.QPalette, colors: Iterable[tuple[QtGui.QPalette.ColorRole, QtGui.QColor]]
+) -> QtGui.QPalette:
+    """
+    Applique des paires (rôle, QColor) construites une fois à l'import du thème:
+    aucun QColor créé ni rôle résolu à chaque construction de palette.
+    """
+    set_color = pal.setColor
+    for role, color in colors:
+        set_color(role, color)
+    return pal
@@ -1,19 +1,23 @@
 from __future__ import annotations
 
-from PySide6 import QtGui, QtWidgets
+from PySide6 import QtGui
+
+from ._base import apply_colors, fusion_base
 
 THEME_NAME = "dark"
 
+_COLORS = (
+    (QtGui.QPalette.Window, QtGui.QColor(45, 45, 45)),
+    (QtGui.QPalette.Base, QtGui.QColor(35, 35, 35)),
+    (QtGui.QPalette.AlternateBase, QtGui.QColor(40, 40, 40)),
+    (QtGui.QPalette.Text, QtGui.QColor(230, 230, 230)),
+    (QtGui.QPalette.WindowText, QtGui.QColor(230, 230, 230)),
+    (QtGui.QPalette.Button, QtGui.QColor(55, 55, 55)),
+    (QtGui.QPalette.ButtonText, QtGui.QColor(230, 230, 230)),
+    (QtGui.QPalette.Highlight, QtGui.QColor(90, 140, 255)),
+    (QtGui.QPalette.HighlightedText, QtGui.QColor(0, 0, 0)),
+)
+
 
 def build_palette() -> QtGui.QPalette:
-    pal = QtWidgets.QStyleFactory.create("Fusion").standardPalette()
-    pal.setColor(QtGui.QPalette.Window, QtGui.QColor(45, 45, 45))
-    pal.setColor(QtGui.QPalette.Base, QtGui.QColor(35, 35, 35))
-    pal.setColor(QtGui.QPalette.AlternateBase, QtGui.QColor(40, 40, 40))
-    pal.setColor(QtGui.QPalette.Text, QtGui.QColor(230, 230, 230))
-    pal.setColor(QtGui.QPalette.WindowText, QtGui.QColor(230, 230, 230))
-    pal.setColor(QtGui.QPalette.Button, QtGui.QColor(55, 55, 55))
-    pal.setColor(QtGui.QPalette.ButtonText, QtGui.QColor(230, 230, 230))
-    pal.setColor(QtGui.QPalette.Highlight, QtGui.QColor(90, 140, 255))
-    pal.setColor(QtGui.QPalette.HighlightedText, QtGui.QColor(0, 0, 0))
-    return pal
+    return apply_colors(fusion_base(), _COLORS)
@@ -1,19 +1,23 @@
 from __future__ import annotations
 
-from PySide6 import QtGui, QtWidgets
+from PySide6 import QtGui
+
+from ._base import apply_colors, fusion_base
 
 THEME_NAME = "forest"
 
+_COLORS = (
+    (QtGui.QPalette.Window, QtGui.QColor(25, 45, 30)),
+    (QtGui.QPalette.Base, QtGui.QColor(35, 60, 40)),
+    (QtGui.QPalette.AlternateBase, QtGui.QColor(40, 70, 45)),
+    (QtGui.QPalette.Text, QtGui.QColor(220, 235, 220)),
+    (QtGui.QPalette.WindowText, QtGui.QColor(220, 235, 220)),
+    (QtGui.QPalette.Button, QtGui.QColor(40, 70, 45)),
+    (QtGui.QPalette.ButtonText, QtGui.QColor(220, 235, 220)),
+    (QtGui.QPalette.Highlight, QtGui.QColor(80, 170, 110)),
+    (QtGui.QPalette.HighlightedText, QtGui.QColor(10, 25, 15)),
+)
+
 
 def build_palette() -> QtGui.QPalette:
-    pal = QtWidgets.QStyleFactory.create("Fusion").standardPalette()
-    pal.setColor(QtGui.QPalette.Window, QtGui.QColor(25, 45, 30))
-    pal.setColor(QtGui.QPalette.Base, QtGui.QColor(35, 60, 40))
-    pal.setColor(QtGui.QPalette.AlternateBase, QtGui.QColor(40, 70, 45))
-    pal.setColor(QtGui.QPalette.Text, QtGui.QColor(220, 235, 220))
-    pal.setColor(QtGui.QPalette.WindowText, QtGui.QColor(220, 235, 220))
-    pal.setColor(QtGui.QPalette.Button, QtGui.QColor(40, 70, 45))
-    pal.setColor(QtGui.QPalette.ButtonText, QtGui.QColor(220, 235, 220))
-    pal.setColor(QtGui.QPalette.Highlight, QtGui.QColor(80, 170, 110))
-    pal.setColor(QtGui.QPalette.HighlightedText, QtGui.QColor(10, 25, 15))
-    return pal
+    return apply_colors(fusion_base(), _COLORS)
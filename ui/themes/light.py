@@ -1,20 +1,24 @@
 from __future__ import annotations
 
-from PySide6 import QtGui, QtWidgets
+from PySide6 import QtGui
+
+from ._base import apply_colors, fusion_base
 
 THEME_NAME = "light"
 
+# Palette explicite pour écraser toute influence du thème système.
+_COLORS = (
+    (QtGui.QPalette.Window, QtGui.QColor(245, 245, 245)),
+    (QtGui.QPalette.Base, QtGui.QColor(255, 255, 255)),
+    (QtGui.QPalette.AlternateBase, QtGui.QColor(245, 245, 245)),
+    (QtGui.QPalette.Text, QtGui.QColor(30, 30, 30)),
+    (QtGui.QPalette.WindowText, QtGui.QColor(30, 30, 30)),
+    (QtGui.QPalette.Button, QtGui.QColor(245, 245, 245)),
+    (QtGui.QPalette.ButtonText, QtGui.QColor(30, 30, 30)),
+    (QtGui.QPalette.Highlight, QtGui.QColor(76, 163, 224)),
+    (QtGui.QPalette.HighlightedText, QtGui.QColor(255, 255, 255)),
+)
+
 
 def build_palette() -> QtGui.QPalette:
-    pal = QtWidgets.QStyleFactory.create("Fusion").standardPalette()
-    # Palette explicite pour écraser toute influence du thème système.
-    pal.setColor(QtGui.QPalette.Window, QtGui.QColor(245, 245, 245))
-    pal.setColor(QtGui.QPalette.Base, QtGui.QColor(255, 255, 255))
-    pal.setColor(QtGui.QPalette.AlternateBase, QtGui.QColor(245, 245, 245))
-    pal.setColor(QtGui.QPalette.Text, QtGui.QColor(30, 30, 30))
-    pal.setColor(QtGui.QPalette.WindowText, QtGui.QColor(30, 30, 30))
-    pal.setColor(QtGui.QPalette.Button, QtGui.QColor(245, 245, 245))
-    pal.setColor(QtGui.QPalette.ButtonText, QtGui.QColor(30, 30, 30))
-    pal.setColor(QtGui.QPalette.Highlight, QtGui.QColor(76, 163, 224))
-    pal.setColor(QtGui.QPalette.HighlightedText, QtGui.QColor(255, 255, 255))
-    return pal
+    return apply_colors(fusion_base(), _COLORS)
@@ -1,23 +1,28 @@
 from __future__ import annotations
 
-from PySide6 import QtGui, QtWidgets
+from PySide6 import QtGui
+
+from ._base import apply_colors, fusion_base
 
 THEME_NAME = "monokai"
 
+_bg = QtGui.QColor("#272822")
+_base = QtGui.QColor("#1e1f1c")
+_text = QtGui.QColor("#f8f8f2")
+_highlight = QtGui.QColor("#66d9ef")
+
+_COLORS = (
+    (QtGui.QPalette.Window, _bg),
+    (QtGui.QPalette.Base, _base),
+    (QtGui.QPalette.AlternateBase, _bg.darker(110)),
+    (QtGui.QPalette.Text, _text),
+    (QtGui.QPalette.WindowText, _text),
+    (QtGui.QPalette.Button, _bg),
+    (QtGui.QPalette.ButtonText, _text),
+    (QtGui.QPalette.Highlight, _highlight),
+    (QtGui.QPalette.HighlightedText, QtGui.QColor("#000000")),
+)
+
 
 def build_palette() -> QtGui.QPalette:
-    pal = QtWidgets.QStyleFactory.create("Fusion").standardPalette()
-    bg = QtGui.QColor("#272822")
-    base = QtGui.QColor("#1e1f1c")
-    text = QtGui.QColor("#f8f8f2")
-    highlight = QtGui.QColor("#66d9ef")
-    pal.setColor(QtGui.QPalette.Window, bg)
-    pal.setColor(QtGui.QPalette.Base, base)
-    pal.setColor(QtGui.QPalette.AlternateBase, bg.darker(110))
-    pal.setColor(QtGui.QPalette.Text, text)
-    pal.setColor(QtGui.QPalette.WindowText, text)
-    pal.setColor(QtGui.QPalette.Button, bg)
-    pal.setColor(QtGui.QPalette.ButtonText, text)
-    pal.setColor(QtGui.QPalette.Highlight, highlight)
-    pal.setColor(QtGui.QPalette.HighlightedText, QtGui.QColor("#000000"))
-    return pal
+    return apply_colors(fusion_base(), _COLORS)
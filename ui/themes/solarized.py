@@ -1,23 +1,28 @@
 from __future__ import annotations
 
-from PySide6 import QtGui, QtWidgets
+from PySide6 import QtGui
+
+from ._base import apply_colors, fusion_base
 
 THEME_NAME = "solarized"
 
+_base_bg = QtGui.QColor("#fdf6e3")
+_alt_bg = QtGui.QColor("#f5e9d0")
+_text = QtGui.QColor("#586e75")
+_highlight = QtGui.QColor("#268bd2")
+
+_COLORS = (
+    (QtGui.QPalette.Window, _base_bg),
+    (QtGui.QPalette.Base, QtGui.QColor("#fffdf6")),
+    (QtGui.QPalette.AlternateBase, _alt_bg),
+    (QtGui.QPalette.Text, _text),
+    (QtGui.QPalette.WindowText, _text),
+    (QtGui.QPalette.Button, _base_bg),
+    (QtGui.QPalette.ButtonText, _text),
+    (QtGui.QPalette.Highlight, _highlight),
+    (QtGui.QPalette.HighlightedText, QtGui.QColor("#fdf6e3")),
+)
+
 
 def build_palette() -> QtGui.QPalette:
-    pal = QtWidgets.QStyleFactory.create("Fusion").standardPalette()
-    base_bg = QtGui.QColor("#fdf6e3")
-    alt_bg = QtGui.QColor("#f5e9d0")
-    text = QtGui.QColor("#586e75")
-    highlight = QtGui.QColor("#268bd2")
-    pal.setColor(QtGui.QPalette.Window, base_bg)
-    pal.setColor(QtGui.QPalette.Base, QtGui.QColor("#fffdf6"))
-    pal.setColor(QtGui.QPalette.AlternateBase, alt_bg)
-    pal.setColor(QtGui.QPalette.Text, text)
-    pal.setColor(QtGui.QPalette.WindowText, text)
-    pal.setColor(QtGui.QPalette.Button, base_bg)
-    pal.setColor(QtGui.QPalette.ButtonText, text)
-    pal.setColor(QtGui.QPalette.Highlight, highlight)
-    pal.setColor(QtGui.QPalette.HighlightedText, QtGui.QColor("#fdf6e3"))
-    return pal
+    return apply_colors(fusion_base(), _COLORS)
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from typing import Iterable
 
 import requests
+from requests.adapters import HTTPAdapter
 from PySide6 import QtCore
 
 from core.models import Channel
@@ -11,22 +13,41 @@ from core.models import Channel
 # Worker Qt: teste la reachabilitЍ des URLs de chaЪnes (HEAD/GET rapide) via un pool bornЍ.
 
 
-def _probe_url(url: str, timeout_s: float) -> str:
+def _probe_session(pool_size: int) -> requests.Session:
+    """Session partagée par les threads d'un test: connexions keep-alive réutilisées par hôte."""
     session = requests.Session()
-    headers = {"User-Agent": "Mozilla/5.0", "Range": "bytes=0-1023"}
+    session.headers["User-Agent"] = "Mozilla/5.0"
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def _probe_url(url: str, timeout_s: float, session: requests.Session | None = None) -> str:
+    session = session or _probe_session(1)
 
     try:
         r = session.head(url, allow_redirects=True, timeout=(2, 2))
+        r.close()
         if r.status_code < 400:
             return f"OK (HEAD {r.status_code})"
     except Exception:
         pass
 
     try:
-        r = session.get(url, headers=headers, allow_redirects=True, timeout=(timeout_s, timeout_s))
-        if r.status_code < 400:
-            return f"OK (GET {r.status_code})"
-        return f"KO (GET {r.status_code})"
+        # Repli GET en flux + Range: au plus un petit bloc lu, même si le serveur ignore le Range
+        # (manifestes HLS/flux continus jamais téléchargés en entier).
+        with session.get(
+            url,
+            headers={"Range": "bytes=0-1023"},
+            allow_redirects=True,
+            stream=True,
+            timeout=(timeout_s, timeout_s),
+        ) as r:
+            if r.status_code < 400:
+                next(r.iter_content(1024), b"")
+                return f"OK (GET {r.status_code})"
+            return f"KO (GET {r.status_code})"
     except requests.exceptions.Timeout:
         return "KO (timeout)"
     except requests.exceptions.InvalidURL:
@@ -38,7 +59,7 @@ def _probe_url(url: str, timeout_s: float) -> str:
 class ProbeWorker(QtCore.QObject):
     """Runs URL probes in a separate QThread, reporting status per channel row."""
 
-    progress = QtCore.Signal(int, str)  # row, status
+    progress_batch = QtCore.Signal(list)  # [(row, status), ...]
     progress_count = QtCore.Signal(int, int)  # done, total
     finished = QtCore.Signal()
 
@@ -57,7 +78,18 @@ class ProbeWorker(QtCore.QObject):
         """Boucle principale dЌclenchЌe dans un QThread parent."""
         total = len(self.channels)
         done = 0
-
+        # Statuts émis par lots (50 résultats ou 200 ms) plutôt qu'un signal inter-threads par URL.
+        batch: list[tuple[int, str]] = []
+        last_emit = time.monotonic()
+
+        def flush():
+            nonlocal batch, last_emit
+            if batch:
+                self.progress_batch.emit(batch)
+                batch = []
+            last_emit = time.monotonic()
+
+        session = _probe_session(self.max_workers)
         try:
             with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
                 future_map = {}
@@ -67,29 +99,43 @@ class ProbeWorker(QtCore.QObject):
 
                     url = (ch.url or "").strip()
                     if not url:
-                        self.progress.emit(idx, "KO (no url)")
+                        batch.append((idx, "KO (no url)"))
                         continue
 
-                    fut = executor.submit(_probe_url, url, self.timeout_s)
+                    fut = executor.submit(_probe_url, url, self.timeout_s, session)
                     future_map[fut] = idx
 
-                for fut in as_completed(future_map):
+                # ~100 mises à jour du compteur au lieu d'une par URL (signaux inter-threads)
+                pending = len(future_map)
+                step = max(1, pending // 100)
+                # Attente bornée à 200 ms: un lot en attente part même si les sondes restantes sont lentes.
+                not_done = set(future_map)
+                while not_done:
                     if self._stop:
                         executor.shutdown(wait=False, cancel_futures=True)
                         break
-                    idx = future_map[fut]
-                    try:
-                        status = fut.result()
-                    except Exception as e:
-                        status = f"KO ({type(e).__name__})"
-                    self.progress.emit(idx, status)
-                    done += 1
-                    self.progress_count.emit(done, total)
+                    completed, not_done = wait(not_done, timeout=0.2, return_when=FIRST_COMPLETED)
+                    for fut in completed:
+                        idx = future_map[fut]
+                        try:
+                            status = fut.result()
+                        except Exception as e:
+                            status = f"KO ({type(e).__name__})"
+                        batch.append((idx, status))
+                        done += 1
+                        if len(batch) >= 50:
+                            flush()
+                        if done % step == 0 or done == pending:
+                            self.progress_count.emit(done, total)
+                    if time.monotonic() - last_emit >= 0.2:
+                        flush()
 
         except Exception as e:
             try:
-                self.progress.emit(0, f"KO (worker exception: {type(e).__name__})")
+                batch.append((0, f"KO (worker exception: {type(e).__name__})"))
             except Exception:
                 pass
         finally:
+            session.close()
+            flush()
             self.finished.emit()